@@ -0,0 +1,528 @@
+"""词语默写播报器的性能基准测试，无界面运行，声卡输出用按真实时间推进的模拟输出代替。
+
+    python benchmark.py --output results.json
+    python benchmark.py --latency-ms 300 --jitter-ms 100 --failure-rate 0.1 --sizes 10 1000
+    python benchmark.py --only classroom --students 40 --classroom-words 20
+
+测量 edge-tts 合成延迟、首个音频样本耗时、play_words 的间隔精度、词表加载时间，
+以及教室服务器同时应对多个学生端时的吞吐量。
+edge-tts 由本地的 WebSocket 模拟服务代替，延迟、抖动和失败率都可以配置。
+结果以JSON输出，方便对比不同版本。
+"""
+import os
+import sys
+import io
+import re
+import time
+import json
+import random
+import asyncio
+import argparse
+import platform
+import tempfile
+import threading
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+
+import word_announcer as wa
+
+
+WORD_CHARS = "春夏秋冬山水日月花草树木天地风雨云雪江河湖海大小多少上下左右东西南北前后高低长短新旧早晚"
+
+
+def make_words(count, seed=0, prefix=''):
+    """生成 count 个互不相同的2~4字词语"""
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+    while len(words) < count:
+        word = prefix + ''.join(rng.choice(WORD_CHARS) for _ in range(rng.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def summarize(values):
+    """毫秒数列的统计摘要"""
+    if not values:
+        return {'count': 0}
+    data = np.asarray(values, dtype=np.float64)
+    return {
+        'count': len(values),
+        'mean': round(float(data.mean()), 2),
+        'p50': round(float(np.percentile(data, 50)), 2),
+        'p95': round(float(np.percentile(data, 95)), 2),
+        'max': round(float(data.max()), 2),
+    }
+
+
+def strip_info_frame(audio):
+    """去掉开头的ID3标签和Xing/Info信息帧，edge-tts 返回的数据里没有这些"""
+    pos = 0
+    if audio[:3] == b'ID3':
+        size = (audio[6] << 21) | (audio[7] << 14) | (audio[8] << 7) | audio[9]
+        pos = 10 + size + (10 if audio[5] & 0x10 else 0)
+    while pos + 4 <= len(audio) and not wa.mp3_frame_info(audio[pos:pos + 4])[0]:
+        pos += 1
+    length = wa.mp3_frame_info(audio[pos:pos + 4])[0] if pos + 4 <= len(audio) else 0
+    if length and (b'Xing' in audio[pos:pos + length] or b'Info' in audio[pos:pos + length]):
+        pos += length
+    return audio[pos:]
+
+
+class FakeEdgeServer:
+    """本地的 edge-tts 模拟服务：按文本长度生成一段MP3，等待“延迟±抖动”后分块发送，按失败率直接断开连接。
+    协议与 edge-tts 相同，把 edge_tts 的 WSS_URL 指向这里即可。
+    音频格式和分块大小也仿照 edge-tts：24kHz/48kbps 固定码率、没有Info帧，每块几百字节"""
+
+    def __init__(self, latency_ms=150, jitter_ms=50, failure_rate=0.0, chunk_bytes=432, chunk_delay_ms=5, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.chunk_bytes = chunk_bytes
+        self.chunk_delay_ms = chunk_delay_ms
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.failures = 0
+        self._audio = {}  # 字数 -> MP3数据
+        self._loop = None
+        self._runner = None
+        self.url = None
+
+    def audio_for(self, text):
+        """语音的替身：首尾各带0.15秒静音、每个字0.25秒的包络正弦波"""
+        n = len(text)
+        if n not in self._audio:
+            sr = wa.OUTPUT_SAMPLERATE
+            t = np.arange(int(sr * 0.25 * n)) / sr
+            voice = 0.3 * np.sin(2 * np.pi * 220 * t) * np.abs(np.sin(np.pi * 4 * t))
+            silence = np.zeros(int(sr * 0.15))
+            buf = io.BytesIO()
+            # compression_level 0.75 在 24kHz 下对应 48kbps
+            wa.sf.write(buf, np.concatenate([silence, voice, silence]).astype(np.float32), sr, format='MP3',
+                        bitrate_mode='CONSTANT', compression_level=0.75)
+            self._audio[n] = strip_info_frame(buf.getvalue())
+        return self._audio[n]
+
+    async def _handle(self, request):
+        from aiohttp import web, WSMsgType
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        ssml = None
+        async for msg in ws:
+            if msg.type == WSMsgType.TEXT and 'Path:ssml' in msg.data:
+                ssml = msg.data
+                break
+        if ssml is None:
+            return ws
+        self.requests += 1
+        request_id = re.search(r'X-RequestId:(\w+)', ssml).group(1)
+        text = re.search(r'<prosody[^>]*>(.*?)</prosody>', ssml, re.S).group(1).strip()
+        delay = max(self.rng.gauss(self.latency_ms, self.jitter_ms), 0) / 1000
+        failed = self.rng.random() < self.failure_rate
+        await asyncio.sleep(delay)
+        if failed:
+            self.failures += 1
+            await ws.close()
+            return ws
+        await ws.send_str(f"X-RequestId:{request_id}\r\nContent-Type:application/json; charset=utf-8\r\n"
+                          f"Path:turn.start\r\n\r\n{{}}")
+        header = f"X-RequestId:{request_id}\r\nContent-Type:audio/mpeg\r\nPath:audio\r\n".encode()
+        audio = self.audio_for(text)
+        for start in range(0, len(audio), self.chunk_bytes):
+            await ws.send_bytes(len(header).to_bytes(2, 'big') + header + audio[start:start + self.chunk_bytes])
+            await asyncio.sleep(self.chunk_delay_ms / 1000)
+        await ws.send_str(f"X-RequestId:{request_id}\r\nContent-Type:application/json; charset=utf-8\r\n"
+                          f"Path:turn.end\r\n\r\n{{}}")
+        await ws.close()
+        return ws
+
+    def start(self):
+        """在后台线程启动服务，并让 edge_tts 连接到这里"""
+        from aiohttp import web
+        import edge_tts.communicate
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            app = web.Application()
+            app.router.add_get('/edge/v1', self._handle)
+            self._runner = web.AppRunner(app)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, '127.0.0.1', 0)
+            self._loop.run_until_complete(site.start())
+            port = site._server.sockets[0].getsockname()[1]
+            self.url = f"ws://127.0.0.1:{port}/edge/v1?TrustedClientToken=benchmark"
+            ready.set()
+            self._loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        ready.wait()
+        edge_tts.communicate.WSS_URL = self.url
+        return self.url
+
+    def stop(self):
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class HeadlessAudioOutput(wa.AudioOutput):
+    """不打开声卡：后台线程按真实时间每20ms调用一次回调，并记录每段语音开始和结束的时刻"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handles = []
+        self.finished_at = {}  # id(handle) -> perf_counter
+        self._running = False
+
+    def _open(self):
+        self.stream = self
+        self.latency = 0.0
+        self._running = True
+        threading.Thread(target=self._clock, daemon=True).start()
+
+    def _clock(self):
+        block = np.zeros((self.blocksize, 1), dtype=np.float32)
+        period = self.blocksize / self.samplerate
+        deadline = time.perf_counter()
+        while self._running:
+            self._callback(block, self.blocksize, None, None)
+            now = time.perf_counter()
+            for handle in self.handles:
+                if handle.finished.is_set() and id(handle) not in self.finished_at:
+                    self.finished_at[id(handle)] = now
+            deadline += period
+            time.sleep(max(deadline - time.perf_counter(), 0))
+
+    def submit(self, handle):
+        self.handles.append(handle)
+        return super().submit(handle)
+
+    def close(self):
+        self.stop_all()
+        self._running = False
+        self.stream = None
+
+    def spans(self):
+        """真正出过声的语音的 (开始, 结束) 时刻"""
+        return [(h.started_at, self.finished_at[id(h)]) for h in self.handles
+                if h.started_at is not None and not h.cancelled and id(h) in self.finished_at]
+
+
+def bench_synthesis(words, timeout):
+    """逐个合成（不命中缓存）的延迟、并发合成的总耗时，以及命中缓存时的延迟"""
+    cache = wa.AudioCache(tempfile.mkdtemp(prefix='bench_cache_'))
+    service = wa.SynthesisService(cache, wa.BackendHealth(), timeout=timeout)
+    sequential, cached = [], []
+    failures = 0
+    for word in words:
+        start = time.perf_counter()
+        try:
+            service.synthesize_edge(word).result()
+            sequential.append((time.perf_counter() - start) * 1000)
+        except Exception:
+            failures += 1
+    for word in words:
+        start = time.perf_counter()
+        try:
+            service.synthesize_edge(word).result()
+            cached.append((time.perf_counter() - start) * 1000)
+        except Exception:
+            pass
+    batch = make_words(len(words), seed=1, prefix='并')
+    start = time.perf_counter()
+    futures = [service.synthesize_edge(word) for word in batch]
+    batch_failures = 0
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            batch_failures += 1
+    batch_ms = (time.perf_counter() - start) * 1000
+    service.close()
+    return {
+        'uncached_ms': summarize(sequential),
+        'cached_ms': summarize(cached),
+        'failures': failures,
+        'concurrent_batch': {'words': len(batch), 'total_ms': round(batch_ms, 2), 'failures': batch_failures},
+    }
+
+
+def bench_ttfa(words, timeout):
+    """边下边播时，从发出请求到解码出第一段可播放音频的耗时（不含声卡输出延迟），
+    以及作为对照的整段下载并解码完的耗时"""
+    cache = wa.AudioCache(tempfile.mkdtemp(prefix='bench_cache_'))
+    service = wa.SynthesisService(cache, wa.BackendHealth(), timeout=timeout)
+    results = []
+    full = []
+    chunks = []
+    failures = 0
+    for word in words:
+        decoder = wa.Mp3StreamDecoder()
+        received = []
+        first = []
+        start = time.perf_counter()
+
+        def on_chunk(chunk):
+            received.append(len(chunk))
+            if first:
+                return
+            decoder.feed(chunk)
+            block = decoder.decode(min_frames=wa.STREAM_START_FRAMES)
+            if block is not None and len(block):
+                first.append(time.perf_counter())
+
+        try:
+            audio_data = service.stream_edge(word, on_chunk).result()
+            wa.sf.read(io.BytesIO(audio_data), dtype='float32')
+        except Exception:
+            failures += 1
+            continue
+        full.append((time.perf_counter() - start) * 1000)
+        chunks.append(len(received))
+        if first:
+            results.append((first[0] - start) * 1000)
+    service.close()
+    return {
+        'ttfa_ms': summarize(results),
+        'full_synthesis_ms': summarize(full),
+        'chunks_per_word': round(sum(chunks) / len(chunks), 1) if chunks else 0,
+        'failures': failures,
+    }
+
+
+def expected_gaps(words, interval, repeat_interval):
+    """按 session_steps 算出相邻两段语音之间应有的间隔(毫秒)"""
+    gaps = []
+    pending = None
+    for kind, value, _ in wa.session_steps(words, interval, repeat_interval):
+        if kind in ('pause', 'countdown'):
+            pending = (pending or 0) + value
+        else:
+            if pending is not None:
+                gaps.append(pending * 1000)
+            pending = 0
+    return gaps
+
+
+def bench_session(words, interval, repeat_interval, intro_gap, time_limit):
+    """用模拟声卡跑一轮完整的 play_words，比较实际间隔和设定间隔的误差"""
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv)
+    wa.INTRO_GAP = intro_gap
+    wa.AudioOutput = HeadlessAudioOutput
+    window = wa.WordAnnouncer()
+    window.interval_input.setText(str(interval))
+    window.repeat_interval_input.setText(str(repeat_interval))
+    window.word_list.set_words(words)
+    output = window.audio_output
+    output.open()
+    start = time.perf_counter()
+    window.on_start()
+    while window.is_playing and time.perf_counter() - start < time_limit:
+        app.processEvents()
+        time.sleep(0.002)
+    completed = not window.is_playing
+    window.close()
+    spans = output.spans()
+    expected = expected_gaps(words, interval, repeat_interval)
+    actual = [(spans[i + 1][0] - spans[i][1]) * 1000 for i in range(len(spans) - 1)]
+    errors = [a - e for a, e in zip(actual, expected)]
+    return {
+        'completed': completed,
+        'utterances': len(spans),
+        'expected_utterances': len(expected) + 1,
+        'gap_error_ms': summarize(errors),
+        'gap_abs_error_ms': summarize([abs(e) for e in errors]),
+        'session_s': round(time.perf_counter() - start, 3),
+    }
+
+
+def bench_classroom(students, words, upstream, timeout):
+    """在本机启动教室服务器，模拟多个学生端同时按各自的顺序请求同一课的词语：
+    第一轮服务器缓存为空，第二轮全部命中缓存。同一个词应只向 edge-tts 请求一次"""
+    import urllib.request
+    from urllib.parse import quote
+    from concurrent.futures import ThreadPoolExecutor
+    folder = tempfile.mkdtemp(prefix='bench_classroom_')
+    cache = wa.AudioCache(os.path.join(folder, 'tts_cache'))
+    bank = wa.WordBank(os.path.join(folder, 'bank.sqlite3'))
+    bank.import_lessons('benchmark', 'benchmark', {'第1课': words})
+    synthesis = wa.SynthesisService(cache, wa.BackendHealth(), max_concurrency=8, timeout=timeout)
+    classroom = wa.ClassroomServer(bank, cache, synthesis, wa.OfflineTTSWorker(cache))
+    httpd = classroom.make_server('127.0.0.1', 0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    def student(seed):
+        order = list(words)
+        random.Random(seed).shuffle(order)
+        latencies, failures = [], 0
+        with urllib.request.urlopen(base + '/lessons', timeout=timeout) as response:
+            response.read()
+        for word in order:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(f"{base}/audio?text={quote(word)}", timeout=timeout) as response:
+                    response.read()
+                latencies.append((time.perf_counter() - start) * 1000)
+            except Exception:
+                failures += 1
+        return latencies, failures
+
+    def run_round(seed):
+        requests_before = upstream.requests
+        start = time.perf_counter()
+        with ThreadPoolExecutor(students) as pool:
+            results = list(pool.map(student, range(seed, seed + students)))
+        elapsed = time.perf_counter() - start
+        latencies = [ms for result, _ in results for ms in result]
+        return {
+            'requests': students * len(words),
+            'failures': sum(failures for _, failures in results),
+            'elapsed_s': round(elapsed, 3),
+            'throughput_rps': round(len(latencies) / elapsed, 1),
+            'latency_ms': summarize(latencies),
+            'upstream_requests': upstream.requests - requests_before,
+        }
+
+    try:
+        cold = run_round(0)
+        warm = run_round(students)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        classroom.close()
+        bank.close()
+    return {'students': students, 'words': len(words), 'cold': cold, 'warm': warm,
+            'server_stats': classroom.snapshot()}
+
+
+def write_workbook(path, words, per_lesson=20):
+    """按“第一行课名、每列一课”的格式写出词表"""
+    lessons = [words[i:i + per_lesson] for i in range(0, len(words), per_lesson)]
+    names = [f"第{i + 1}课" for i in range(len(lessons))]
+    rows = [names] + [[lesson[r] if r < len(lesson) else None for lesson in lessons]
+                      for r in range(max(map(len, lessons)))]
+    if path.endswith('.xlsx'):
+        import openpyxl
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet()
+        for row in rows:
+            ws.append(row)
+        wb.save(path)
+    else:
+        import csv
+        with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+            csv.writer(f).writerows([[cell or '' for cell in row] for row in rows])
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, round((time.perf_counter() - start) * 1000, 2)
+
+
+def bench_workbooks(sizes):
+    """不同规模词表的解析、旁路缓存和词库导入耗时"""
+    results = []
+    folder = tempfile.mkdtemp(prefix='bench_words_')
+    for size in sizes:
+        words = make_words(size, seed=size)
+        for ext in ('.xlsx', '.csv'):
+            path = os.path.join(folder, f"words_{size}{ext}")
+            write_workbook(path, words)
+            lesson_cache = wa.LessonCache(os.path.join(folder, 'lesson_cache'))
+            bank = wa.WordBank(os.path.join(folder, f"bank_{size}{ext}.sqlite3"), lesson_cache.load)
+            lessons, parse_ms = _timed(wa.read_lessons, path)
+            _, cache_cold_ms = _timed(lesson_cache.load, path)
+            _, cache_warm_ms = _timed(lesson_cache.load, path)
+            _, import_ms = _timed(bank.import_file, path)
+            _, reimport_ms = _timed(bank.import_file, path)
+            bank.close()
+            results.append({
+                'words': size,
+                'format': ext[1:],
+                'lessons': len(lessons),
+                'parse_ms': parse_ms,
+                'lesson_cache_cold_ms': cache_cold_ms,
+                'lesson_cache_warm_ms': cache_warm_ms,
+                'word_bank_import_ms': import_ms,
+                'word_bank_reimport_ms': reimport_ms,
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="词语默写播报器性能基准测试")
+    parser.add_argument('--output', help="结果写入的JSON文件，默认打印到标准输出")
+    parser.add_argument('--only', nargs='+', choices=('synthesis', 'ttfa', 'session', 'workbooks', 'classroom'),
+                        help="只运行指定的项目")
+    parser.add_argument('--latency-ms', type=float, default=150, help="模拟服务的首包延迟")
+    parser.add_argument('--jitter-ms', type=float, default=50, help="首包延迟的标准差")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="请求失败的概率")
+    parser.add_argument('--words', type=int, default=30, help="合成测试的词数")
+    parser.add_argument('--session-words', type=int, default=5, help="播报测试的词数")
+    parser.add_argument('--interval', type=float, default=0.5, help="播报测试的下一词间隔(秒)")
+    parser.add_argument('--repeat-interval', type=float, default=0.3, help="播报测试的重复间隔(秒)")
+    parser.add_argument('--intro-gap', type=float, default=0.3, help="播报测试中开始提示后的间隔(秒)")
+    parser.add_argument('--students', type=int, default=40, help="教室服务器测试的学生端数")
+    parser.add_argument('--classroom-words', type=int, default=20, help="教室服务器测试的词数")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000], help="词表规模")
+    parser.add_argument('--timeout', type=float, default=10.0, help="单个合成请求的超时(秒)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    only = set(args.only or ('synthesis', 'ttfa', 'session', 'workbooks', 'classroom'))
+    output = os.path.abspath(args.output) if args.output else None
+
+    # 缓存和词库放在临时目录，不影响正常使用的数据
+    workdir = tempfile.mkdtemp(prefix='bench_')
+    os.environ['LOCALAPPDATA'] = workdir
+    os.chdir(workdir)
+
+    server = FakeEdgeServer(args.latency_ms, args.jitter_ms, args.failure_rate, seed=args.seed)
+    results = {
+        'config': vars(args),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+        },
+    }
+    if only & {'synthesis', 'ttfa', 'session', 'classroom'}:
+        server.start()
+    try:
+        if 'synthesis' in only:
+            results['synthesis'] = bench_synthesis(make_words(args.words, args.seed, '合'), args.timeout)
+        if 'ttfa' in only:
+            results['ttfa'] = bench_ttfa(make_words(args.words, args.seed, '流'), args.timeout)
+        if 'session' in only:
+            words = make_words(args.session_words, args.seed, '播')
+            per_word = 2 * (args.repeat_interval + 1.5) + args.interval
+            results['session'] = bench_session(words, args.interval, args.repeat_interval, args.intro_gap,
+                                               time_limit=30 + per_word * len(words))
+        if 'workbooks' in only:
+            results['workbooks'] = bench_workbooks(args.sizes)
+        if 'classroom' in only:
+            results['classroom'] = bench_classroom(args.students, make_words(args.classroom_words, args.seed, '班'),
+                                                   server, args.timeout)
+    finally:
+        results['server'] = {'requests': server.requests, 'failures': server.failures}
+        server.stop()
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,7 +2,8 @@
 REM ===== Nuitka 打包脚本 =====
 REM 需先激活好 Python 环境并安装好 Nuitka、PySide6、edge-tts、pyttsx3 等依赖
 REM 自动生成的ico文件名为 app_icon_auto.ico
+REM numpy/sounddevice/soundfile 在程序中按需导入，需显式打包
 
-python -m nuitka --onefile --windows-console-mode=disable --windows-icon-from-ico=app_icon_auto.ico --enable-plugin=pyside6 --include-qt-plugins=all word_announcer.py
+python -m nuitka --onefile --windows-console-mode=disable --windows-icon-from-ico=app_icon_auto.ico --include-data-files=app_icon_auto.ico=app_icon_auto.ico --include-package=numpy --include-module=sounddevice --include-module=soundfile --enable-plugin=pyside6 --include-qt-plugins=all word_announcer.py
 
 pause 
\ No newline at end of file
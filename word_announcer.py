@@ -1,152 +1,2749 @@
+import time
+_IMPORT_START = time.perf_counter()  # 用于 --startup-profile 统计模块导入耗时
 import sys
+import math
+import asyncio
 import threading
-import time
 import re
+import importlib
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QLineEdit, QComboBox, QFileDialog, QSlider
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QComboBox, QFileDialog, QSlider, QCheckBox,
+    QListView, QAbstractItemView
 )
-from PySide6.QtGui import QIcon, QTextCursor, QTextCharFormat, QColor, QFont, QPainter, QPen
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt, QTimer, Signal, QBuffer, QByteArray, QIODevice
-import pygame
+from PySide6.QtGui import QIcon, QColor, QFont, QPainter, QPen, QPixmap
+from PySide6.QtCore import Qt, QTimer, Signal, QFileSystemWatcher, QAbstractListModel, QModelIndex
 import os
 import uuid
-from PIL import Image
-import base64
-import pandas as pd
-import qdarkstyle
-from PySide6.QtGui import QImageReader
-import sounddevice as sd
-import soundfile as sf
 import io
+import queue
+import hashlib
+import tempfile
+import codecs
+import csv
+import json
+import sqlite3
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, InvalidStateError, ThreadPoolExecutor
+
+class LazyModule:
+    """首次访问属性时才导入的模块代理，重型依赖不再拖慢启动"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+
+np = LazyModule('numpy')
+sd = LazyModule('sounddevice')
+sf = LazyModule('soundfile')
+
+WORDLIST_EXTENSIONS = ('.xlsx', '.xls', '.csv', '.txt')  # 支持的词表文件
+WATCH_DEBOUNCE_MS = 800  # 文件变化后等保存完成再重新加载
+STARTUP_BUDGET_MS = 1500  # 从启动到窗口显示的时间预算
+
+
+class StartupProfiler:
+    """记录启动各阶段耗时，用于 --startup-profile"""
+
+    def __init__(self, start):
+        self.start = start
+        self.last = start
+        self.phases = []
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000))
+        self.last = now
+
+    def report(self, budget_ms=STARTUP_BUDGET_MS):
+        """打印各阶段耗时，返回是否在预算内"""
+        total = (self.last - self.start) * 1000
+        print("启动耗时分析:")
+        for name, ms in self.phases:
+            print(f"  {name:<12}{ms:8.1f} ms")
+        ok = total <= budget_ms
+        print(f"  {'合计':<12}{total:8.1f} ms（预算 {budget_ms} ms，{'达标' if ok else '超出'}）")
+        return ok
+
+
+def ensure_ico_from_png(png_path, ico_path, size=(256, 256)):
+    """如果ico文件不存在，则从png生成指定尺寸的ico文件"""
+    if not os.path.exists(ico_path):
+        from PIL import Image
+        img = Image.open(png_path).convert('RGBA')
+        img = img.resize(size, Image.LANCZOS)
+        img.save(ico_path, format='ICO')
+
+def resource_path(name):
+    """程序自带资源文件的路径（Nuitka 打包后位于解压目录）"""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+
+def get_embedded_icon():
+    # 图标随程序一起发布(app_icon_auto.ico)，由 Qt 按需解码，启动时不再做 base64 解码
+    return QIcon(resource_path('app_icon_auto.ico'))
+
+EDGE_VOICE = "zh-CN-XiaoxiaoNeural"
+EDGE_RATE = "-30%"  # 语速调慢，越负越慢，可根据需要调整
+PYTTSX3_RATE = 130  # pyttsx3 语速，数值越小越慢，100~150较为自然
+PREFETCH_DEPTH = 2  # 播放当前词时提前合成后面几个词
+WARMUP_CONCURRENCY = 4  # 批量预合成时同时进行的请求数（与合成服务的并发上限相同）
+OUTPUT_SAMPLERATE = 24000  # 统一的播放采样率（edge-tts 输出即为24kHz单声道）
+CLIP_SUFFIX = '.clip'  # 缓存文件保存原始编码数据（edge为mp3，pyttsx3为wav）
+HEDGE_BUDGET_MS = 1200  # 限时模式：edge-tts 超过这个时间还没返回就同时启动离线合成
+EDGE_FAILURE_THRESHOLD = 3  # edge-tts 连续失败几次后熔断，直接使用离线引擎
+PROBE_DELAYS = (5, 10, 20, 40, 80, 120)  # 熔断后重新探测 edge-tts 的退避间隔(秒)
+PROBE_TEXT = "你好"
+INTRO_GAP = 2.0  # “准备开始”播完后到第一个词的间隔(秒)
+STREAM_START_FRAMES = 8  # 边下边播：攒够多少个MP3帧(每帧约24ms)后开始出声
+STRETCH_FRAME = 960  # 变速处理的帧长(40ms)
+STRETCH_TOLERANCE = 240  # 变速时每帧对齐的搜索范围(±10ms)
+SPEED_CHOICES = (50, 150)  # 播放语速范围(%)，在合成好的语音上本地变速，不需要重新合成
+SILENCE_DB = -40  # 比最响的10ms帧低这么多分贝算静音
+SILENCE_FLOOR = 0.005  # 约 -46 dBFS，低于它一律算静音
+TRIM_PADDING_MS = 30  # 裁剪静音后首尾各保留的余量
+TARGET_LEVEL_DB = -20  # 统一后的有声部分RMS响度(dBFS)
+MAX_GAIN = 10.0  # 最多放大20dB，避免把噪声放大
+POSTPROCESS_VERSION = 1  # 后处理参数变化时加一，旧的处理结果会被重新生成
+PROCESSED_SUFFIX = f'.v{POSTPROCESS_VERSION}.pcm'  # 缓存旁边保存后处理过的 float32 PCM
+VOICE_PACK_MAGIC = b'WAPACK01'  # 语音包文件头
+VOICE_PACK_SUFFIX = '.wpack'
+VOICE_PACK_ALIGN = 64  # 每段语音按64字节对齐，映射后可以直接当 float32 数组使用
+SERVER_PORT = 8765  # 教室服务器的默认端口
+SERVER_AUDIO_TYPES = {'edge': 'audio/mpeg', 'pyttsx3': 'audio/wav'}  # 服务器返回的原始编码数据类型
+
+
+def get_app_data_dir():
+    """应用数据目录（语音缓存等），Windows 下位于 %LOCALAPPDATA%"""
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    path = os.path.join(base, 'student_dictation')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def make_cache_key(engine, voice, rate, text):
+    """按 (引擎, 音色, 语速, 文本) 生成内容寻址的缓存键"""
+    raw = '\x1f'.join((engine, voice, str(rate), text))
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def edge_cache_key(text):
+    return make_cache_key('edge', EDGE_VOICE, EDGE_RATE, text)
+
+
+def to_clip(data, samplerate):
+    """转换为播放用的 float32 单声道、OUTPUT_SAMPLERATE 采样率数组"""
+    data = np.asarray(data, dtype=np.float32)
+    if data.ndim == 2:
+        data = data.mean(axis=1, dtype=np.float32)
+    if samplerate != OUTPUT_SAMPLERATE and len(data) > 1:
+        # 线性插值重采样，对语音足够
+        n = int(round(len(data) * OUTPUT_SAMPLERATE / samplerate))
+        positions = np.linspace(0, len(data) - 1, n)
+        data = np.interp(positions, np.arange(len(data)), data).astype(np.float32)
+    return np.ascontiguousarray(data)
+
+
+def decode_audio(audio_bytes):
+    """把编码后的音频(mp3/wav/aiff)解码为播放用的 clip"""
+    data, samplerate = sf.read(io.BytesIO(audio_bytes), dtype='float32')
+    return to_clip(data, samplerate)
+
+
+def time_stretch(clip, speed, frame=STRETCH_FRAME, tolerance=STRETCH_TOLERANCE):
+    """WSOLA 变速不变调：按 speed 倍速播放（>1 更快），音高不变。
+    每一帧在容差范围内找与上一帧自然延续最相似的位置，再用汉宁窗叠加"""
+    if abs(speed - 1.0) < 0.01 or len(clip) < frame:
+        return clip
+    hop_out = frame // 2
+    hop_in = hop_out * speed
+    window = np.hanning(frame + 1)[:-1].astype(np.float32)  # 50%重叠时各帧窗口之和恒为1
+    x = np.concatenate([np.zeros(tolerance, np.float32), clip, np.zeros(frame + tolerance, np.float32)])
+    out_len = int(len(clip) / speed)
+    n_frames = out_len // hop_out + 1
+    out = np.zeros(n_frames * hop_out + frame, np.float32)
+    weight = np.zeros_like(out)
+    prev = tolerance
+    for k in range(n_frames):
+        center = tolerance + int(round(k * hop_in))
+        if k == 0:
+            pos = center
+        else:
+            template = x[prev + hop_out:prev + hop_out + frame]
+            low = max(center - tolerance, 0)
+            region = x[low:center + tolerance + frame]
+            if len(template) < frame or len(region) < frame:
+                break
+            pos = low + int(np.argmax(np.correlate(region, template, 'valid')))
+        segment = x[pos:pos + frame]
+        if len(segment) < frame:
+            break
+        start = k * hop_out
+        out[start:start + frame] += segment * window
+        weight[start:start + frame] += window
+        prev = pos
+    out = np.divide(out, weight, out=out, where=weight > 1e-3)
+    return np.ascontiguousarray(out[:out_len])
+
+
+def postprocess_clip(clip):
+    """去掉首尾静音并统一响度：按10ms分帧算RMS，响度以有声帧的RMS为准，同时保证不削波"""
+    frame = OUTPUT_SAMPLERATE // 100
+    n = len(clip) // frame
+    if n == 0:
+        return clip
+    rms = np.sqrt(np.mean(np.square(clip[:n * frame].reshape(n, frame)), axis=1))
+    voiced = rms > max(rms.max() * 10 ** (SILENCE_DB / 20), SILENCE_FLOOR)
+    if not voiced.any():
+        return clip
+    voiced_frames = np.flatnonzero(voiced)
+    pad = TRIM_PADDING_MS // 10
+    start = max(voiced_frames[0] - pad, 0) * frame
+    end = min((voiced_frames[-1] + 1 + pad) * frame, len(clip))
+    out = clip[start:end].astype(np.float32)  # 复制一份，不改动原数组
+    level = np.sqrt(np.mean(np.square(rms[voiced])))
+    peak = max(float(np.abs(out).max()), 1e-6)
+    out *= min(10 ** (TARGET_LEVEL_DB / 20) / level, 0.95 / peak, MAX_GAIN)
+    # 裁剪处加短淡入淡出，避免爆音
+    fade = min(OUTPUT_SAMPLERATE * 5 // 1000, len(out) // 2)
+    if fade:
+        ramp = np.linspace(0.0, 1.0, fade, dtype=np.float32)
+        out[:fade] *= ramp
+        out[-fade:] *= ramp[::-1]
+    return out
+
+
+def leading_silence(clip):
+    """clip 开头静音的样本数（全是静音时返回 len(clip)），边下边播时用来跳过开头的静音"""
+    loud = np.flatnonzero(np.abs(clip) > SILENCE_FLOOR)
+    if not len(loud):
+        return len(clip)
+    return max(int(loud[0]) - OUTPUT_SAMPLERATE * TRIM_PADDING_MS // 1000, 0)
+
+
+class AudioCache:
+    """语音缓存：磁盘上按总大小做LRU淘汰，内存中保留少量已解码的热数据。
+    原始编码数据旁边另存一份后处理（process）过的PCM，以后读取时不用再解码和处理"""
+
+    def __init__(self, cache_dir, max_bytes=200 * 1024 * 1024, hot_items=64, process=postprocess_clip):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hot_items = hot_items
+        self.process = process
+        self.lock = threading.Lock()
+        self._hot = OrderedDict()    # key -> 处理后的 clip
+        self._index = OrderedDict()  # key -> 文件字节数（含处理结果），越靠后越新
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._scan()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + CLIP_SUFFIX)
+
+    def _processed_path(self, key):
+        return os.path.join(self.cache_dir, key + PROCESSED_SUFFIX)
+
+    def _scan(self):
+        """启动时按修改时间重建LRU索引（访问时会刷新文件修改时间），顺便删除旧版本的处理结果，
+        以及没有对应原始语音的处理结果（写入原始语音前失败或程序中途退出时留下的）"""
+        entries = []
+        processed = {}
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name.endswith('.pcm'):
+                if name.endswith(PROCESSED_SUFFIX):
+                    try:
+                        processed[name[:-len(PROCESSED_SUFFIX)]] = os.path.getsize(path)
+                    except OSError:
+                        pass
+                else:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                continue
+            if not name.endswith(CLIP_SUFFIX):
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, name[:-len(CLIP_SUFFIX)], st.st_size))
+        for _, key, size in sorted(entries):
+            size += processed.pop(key, 0)
+            self._index[key] = size
+            self._total_bytes += size
+        for key in processed:
+            try:
+                os.remove(self._processed_path(key))
+            except OSError:
+                pass
+
+    def _touch(self, key):
+        self._index.move_to_end(key)
+        try:
+            os.utime(self._path(key), None)
+        except OSError:
+            pass
+
+    def _remember(self, key, clip):
+        self._hot[key] = clip
+        self._hot.move_to_end(key)
+        while len(self._hot) > self.hot_items:
+            self._hot.popitem(last=False)
+
+    def _remove_files(self, key):
+        for path in (self._path(key), self._processed_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            key, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            self._hot.pop(key, None)
+            self._remove_files(key)
+
+    def _write(self, path, data):
+        """先写临时文件再替换，返回是否成功"""
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            print(f"写入语音缓存失败: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def _prepare(self, key, audio_bytes):
+        """解码并后处理，处理结果写到缓存旁边；返回 (clip, 写入的字节数)"""
+        clip = decode_audio(audio_bytes)
+        if self.process is None:
+            return clip, 0
+        clip = np.ascontiguousarray(self.process(clip), dtype=np.float32)
+        data = clip.astype('<f4').tobytes()
+        return clip, len(data) if self._write(self._processed_path(key), data) else 0
+
+    def contains(self, key):
+        with self.lock:
+            return key in self._hot or key in self._index
+
+    def get(self, key):
+        """命中时返回处理后的 clip，未命中返回 None"""
+        with self.lock:
+            clip = self._hot.get(key)
+            if clip is not None:
+                self._hot.move_to_end(key)
+                if key in self._index:
+                    self._touch(key)
+                return clip
+            if key not in self._index:
+                return None
+            self._touch(key)
+        clip = None
+        if self.process is not None:
+            try:
+                clip = np.fromfile(self._processed_path(key), dtype='<f4').astype(np.float32, copy=False)
+            except (OSError, ValueError):
+                clip = None
+        if clip is None:
+            # 没有处理结果（旧缓存或参数已更新），解码原始数据重新处理一次
+            try:
+                with open(self._path(key), 'rb') as f:
+                    clip, added = self._prepare(key, f.read())
+            except Exception as e:
+                print(f"读取语音缓存失败: {e}")
+                self.discard(key)
+                return None
+            with self.lock:
+                if key in self._index:
+                    self._index[key] += added
+                    self._total_bytes += added
+        with self.lock:
+            self._remember(key, clip)
+        return clip
+
+    def read(self, key):
+        """命中时返回原始编码数据（教室服务器直接转发给学生端），未命中返回 None"""
+        with self.lock:
+            if key not in self._index:
+                return None
+            self._touch(key)
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            self.discard(key)
+            return None
+
+    def put(self, key, audio_bytes):
+        """写入编码后的音频，返回处理后的 clip"""
+        clip, processed_bytes = self._prepare(key, audio_bytes)
+        if not self._write(self._path(key), audio_bytes):
+            with self.lock:
+                self._remember(key, clip)
+            return clip
+        size = len(audio_bytes) + processed_bytes
+        with self.lock:
+            self._total_bytes -= self._index.pop(key, 0)
+            self._index[key] = size
+            self._total_bytes += size
+            self._remember(key, clip)
+            self._evict()
+        return clip
+
+    def discard(self, key):
+        with self.lock:
+            self._hot.pop(key, None)
+            self._total_bytes -= self._index.pop(key, 0)
+        self._remove_files(key)
+
+
+def _align(n, align=VOICE_PACK_ALIGN):
+    return -(-n // align) * align
+
+
+def write_voice_pack(path, clips, meta=None):
+    """把 {文本: clip} 写成一个语音包：魔数、4字节头长度、JSON索引，之后是对齐的 float32 PCM。
+    索引里每段语音记为 [相对数据区的偏移, 采样数]"""
+    index = {}
+    offset = 0
+    for text, clip in clips.items():
+        index[text] = [offset, len(clip)]
+        offset += _align(len(clip) * 4)
+    header = dict(meta or {}, version=1, samplerate=OUTPUT_SAMPLERATE, dtype='<f4', clips=index)
+    header = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    data_start = _align(len(VOICE_PACK_MAGIC) + 4 + len(header))
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(VOICE_PACK_MAGIC)
+            f.write(len(header).to_bytes(4, 'little'))
+            f.write(header)
+            f.write(bytes(data_start - f.tell()))
+            for clip in clips.values():
+                data = np.ascontiguousarray(clip, dtype='<f4').tobytes()
+                f.write(data)
+                f.write(bytes(_align(len(data)) - len(data)))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+class VoicePack:
+    """只读打开的语音包。整个文件映射到内存，get 返回的 clip 就是映射区上的视图：
+    不用逐个打开文件，也不解码、不拷贝，播放时声卡回调直接从映射区读取"""
+
+    def __init__(self, path):
+        import mmap
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic_end = len(VOICE_PACK_MAGIC)
+            if self._mmap[:magic_end] != VOICE_PACK_MAGIC:
+                raise ValueError("不是语音包文件")
+            header_len = int.from_bytes(self._mmap[magic_end:magic_end + 4], 'little')
+            header = json.loads(self._mmap[magic_end + 4:magic_end + 4 + header_len].decode('utf-8'))
+            if header.get('dtype') != '<f4' or header.get('samplerate') != OUTPUT_SAMPLERATE:
+                raise ValueError(f"不支持的语音包格式: {header.get('dtype')} {header.get('samplerate')}Hz")
+            self.header = header
+            self.index = header['clips']
+            self._data_start = _align(magic_end + 4 + header_len)
+            end = max((self._data_start + offset + frames * 4 for offset, frames in self.index.values()), default=0)
+            if end > len(self._mmap):
+                raise ValueError("语音包文件不完整")
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def __contains__(self, text):
+        return text in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def get(self, text):
+        """语音包中有这个词时返回只读的 clip 视图，否则返回 None"""
+        entry = self.index.get(text)
+        if entry is None:
+            return None
+        offset, frames = entry
+        return np.frombuffer(self._mmap, dtype='<f4', count=frames, offset=self._data_start + offset)
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # 还有正在播放的视图，等它们释放后由垃圾回收关闭
+
+
+_MP3_BITRATES_V1 = (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320)
+_MP3_BITRATES_V2 = (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+_MP3_SAMPLERATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def mp3_frame_info(header):
+    """解析4字节MPEG Layer III帧头，返回 (帧字节数, 每帧采样数)，不是合法帧头时返回 (0, 0)"""
+    if header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return 0, 0
+    version = (header[1] >> 3) & 3  # 3: MPEG1, 2: MPEG2, 0: MPEG2.5
+    layer = (header[1] >> 1) & 3    # 1: Layer III
+    bitrate_idx = header[2] >> 4
+    samplerate_idx = (header[2] >> 2) & 3
+    padding = (header[2] >> 1) & 1
+    if version == 1 or layer != 1 or bitrate_idx in (0, 15) or samplerate_idx == 3:
+        return 0, 0
+    samplerate = _MP3_SAMPLERATES[version][samplerate_idx]
+    if version == 3:
+        return 144 * _MP3_BITRATES_V1[bitrate_idx] * 1000 // samplerate + padding, 1152
+    return 72 * _MP3_BITRATES_V2[bitrate_idx] * 1000 // samplerate + padding, 576
+
+
+class Mp3StreamDecoder:
+    """把陆续到达的MP3数据按帧边界切段解码，用于边下载边播放"""
+
+    # 从中途切段时多解码几帧，恢复比特池(最多回溯511字节)和重叠数据，这几帧的输出直接丢弃
+    WARMUP_FRAMES = 8
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._frames = []  # 每个完整帧的 (起始偏移, 字节数)
+        self._scan_pos = 0
+        self._decoded = 0  # 已经输出过的帧数
+        self.samples_per_frame = 576
+        self.samplerate = None
+
+    def feed(self, data):
+        self._buf += data
+        self._scan()
+
+    def _scan(self):
+        buf = self._buf
+        pos = self._scan_pos
+        if pos == 0 and buf[:3] == b'ID3':
+            # 跳过ID3v2标签
+            if len(buf) < 10:
+                return
+            size = (buf[6] << 21) | (buf[7] << 14) | (buf[8] << 7) | buf[9]
+            pos = 10 + size + (10 if buf[5] & 0x10 else 0)
+        while pos + 4 <= len(buf):
+            length, samples = mp3_frame_info(buf[pos:pos + 4])
+            if not length:
+                pos += 1  # 重新寻找帧同步
+                continue
+            if pos + length > len(buf):
+                break
+            if not self._frames and (b'Xing' in buf[pos:pos + length] or b'Info' in buf[pos:pos + length]):
+                # 跳过Xing/Info信息帧：它会让解码器按整段长度裁剪首尾，导致分段解码的采样数对不上
+                pos += length
+                continue
+            self._frames.append((pos, length))
+            self.samples_per_frame = samples
+            pos += length
+        self._scan_pos = pos
+
+    def decode(self, min_frames=1, final=False):
+        """解码新到达的完整帧，返回 float32 的 (采样数, 声道数) 数组；帧数不够时返回 None"""
+        pending = len(self._frames) - self._decoded
+        if pending <= 0 or (pending < min_frames and not final):
+            return None
+        first = max(0, self._decoded - self.WARMUP_FRAMES)
+        begin = self._frames[first][0]
+        last_offset, last_length = self._frames[-1]
+        data, self.samplerate = sf.read(io.BytesIO(bytes(self._buf[begin:last_offset + last_length])),
+                                        dtype='float32', always_2d=True)
+        if self._decoded > 0:
+            # 只保留新帧对应的采样，预热帧的输出丢弃
+            data = data[-min(len(data), pending * self.samples_per_frame):]
+        self._decoded = len(self._frames)
+        return data
+
+
+class PlaybackHandle:
+    """一次播放任务：音频可以一次给全，也可以边解码边追加；播放完成时 finished 被置位"""
+
+    def __init__(self, clip=None, started=None, generation=None):
+        self._blocks = deque()
+        self._offset = 0
+        self.closed = False
+        self.cancelled = False
+        self.started = started or threading.Event()
+        self.finished = threading.Event()
+        self.started_at = None  # 第一个采样送入声卡的时刻(perf_counter)
+        self.generation = generation  # 创建播放任务时 AudioOutput 的代数，None 表示不检查
+        if clip is not None:
+            self.feed(clip)
+            self.close()
+
+    def feed(self, block):
+        if len(block):
+            self._blocks.append(block)
+
+    def close(self):
+        """不再追加数据，剩余数据播完即结束"""
+        self.closed = True
+
+    def wait(self, timeout=None):
+        return self.finished.wait(timeout)
+
+    @property
+    def exhausted(self):
+        return self.closed and not self._blocks
+
+    def _read(self, out):
+        """把待播数据拷入 out，返回拷贝的采样数"""
+        filled = 0
+        while filled < len(out) and self._blocks:
+            block = self._blocks[0]
+            n = min(len(out) - filled, len(block) - self._offset)
+            out[filled:filled + n] = block[self._offset:self._offset + n]
+            filled += n
+            self._offset += n
+            if self._offset >= len(block):
+                self._blocks.popleft()
+                self._offset = 0
+        return filled
+
+
+class AudioOutput:
+    """常驻的 sounddevice 输出流：启动时打开一次，之后所有语音按顺序送入同一个流播放"""
+
+    def __init__(self, samplerate=OUTPUT_SAMPLERATE, blocksize=480):
+        self.samplerate = samplerate
+        self.blocksize = blocksize  # 20ms
+        self.stream = None
+        self.last_stop_latency_ms = None  # 最近一次停止请求到声卡输出静音的耗时
+        self.generation = 0  # 每次 stop_all 加一，之前开始的播报再提交的播放一律丢弃
+        self._lock = threading.Lock()
+        self._queue = deque()     # 等待播放的 PlaybackHandle
+        self._finishing = []      # 数据已全部送入声卡，下一次回调时标记完成
+        self._stop_requested_at = None
+        self._output_latency = 0.0
+        self._open_lock = threading.Lock()
+
+    def open(self):
+        """打开输出流（启动后在后台调用一次，避免导入 sounddevice 拖慢窗口显示）"""
+        with self._open_lock:
+            if self.stream is None:
+                self._open()
+
+    def _open(self):
+        try:
+            self.stream = sd.OutputStream(samplerate=self.samplerate, channels=1, dtype='float32',
+                                          blocksize=self.blocksize, latency='low', callback=self._callback)
+            self.stream.start()
+            self._output_latency = self.stream.latency
+        except Exception as e:
+            print(f"打开音频输出失败: {e}")
+            self.stream = None
+
+    def play(self, clip, started=None, generation=None):
+        """排队播放一个 clip，返回 PlaybackHandle；started 为可选的外部开始事件，
+        generation 为播报开始时的代数，期间调用过 stop_all 时不再播放"""
+        return self.submit(PlaybackHandle(clip, started, generation))
+
+    def play_stream(self, started=None, generation=None):
+        """返回一个可边解码边 feed 的 PlaybackHandle，数据未到时输出静音等待"""
+        return self.submit(PlaybackHandle(started=started, generation=generation))
+
+    def submit(self, handle):
+        if self.stream is None:
+            self.open()
+        if self.stream is None:
+            handle.finished.set()
+            return handle
+        with self._lock:
+            stale = handle.generation is not None and handle.generation != self.generation
+            if not stale:
+                self._queue.append(handle)
+        if stale:
+            handle.cancelled = True
+            handle.finished.set()
+        return handle
+
+    def stop_all(self):
+        """立即停止当前和排队中的所有播放，下一个回调块(20ms)起输出静音"""
+        with self._lock:
+            self.generation += 1
+            handles = list(self._queue) + self._finishing
+            self._queue.clear()
+            self._finishing = []
+            if handles and self.stream is not None:
+                self._stop_requested_at = time.perf_counter()
+        for handle in handles:
+            handle.cancelled = True
+            handle.finished.set()
+
+    def close(self):
+        self.stop_all()
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def _callback(self, outdata, frames, time_info, status):
+        out = outdata[:, 0]
+        filled = 0
+        with self._lock:
+            if self._stop_requested_at is not None:
+                # 这一块起输出静音，再加上声卡输出延迟即为听感上的停止延迟
+                elapsed = time.perf_counter() - self._stop_requested_at + self._output_latency
+                self.last_stop_latency_ms = elapsed * 1000
+                self._stop_requested_at = None
+            for handle in self._finishing:
+                handle.finished.set()
+            self._finishing = []
+            while filled < frames and self._queue:
+                handle = self._queue[0]
+                n = handle._read(out[filled:])
+                if n and handle.started_at is None:
+                    handle.started_at = time.perf_counter()
+                    handle.started.set()
+                filled += n
+                if handle.exhausted:
+                    self._queue.popleft()
+                    self._finishing.append(handle)
+                elif n == 0:
+                    break  # 边下边播的数据还没到，先输出静音
+        out[filled:] = 0
+
+
+class SessionEvent(threading.Event):
+    """set() 时同时唤醒会话调度器的事件"""
+
+    def __init__(self, scheduler):
+        super().__init__()
+        self._scheduler = scheduler
+
+    def set(self):
+        super().set()
+        self._scheduler.notify()
+
+
+class Utterance:
+    """一次语音播报的开始/结束事件；被暂停或停止打断时 cancelled 为真"""
+
+    def __init__(self, scheduler, text='', trace=None, generation=None):
+        self.scheduler = scheduler
+        self.generation = generation  # 开始播报时音频输出的代数，之后停止/暂停过则不再出声
+        self.started = SessionEvent(scheduler)
+        self.finished = SessionEvent(scheduler)
+        self.cancelled = False
+        self.text = text
+        self.trace_log = trace
+        self.seq = trace.new_seq() if trace is not None else 0
+
+    def trace(self, stage, at=None, **detail):
+        """在本轮播报的计时记录中记下这次播报的一个阶段"""
+        if self.trace_log is not None:
+            self.trace_log.record(stage, self.text, self.seq, at, **detail)
+
+    def interrupted(self):
+        return self.scheduler.paused or not self.scheduler.running
+
+    def done(self):
+        self.started.set()
+        self.finished.set()
+
+
+def percentile(values, q):
+    """已排序数列的百分位数（线性插值）"""
+    if not values:
+        return None
+    pos = (len(values) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+class SessionTrace:
+    """一轮播报的逐词计时记录：合成请求、首个数据、解码、播放开始/结束、倒计时、回退等阶段，
+    各线程都可以记录，结束后导出为 JSON Lines 或 CSV"""
+
+    FIELDS = ('session', 'seq', 'word', 'stage', 't_ms', 'detail')
+
+    def __init__(self):
+        self.session_id = time.strftime('%Y%m%d-%H%M%S')
+        self.t0 = time.perf_counter()
+        self.lock = threading.Lock()
+        self.events = []
+        self._seq = 0
+
+    def new_seq(self):
+        """给一次播报分配序号，同一次播报的各阶段共用"""
+        with self.lock:
+            self._seq += 1
+            return self._seq
+
+    def record(self, stage, word='', seq=0, at=None, **detail):
+        """记录一个阶段；at 为 perf_counter 时刻，默认为现在"""
+        t_ms = ((at if at is not None else time.perf_counter()) - self.t0) * 1000
+        with self.lock:
+            self.events.append({'session': self.session_id, 'seq': seq, 'word': word,
+                                'stage': stage, 't_ms': round(t_ms, 2), 'detail': detail})
+
+    def summary(self):
+        """请求到开始出声的延迟 p50/p95(毫秒)、缓存命中率和回退次数"""
+        with self.lock:
+            events = list(self.events)
+        requests = {}
+        starts = {}
+        fallbacks = set()  # 发生过回退的播报序号
+        for event in events:
+            if event['stage'] == 'request':
+                requests[event['seq']] = event
+            elif event['stage'] == 'play_start':
+                starts.setdefault(event['seq'], event['t_ms'])
+            elif event['stage'] == 'fallback':
+                fallbacks.add(event['seq'])
+        latencies = sorted(starts[seq] - requests[seq]['t_ms'] for seq in starts if seq in requests)
+        hits = sum(1 for event in requests.values() if event['detail'].get('cached'))
+        return {
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'hit_rate': hits / len(requests) if requests else None,
+            'utterances': len(requests),
+            'fallbacks': len(fallbacks),
+        }
+
+    def export(self, path):
+        """按扩展名导出为 .jsonl 或 .csv"""
+        with self.lock:
+            events = list(self.events)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            if path.endswith('.csv'):
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                writer.writeheader()
+                for event in events:
+                    writer.writerow(dict(event, detail=json.dumps(event['detail'], ensure_ascii=False)))
+            else:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+
+class SessionScheduler:
+    """播报会话调度器：按单调时钟计时，暂停/停止/事件到达时立即唤醒，等待期间不轮询"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.running = False
+        self.paused = False
+
+    def notify(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def event(self):
+        return SessionEvent(self)
+
+    def start(self):
+        with self._cond:
+            self.running = True
+            self.paused = False
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self.running = False
+            self.paused = False
+            self._cond.notify_all()
+
+    def set_paused(self, paused):
+        with self._cond:
+            self.paused = paused
+            self._cond.notify_all()
+
+    def wait_while_paused(self):
+        """暂停时阻塞到继续，返回会话是否仍在进行"""
+        with self._cond:
+            while self.running and self.paused:
+                self._cond.wait()
+            return self.running
+
+    def sleep(self, seconds):
+        """等待 seconds 秒（暂停期间不计时），会话被停止时立即返回 False"""
+        with self._cond:
+            deadline = time.monotonic() + seconds
+            while self.running:
+                if self.paused:
+                    remaining = deadline - time.monotonic()
+                    while self.running and self.paused:
+                        self._cond.wait()
+                    deadline = time.monotonic() + remaining
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return True
+                self._cond.wait(timeout)
+            return False
+
+    def wait_for(self, event, until_paused=False):
+        """等待 event 被置位；until_paused 为真时遇到暂停也返回。会话被停止时返回 False"""
+        with self._cond:
+            while self.running and not event.is_set() and not (until_paused and self.paused):
+                self._cond.wait()
+            return self.running
+
+
+class BackendHealth:
+    """edge-tts 健康状态（熔断器）：连续失败达到阈值后熔断，期间直接使用离线引擎，由后台探测恢复"""
+
+    CLOSED = 'closed'        # 正常使用 edge-tts
+    OPEN = 'open'            # 已熔断，走离线引擎
+    HALF_OPEN = 'half_open'  # 正在探测 edge-tts 是否恢复
+
+    def __init__(self, failure_threshold=EDGE_FAILURE_THRESHOLD, on_change=None):
+        self.failure_threshold = failure_threshold
+        self.on_change = on_change  # on_change(state)，可能在任意线程中调用
+        self.state = self.CLOSED
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def allow_edge(self):
+        return self.state == self.CLOSED
+
+    def set_state(self, state):
+        with self._lock:
+            changed = state != self.state
+            self.state = state
+        if changed and self.on_change:
+            self.on_change(state)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+        self.set_state(self.CLOSED)
+
+    def record_failure(self):
+        """记录一次失败，返回是否因此刚刚熔断"""
+        with self._lock:
+            self.failures += 1
+            tripped = self.state == self.CLOSED and self.failures >= self.failure_threshold
+        if tripped:
+            self.set_state(self.OPEN)
+        return tripped
+
+
+class ChunkFanout:
+    """一次进行中的 edge-tts 下载：保存已收到的数据块，并转发给中途加入的收听者"""
+
+    def __init__(self, loop):
+        self.chunks = []
+        self.listeners = []
+        self.done = loop.create_future()  # 结果为完整的MP3数据
+
+    def feed(self, chunk):
+        self.chunks.append(chunk)
+        for listener in self.listeners:
+            listener(chunk)
+
+    def finish(self, audio_data=None, error=None):
+        if self.done.done():
+            return
+        if isinstance(error, asyncio.CancelledError):
+            self.done.cancel()
+        elif error is not None:
+            self.done.set_exception(error)
+            self.done.exception()  # 标记异常已被读取，没有收听者时不打印警告
+        else:
+            self.done.set_result(audio_data)
+
+
+class SynthesisService:
+    """常驻后台的 asyncio 事件循环，统一处理 edge-tts 合成请求，调用方通过 Future 取结果"""
+
+    def __init__(self, cache, health=None, max_concurrency=4, timeout=10.0):
+        self.cache = cache
+        self.health = health or BackendHealth()
+        self.timeout = timeout  # 单个请求的超时时间(秒)
+        self.loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._inflight = {}  # 缓存键 -> asyncio.Task，同一词语的并发请求只合成一次
+        self._downloads = {}  # 缓存键 -> ChunkFanout，正在下载的合成任务，边播可以中途跟上
+        self._tasks = set()  # 调用方提交的合成任务，停止时统一取消（不含健康探测）
+        self._probe_task = None
+        self._edge_tts = None
+        self.thread = threading.Thread(target=self.loop.run_forever, name='tts-loop', daemon=True)
+        self.thread.start()
+        self.submit(self._warm_up())
+
+    def submit(self, coro):
+        """在后台事件循环中运行协程，返回 concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def cancel_all(self):
+        """取消所有进行中的合成/下载任务，正在进行的网络连接随之中断"""
+        def cancel():
+            for task in list(self._tasks):
+                task.cancel()
+        self.loop.call_soon_threadsafe(cancel)
+
+    def _track(self, task):
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _tracked(self, coro):
+        self._track(asyncio.current_task())
+        return await coro
+
+    def _import_edge_tts(self):
+        if self._edge_tts is None:
+            import edge_tts
+            self._edge_tts = edge_tts
+        return self._edge_tts
+
+    async def _warm_up(self):
+        """启动时在后台导入 edge_tts，第一个词不再承担导入开销"""
+        await self.loop.run_in_executor(None, self._import_edge_tts)
+
+    async def fetch_edge(self, text, on_chunk=None):
+        """下载一段 edge-tts 语音的MP3数据，并记录 edge-tts 的健康状态"""
+        try:
+            audio_data = await self._fetch(text, on_chunk)
+        except Exception:
+            if self.health.record_failure():
+                print("edge-tts 连续失败，暂时改用离线语音")
+                self._start_probe()
+            raise
+        self.health.record_success()
+        return audio_data
+
+    def _start_probe(self):
+        if self._probe_task is None or self._probe_task.done():
+            self._probe_task = self.loop.create_task(self._probe())
+
+    async def _probe(self):
+        """熔断期间按退避间隔探测 edge-tts，成功后恢复"""
+        attempt = 0
+        while True:
+            await asyncio.sleep(PROBE_DELAYS[min(attempt, len(PROBE_DELAYS) - 1)])
+            self.health.set_state(BackendHealth.HALF_OPEN)
+            try:
+                await self._fetch(PROBE_TEXT)
+            except Exception as e:
+                print(f"edge-tts 探测失败: {e}")
+                self.health.set_state(BackendHealth.OPEN)
+                attempt += 1
+                continue
+            print("edge-tts 已恢复")
+            self.health.record_success()
+            return
+
+    async def _fetch(self, text, on_chunk=None):
+        """下载一段 edge-tts 语音的MP3数据；on_chunk 在事件循环线程中逐块收到数据"""
+        edge_tts = self._import_edge_tts()
+        async with self._semaphore:
+            communicate = edge_tts.Communicate(text, EDGE_VOICE, rate=EDGE_RATE)
+            chunks = []
+
+            async def receive():
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        chunks.append(chunk["data"])
+                        if on_chunk:
+                            on_chunk(chunk["data"])
+
+            await asyncio.wait_for(receive(), timeout=self.timeout)
+            return b"".join(chunks)
+
+    async def _synthesize_edge(self, key, text):
+        clip = await self.loop.run_in_executor(None, self.cache.get, key)
+        if clip is None:
+            fanout = self._downloads[key] = ChunkFanout(self.loop)
+            try:
+                audio_data = await self.fetch_edge(text, fanout.feed)
+            except BaseException as e:
+                fanout.finish(error=e)
+                raise
+            else:
+                fanout.finish(audio_data)
+            finally:
+                if self._downloads.get(key) is fanout:
+                    del self._downloads[key]
+            # 写入缓存并得到解码后的音频
+            clip = await self.loop.run_in_executor(None, self.cache.put, key, audio_data)
+        return clip
+
+    def _forget(self, key, task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 标记异常已被读取，避免无人等待时打印警告
+
+    async def _shared_synthesize_edge(self, text):
+        key = edge_cache_key(text)
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._track(self.loop.create_task(self._synthesize_edge(key, text)))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def synthesize_edge(self, text):
+        """提交合成请求（命中缓存时不联网），Future 的结果为 clip"""
+        return self.submit(self._tracked(self._shared_synthesize_edge(text)))
+
+    def stream_edge(self, text, on_chunk):
+        """提交边下边播请求，Future 的结果为完整的MP3数据"""
+        return self.submit(self._tracked(self.fetch_edge(text, on_chunk)))
+
+    def follow_edge(self, text, on_chunk):
+        """跟上正在下载的合成任务（通常是预取）：先补发已收到的数据块，之后的数据块随到随转。
+        返回 Future，结果为完整的MP3数据；没有正在下载的任务时返回 None"""
+        return self.submit(self._follow_edge(edge_cache_key(text), on_chunk)).result()
+
+    async def _follow_edge(self, key, on_chunk):
+        fanout = self._downloads.get(key)
+        if fanout is None:
+            return None
+        for chunk in fanout.chunks:
+            on_chunk(chunk)
+        fanout.listeners.append(on_chunk)
+        return self.submit(self._tracked(asyncio.shield(fanout.done)))
+
+
+def pick_chinese_voice(engine):
+    """返回 pyttsx3 引擎中第一个中文语音的 id（Windows 下通常有 Microsoft Huihui/Microsoft Xiaoxiao）"""
+    for v in engine.getProperty('voices'):
+        # 兼容不同 pyttsx3 版本和平台
+        lang = ''
+        if hasattr(v, 'languages') and v.languages:
+            # 有些 pyttsx3 版本是 bytes，有些是 str
+            try:
+                lang = v.languages[0]
+                if isinstance(lang, bytes):
+                    lang = lang.decode('utf-8', errors='ignore')
+            except Exception:
+                lang = ''
+        if ('zh' in lang.lower()) or ('chinese' in v.name.lower()):
+            return v.id
+    return None
+
+
+def init_pyttsx3():
+    """初始化 pyttsx3 引擎并选用中文语音，返回 (engine, voice_id)"""
+    import pyttsx3
+    engine = pyttsx3.init()
+    voice_id = pick_chinese_voice(engine)
+    if voice_id:
+        engine.setProperty('voice', voice_id)
+    engine.setProperty('rate', PYTTSX3_RATE)
+    engine.setProperty('volume', 1.0)
+    return engine, voice_id
+
+
+def render_pyttsx3(engine, text):
+    """用 pyttsx3 把文本渲染成WAV数据"""
+    fd, wav_path = tempfile.mkstemp(suffix='.wav', prefix='_pyttsx3_')
+    os.close(fd)
+    try:
+        engine.save_to_file(text, wav_path)
+        engine.runAndWait()
+        with open(wav_path, 'rb') as f:
+            return f.read()
+    finally:
+        try:
+            os.remove(wav_path)
+        except OSError:
+            pass
+
+
+def pyttsx3_cache_key(voice_id, text):
+    return make_cache_key('pyttsx3', voice_id or 'default', PYTTSX3_RATE, text)
+
+
+class OfflineTTSWorker:
+    """独占一个 pyttsx3 引擎的后台线程：引擎只初始化一次、中文语音只查找一次，按队列处理请求"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.voice_id = None
+        self.ready = threading.Event()  # 引擎初始化完成（voice_id 已确定）
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """启动工作线程并初始化引擎（第一次提交请求时也会自动启动）"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='pyttsx3-worker', daemon=True)
+                self._thread.start()
+
+    def _submit(self, kind, text):
+        future = Future()
+        self.start()
+        self._queue.put((kind, text, future))
+        return future
+
+    def speak(self, text):
+        """直接用系统声卡朗读，Future 在读完后完成"""
+        return self._submit('speak', text)
+
+    def synthesize(self, text):
+        """渲染为音频并写入缓存（命中缓存时直接返回），Future 的结果为 clip"""
+        return self._submit('render', text)
+
+    def close(self):
+        self._queue.put(None)
+
+    def _cache_key(self, text):
+        return pyttsx3_cache_key(self.voice_id, text)
+
+    def cached(self, text):
+        """缓存里是否已有这个词的离线语音；引擎还没初始化时不知道语音id，按未缓存处理"""
+        if not self.ready.is_set():
+            return False
+        return self.cache.contains(self._cache_key(text))
+
+    def _render(self, engine, text):
+        key = self._cache_key(text)
+        clip = self.cache.get(key)
+        if clip is not None:
+            return clip
+        return self.cache.put(key, render_pyttsx3(engine, text))
+
+    def _run(self):
+        try:
+            engine, self.voice_id = init_pyttsx3()
+        except Exception as e:
+            if isinstance(e, ImportError):
+                print("未安装 pyttsx3，请先运行: pip install pyttsx3")
+            # 引擎不可用：之后的请求全部以同一异常结束
+            engine = None
+            init_error = e
+        self.ready.set()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            kind, text, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            if engine is None:
+                future.set_exception(init_error)
+                continue
+            try:
+                if kind == 'speak':
+                    engine.say(text)
+                    engine.runAndWait()
+                    future.set_result(None)
+                else:
+                    future.set_result(self._render(engine, text))
+            except Exception as e:
+                future.set_exception(e)
+
+
+_process_pyttsx3 = None  # 渲染进程内的 (engine, voice_id)
+
+
+def _process_engine():
+    global _process_pyttsx3
+    if _process_pyttsx3 is None:
+        _process_pyttsx3 = init_pyttsx3()
+    return _process_pyttsx3
+
+
+def _voice_in_process():
+    return _process_engine()[1]
+
+
+def _render_in_process(text):
+    """在渲染进程中执行，返回 (voice_id, WAV数据)"""
+    engine, voice_id = _process_engine()
+    return voice_id, render_pyttsx3(engine, text)
+
+
+class OfflineRenderPool:
+    """多进程批量渲染 pyttsx3 语音，供预合成使用：每个进程各有一个引擎，渲染结果在本进程写入缓存"""
+
+    def __init__(self, cache, workers=None):
+        self.cache = cache
+        self.workers = workers or os.cpu_count() or 1
+        self.voice_id = None
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _executor(self):
+        with self._lock:
+            if self._pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # 不从带着Qt线程的进程 fork，各平台统一用 spawn
+                pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+                try:
+                    # 先取得语音id，才能按缓存键判断哪些词已经渲染过
+                    self.voice_id = pool.submit(_voice_in_process).result()
+                except Exception:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                self._pool = pool
+            return self._pool
+
+    def cached(self, text):
+        self._executor()
+        return self.cache.contains(pyttsx3_cache_key(self.voice_id, text))
+
+    def synthesize(self, text):
+        """提交渲染任务，Future 的结果为 clip"""
+        future = Future()
+        rendering = self._executor().submit(_render_in_process, text)
+
+        def store(done):
+            if not future.set_running_or_notify_cancel():
+                return
+            if done.cancelled():
+                future.set_exception(CancelledError())
+                return
+            try:
+                voice_id, audio_bytes = done.result()
+                future.set_result(self.cache.put(pyttsx3_cache_key(voice_id, text), audio_bytes))
+            except Exception as e:
+                future.set_exception(e)
+
+        rendering.add_done_callback(store)
+        future.add_done_callback(lambda f: f.cancelled() and rendering.cancel())
+        return future
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+
+class PlaybackController:
+    """跟踪所有合成任务和播放线程：停止时统一取消（中断网络请求、立即静音）"""
+
+    def __init__(self, audio_output, synthesis):
+        self.audio_output = audio_output
+        self.synthesis = synthesis
+        self._lock = threading.Lock()
+        self._futures = set()
+        self._threads = set()
+
+    def track(self, future):
+        """登记一个合成任务的 Future，停止时会被取消"""
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._untrack)
+        return future
+
+    def _untrack(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def start_thread(self, target):
+        """启动并登记一个播放线程"""
+        thread = threading.Thread(target=self._run_thread, args=(target,), daemon=True)
+        with self._lock:
+            self._threads.add(thread)
+        thread.start()
+        return thread
+
+    def _run_thread(self, target):
+        try:
+            target()
+        finally:
+            with self._lock:
+                self._threads.discard(threading.current_thread())
+
+    @property
+    def active_jobs(self):
+        with self._lock:
+            return len(self._futures) + len(self._threads)
+
+    def cut_audio(self):
+        """立即静音（暂停时使用），不取消后台合成"""
+        self.audio_output.stop_all()
+
+    def cancel_all(self):
+        """停止时使用：取消所有合成任务和网络请求，并立即静音"""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+        self.synthesis.cancel_all()
+        self.audio_output.stop_all()
+
+
+class HedgedSynthesis:
+    """限时模式：在延迟预算内等待 edge-tts，超时后并行启动离线合成，先完成的一方用于播放；
+    另一方完成后照常写入缓存，下次直接命中"""
+
+    def __init__(self, synthesis, offline_tts, cache, health, budget_ms=HEDGE_BUDGET_MS):
+        self.synthesis = synthesis
+        self.offline_tts = offline_tts
+        self.cache = cache
+        self.health = health
+        self.budget_ms = budget_ms
+
+    def synthesize(self, text):
+        """返回 Future，结果为先完成的一方的 clip；两边都失败时以 edge-tts 的异常结束"""
+        result = Future()
+        lock = threading.Lock()
+        jobs = []  # 启动了 edge-tts 时第一个就是它
+        errors = {}  # 任务 -> 异常
+        offline_started = []
+
+        def set_result(clip):
+            try:
+                result.set_result(clip)
+            except InvalidStateError:
+                pass  # 已被另一方抢先或已取消
+
+        def start(job):
+            with lock:
+                jobs.append(job)
+            job.add_done_callback(on_done)
+
+        def start_offline():
+            with lock:
+                if offline_started or result.done():
+                    return
+                offline_started.append(True)
+            start(self.offline_tts.synthesize(text))
+
+        def on_done(job):
+            error = CancelledError() if job.cancelled() else job.exception()
+            if error is None:
+                set_result(job.result())
+                return
+            with lock:
+                errors[job] = error
+                all_failed = offline_started and len(errors) == len(jobs)
+            if not offline_started:
+                start_offline()  # edge-tts 已失败，不必等到预算用完
+            elif all_failed:
+                try:
+                    # 不论哪边先失败，都以 edge-tts 的异常结束（熔断期间只有离线合成）
+                    result.set_exception(errors[jobs[0]])
+                except InvalidStateError:
+                    pass
+
+        def on_result_done(f):
+            if f.cancelled():
+                with lock:
+                    pending = list(jobs)
+                for job in pending:
+                    job.cancel()
+
+        result.add_done_callback(on_result_done)
+        if self.health.allow_edge() or self.cache.contains(edge_cache_key(text)):
+            start(self.synthesis.synthesize_edge(text))
+            loop = self.synthesis.loop
+            loop.call_soon_threadsafe(loop.call_later, self.budget_ms / 1000, start_offline)
+        else:
+            start_offline()
+        return result
+
+
+class PrefetchPipeline:
+    """在后台提前合成播放游标之后的若干个词语，暂停/停止/换课时取消"""
+
+    def __init__(self, submit, depth=PREFETCH_DEPTH):
+        self.submit = submit  # submit(text) -> Future，结果为 clip
+        self.depth = depth
+        self.lock = threading.Lock()
+        self._futures = OrderedDict()  # 词语 -> Future
+        self._words = []
+
+    def reset(self, words):
+        """开始新的一轮播报"""
+        self.cancel()
+        with self.lock:
+            self._words = list(words)
+
+    def advance(self, cursor):
+        """播放游标移到 cursor，保证从 cursor 起的 depth+1 个词已提交合成"""
+        with self.lock:
+            window = self._words[cursor:cursor + self.depth + 1]
+            for text in list(self._futures):
+                if text not in window:
+                    self._futures.pop(text).cancel()
+            for text in window:
+                if text not in self._futures:
+                    self._futures[text] = self.submit(text)
+
+    def pending(self, text):
+        """text 已提交预取但还没有完成"""
+        with self.lock:
+            future = self._futures.get(text)
+        return future is not None and not future.done()
+
+    def take(self, text):
+        """取出预取结果（可能需要等待合成完成），没有预取或预取失败时返回 None，
+        由调用方按未命中处理，走各自的合成和回退流程"""
+        with self.lock:
+            future = self._futures.get(text)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except CancelledError:
+            return None
+        except Exception as e:
+            print(f"预取合成失败: {str(e)}，改为现场合成")
+            return None
+
+    def cancel(self):
+        """取消所有预取任务"""
+        with self.lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+    def stop(self):
+        self.cancel()
+        with self.lock:
+            self._words = []
+
+
+class CacheWarmup:
+    """在后台把一批词语预先合成到缓存。已缓存的词直接跳过，缓存本身就是进度：
+    中途停止或退出后重新开始，只合成剩下的词。同时进行的请求不超过 max_pending 个，
+    播报期间暂停，不和正在播报的词抢网络"""
+
+    def __init__(self, texts, submit, is_cached, on_progress=None, max_pending=WARMUP_CONCURRENCY):
+        self.texts = dedupe_words(texts)
+        self.submit = submit  # submit(text) -> Future，完成时语音已写入缓存
+        self.is_cached = is_cached
+        self.on_progress = on_progress or (lambda done, total, failed, eta: None)
+        self.max_pending = max_pending
+        self.done = 0
+        self.failed = 0
+        self.cancelled = False
+        self._queue = deque()
+        self._pending = set()
+        self._cond = threading.Condition()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._started = None
+        self._skipped = 0
+
+    def start(self):
+        threading.Thread(target=self._run, name='cache-warmup', daemon=True).start()
+        return self
+
+    def set_paused(self, paused):
+        if paused:
+            self._resume.clear()
+        else:
+            self._resume.set()
+
+    def cancel(self):
+        with self._cond:
+            self.cancelled = True
+            pending = list(self._pending)
+            self._cond.notify_all()
+        self._resume.set()
+        for future in pending:
+            future.cancel()
+
+    def _report(self):
+        """报告进度，剩余时间按本次实际合成的速度估算（还不能估算时为 -1）"""
+        total = len(self.texts)
+        synthesized = self.done - self._skipped
+        elapsed = time.perf_counter() - self._started
+        eta = (total - self.done) * elapsed / synthesized if synthesized else -1.0
+        self.on_progress(self.done, total, self.failed, eta)
+
+    def _finished(self, text, future):
+        with self._cond:
+            self._pending.discard(future)
+            if future.cancelled():
+                if not self.cancelled:
+                    self._queue.append(text)  # 被停止播报一并取消的，稍后重试
+            else:
+                self.done += 1
+                if future.exception() is not None:
+                    self.failed += 1
+            self._cond.notify_all()
+        self._report()
+
+    def _run(self):
+        self._started = time.perf_counter()
+        try:
+            todo = [text for text in self.texts if not self.is_cached(text)]
+        except Exception as e:
+            # 引擎不可用（如未安装 pyttsx3），所有词记为失败
+            print(f"预合成失败: {e}")
+            self.done = self.failed = len(self.texts)
+            self._report()
+            return
+        self._queue.extend(todo)
+        self.done = self._skipped = len(self.texts) - len(todo)
+        self._report()
+        while True:
+            self._resume.wait()
+            with self._cond:
+                while len(self._pending) >= self.max_pending and not self.cancelled:
+                    self._cond.wait()
+                if self.cancelled:
+                    return
+                if not self._queue:
+                    if not self._pending:
+                        return
+                    self._cond.wait()
+                    continue
+                text = self._queue.popleft()
+            try:
+                future = self.submit(text)
+            except Exception:
+                with self._cond:
+                    self.done += 1
+                    self.failed += 1
+                self._report()
+                continue
+            with self._cond:
+                self._pending.add(future)
+            future.add_done_callback(lambda f, text=text: self._finished(text, f))
+
+
+INTRO_TEXT = "准备开始"
+OUTRO_TEXT = "默写结束"
+WORD_REPEATS = 2  # 每个词播报的遍数
+
+
+def dedupe_words(words):
+    """去除重复词语，保持原有顺序"""
+    return list(dict.fromkeys(words))
+
+
+def session_steps(words, interval, repeat_interval):
+    """一轮默写的播报顺序，实时播报和离线导出共用。
+    产出 (类型, 值, 词序号)：('prompt', 文本, -1)、('word', 词语, i)、('pause', 秒数, i)、('countdown', 秒数, i)；
+    所有间隔都从前一段语音播完时开始计算"""
+    yield ('prompt', INTRO_TEXT, -1)
+    yield ('pause', INTRO_GAP, -1)
+    for i, word in enumerate(words):
+        for _ in range(WORD_REPEATS):
+            yield ('word', word, i)
+            yield ('pause', repeat_interval, i)
+        yield ('countdown', interval, i)
+    yield ('prompt', OUTRO_TEXT, len(words) - 1)
+
+
+def render_session(words, clips, interval, repeat_interval):
+    """按 session_steps 把一轮默写拼成一段音频，clips 为 文本 -> clip；间隔和倒计时用静音填充"""
+    parts = []
+    for kind, value, _ in session_steps(words, interval, repeat_interval):
+        if kind in ('pause', 'countdown'):
+            parts.append(np.zeros(int(round(value * OUTPUT_SAMPLERATE)), dtype=np.float32))
+        else:
+            parts.append(clips[value])
+    return np.concatenate(parts)
+
+
+_export_services = None  # 导出进程内共用的合成服务
+
+
+def _export_synthesizers():
+    global _export_services
+    if _export_services is None:
+        cache = AudioCache(os.path.join(get_app_data_dir(), 'tts_cache'))
+        _export_services = (SynthesisService(cache), OfflineTTSWorker(cache))
+    return _export_services
+
+
+def synthesize_clips(texts, engine='edge', label=''):
+    """在当前进程中合成一组文本，返回 {文本: clip}"""
+    synthesis, offline_tts = _export_synthesizers()
+    if engine != 'edge':
+        return {text: offline_tts.synthesize(text).result() for text in texts}
+    def edge_usable(text):
+        return synthesis.health.allow_edge() or synthesis.cache.contains(edge_cache_key(text))
+
+    # 先把所有词一起提交，由合成服务控制并发；失败的词改用 pyttsx3
+    futures = {text: synthesis.synthesize_edge(text) for text in texts if edge_usable(text)}
+    clips = {}
+    for text in texts:
+        future = futures.get(text)
+        if future is not None and not future.done() and not edge_usable(text):
+            future.cancel()
+            future = None
+        if future is None:
+            # edge-tts 已熔断，不再等待超时，直接使用离线语音
+            clips[text] = offline_tts.synthesize(text).result()
+            continue
+        try:
+            clips[text] = future.result()
+        except Exception as e:
+            print(f"[{label}] edge-tts合成“{text}”失败: {e}，改用pyttsx3")
+            clips[text] = offline_tts.synthesize(text).result()
+    return clips
+
+
+def render_lesson_file(lesson, words, out_path, interval, repeat_interval, engine='edge', speed=1.0):
+    """在导出进程中合成一课的全部语音并写成一个音频文件，返回输出路径"""
+    clips = synthesize_clips(dedupe_words([INTRO_TEXT, OUTRO_TEXT] + list(words)), engine, lesson)
+    clips = {text: time_stretch(clip, speed) for text, clip in clips.items()}
+    audio = render_session(words, clips, interval, repeat_interval)
+    sf.write(out_path, audio, OUTPUT_SAMPLERATE)
+    return out_path
+
+
+def export_main(argv):
+    """命令行批量导出：每课生成一个完整的默写音频文件，多课在多个进程中并行合成；
+    --format pack 时把所选各课的全部词语导出为一个语音包"""
+    import argparse
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    parser = argparse.ArgumentParser(prog='word_announcer --export', description="把词表中的每一课导出为默写音频")
+    parser.add_argument('--export', metavar='OUT_DIR', required=True, help="输出文件夹")
+    parser.add_argument('--workbook', default='words.xlsx', help="词表文件（.xlsx/.xls/.csv/.txt）")
+    parser.add_argument('--lesson', action='append', help="只导出指定的课，可重复；默认导出全部")
+    parser.add_argument('--format', choices=('wav', 'ogg', 'pack'), default='ogg',
+                        help=f"pack: 所有词语打包成一个 {VOICE_PACK_SUFFIX} 语音包，供离线教室使用")
+    parser.add_argument('--interval', type=float, default=3, help="下一词播报间隔(秒)")
+    parser.add_argument('--repeat-interval', type=float, default=5, help="重复播报间隔(秒)")
+    parser.add_argument('--engine', choices=('edge', 'pyttsx3'), default='edge')
+    parser.add_argument('--speed', type=float, default=1.0, help="播放语速倍数，如 0.8")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="并行进程数")
+    args = parser.parse_args(argv)
+
+    try:
+        lessons = read_lessons(args.workbook)
+    except Exception as e:
+        print(f"读取Excel失败: {e}")
+        return 1
+    if args.lesson:
+        missing = [name for name in args.lesson if name not in lessons]
+        if missing:
+            print(f"词表中没有这些课: {'、'.join(missing)}")
+            return 1
+        lessons = {name: lessons[name] for name in args.lesson}
+    os.makedirs(args.export, exist_ok=True)
+    if args.format == 'pack':
+        # 语音包保存原速语音，播放时再按设置变速
+        texts = dedupe_words([INTRO_TEXT, OUTRO_TEXT] + [word for words in lessons.values() for word in words])
+        clips = synthesize_clips(texts, args.engine, os.path.basename(args.workbook))
+        name = os.path.splitext(os.path.basename(args.workbook))[0] + VOICE_PACK_SUFFIX
+        path = write_voice_pack(os.path.join(args.export, name), clips,
+                                {'workbook': os.path.basename(args.workbook), 'engine': args.engine})
+        print(f"已导出语音包: {path}（{len(clips)} 个词语）")
+        return 0
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(args.jobs, 1)) as pool:
+        futures = {}
+        for number, (lesson, words) in enumerate(lessons.items(), 1):
+            file_name = re.sub(r'[\\/:*?"<>|]', '_', f"{number:02d}_{lesson}.{args.format}")
+            future = pool.submit(render_lesson_file, lesson, dedupe_words(words),
+                                 os.path.join(args.export, file_name),
+                                 args.interval, args.repeat_interval, args.engine, args.speed)
+            futures[future] = lesson
+        for future in as_completed(futures):
+            try:
+                print(f"已导出: {future.result()}")
+            except Exception as e:
+                failed += 1
+                print(f"导出“{futures[future]}”失败: {e}")
+    print(f"完成: {len(futures) - failed}/{len(futures)} 课")
+    return 1 if failed else 0
+
+
+def _cell_text(value):
+    """单元格内容转为文本：空单元格为空串，整数值的浮点数去掉 .0"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _columns_to_lessons(rows):
+    """按行读入表格，第一行是课名，后面每列是该课的词语；返回 {课名: 词语列表}"""
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return {}
+    columns = [[] for _ in header]
+    for row in rows:
+        for col, value in enumerate(row[:len(columns)]):
+            text = _cell_text(value)
+            if text:
+                columns[col].append(text)
+    lessons = {}
+    for name, words in zip(header, columns):
+        lesson = _cell_text(name)
+        if lesson and words:
+            lessons[lesson] = words
+    return lessons
+
+
+def _read_xlsx(path):
+    import openpyxl
+    # 只读模式按行流式解析，不把整张表载入内存
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        return _columns_to_lessons(wb.worksheets[0].iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+
+def _read_xls(path):
+    import xlrd
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        sheet = book.sheet_by_index(0)
+        lessons = {}
+        for col in range(sheet.ncols):
+            values = sheet.col_values(col)
+            lesson = _cell_text(values[0]) if values else ''
+            words = [text for text in map(_cell_text, values[1:]) if text]
+            if lesson and words:
+                lessons[lesson] = words
+        return lessons
+    finally:
+        book.release_resources()
+
+
+def _open_text(path):
+    """打开文本词表：优先 UTF-8，Excel 另存的 CSV 常见 GBK 编码"""
+    with open(path, 'rb') as f:
+        head = f.read(4096)
+    try:
+        # 只读了开头一段，末尾可能截在多字节汉字中间，用增量解码器容忍这个不完整的尾巴
+        codecs.getincrementaldecoder('utf-8-sig')().decode(head, final=False)
+        encoding = 'utf-8-sig'
+    except UnicodeDecodeError:
+        encoding = 'gbk'
+    return open(path, encoding=encoding, newline='')
+
+
+def _read_csv(path):
+    with _open_text(path) as f:
+        return _columns_to_lessons(csv.reader(f))
+
+
+def _read_txt(path):
+    """纯文本词表：以 # 开头的行是课名，其余行是词语（空格分隔）；没有课名时整个文件算一课"""
+    lessons = {}
+    lesson = os.path.splitext(os.path.basename(path))[0]
+    with _open_text(path) as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#'):
+                lesson = line.lstrip('#').strip()
+                continue
+            words = [w for w in re.split(r'[ \t\u3000]+', line) if w]
+            if lesson and words:
+                lessons.setdefault(lesson, []).extend(words)
+    return lessons
+
+
+def read_lessons(path):
+    """读取词表文件（.xlsx/.xls/.csv/.txt），返回 {课名: 词语列表}"""
+    ext = os.path.splitext(path)[1].lower()
+    reader = {'.xlsx': _read_xlsx, '.xls': _read_xls, '.csv': _read_csv, '.txt': _read_txt}.get(ext)
+    if reader is None:
+        raise ValueError(f"不支持的文件类型: {ext}")
+    return reader(path)
+
+
+def file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def content_fingerprint(path):
+    """词表内容指纹。xlsx 每次保存都会改写文档属性等部件，只取工作表和共享字符串部件的CRC，
+    这样没有改动词语的保存不会触发重新解析；其他格式用整个文件的哈希"""
+    if path.lower().endswith('.xlsx'):
+        import zipfile
+        try:
+            with zipfile.ZipFile(path) as zf:
+                parts = sorted(
+                    (info.filename, info.CRC, info.file_size) for info in zf.infolist()
+                    if info.filename.startswith('xl/worksheets/') or info.filename == 'xl/sharedStrings.xml')
+            return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+        except zipfile.BadZipFile:
+            pass
+    return file_sha1(path)
+
+
+class LessonCache:
+    """词表解析结果的旁路缓存：按文件路径存一个紧凑的JSON，修改时间和大小不变时直接使用，
+    变了再比对内容指纹，指纹也变了才重新解析"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, file_path):
+        key = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def _read_entry(self, cache_path):
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, cache_path, entry):
+        tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"写入词表缓存失败: {e}")
+
+    def load(self, file_path):
+        """返回 {课名: 词语列表}，尽量不重新解析文件"""
+        st = os.stat(file_path)
+        cache_path = self._path(file_path)
+        entry = self._read_entry(cache_path)
+        if entry and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+            return dict(entry['lessons'])
+        fingerprint = content_fingerprint(file_path)
+        if entry and entry.get('fingerprint') == fingerprint:
+            lessons = dict(entry['lessons'])
+        else:
+            lessons = read_lessons(file_path)
+        self._write_entry(cache_path, {
+            'path': os.path.abspath(file_path),
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'fingerprint': fingerprint,
+            'lessons': list(lessons.items()),
+        })
+        return lessons
+
+
+_CN_DIGITS = {'零': 0, '一': 1, '二': 2, '两': 2, '三': 3, '四': 4, '五': 5, '六': 6, '七': 7, '八': 8, '九': 9}
+
+
+def parse_number(text):
+    """解析阿拉伯数字或一到九十九的中文数字，解析失败返回 None"""
+    if text.isdigit():
+        return int(text)
+    if text == '十':
+        return 10
+    if '十' in text:
+        tens, _, ones = text.partition('十')
+        tens = _CN_DIGITS.get(tens, 1) if tens else 1
+        ones = _CN_DIGITS.get(ones, 0) if ones else 0
+        return tens * 10 + ones
+    return _CN_DIGITS.get(text)
+
+
+_NUM = r'([零一二两三四五六七八九十\d]+)'
+GRADE_RE = re.compile(_NUM + r'\s*年级')
+UNIT_RE = re.compile(r'第\s*' + _NUM + r'\s*单元')
+LESSON_NO_RE = re.compile(r'第\s*' + _NUM + r'\s*课')
+RANGE_QUERY_RE = re.compile(r'^第?\s*(\d+)\s*(?:[-–—~～到至]\s*第?\s*(\d+))?\s*(单元|课)?$')
+
+
+def _match_number(pattern, *texts):
+    for text in texts:
+        m = pattern.search(text or '')
+        if m:
+            return parse_number(m.group(1))
+    return None
+
+
+class WordBank:
+    """本地词库：把多个词表导入SQLite，按年级、单元、课和词语建索引，供课文列表和搜索使用"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS workbooks (
+            id INTEGER PRIMARY KEY,
+            path TEXT UNIQUE NOT NULL,
+            name TEXT NOT NULL,
+            mtime_ns INTEGER,
+            size INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS lessons (
+            id INTEGER PRIMARY KEY,
+            workbook_id INTEGER NOT NULL REFERENCES workbooks(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            grade INTEGER,
+            unit INTEGER,
+            lesson_no INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS words (
+            lesson_id INTEGER NOT NULL REFERENCES lessons(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            text TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_lessons_workbook ON lessons(workbook_id, position);
+        CREATE INDEX IF NOT EXISTS idx_lessons_unit ON lessons(grade, unit);
+        CREATE INDEX IF NOT EXISTS idx_words_lesson ON words(lesson_id, position);
+        CREATE INDEX IF NOT EXISTS idx_words_text ON words(text);
+    """
+
+    def __init__(self, db_path, loader=read_lessons):
+        self.loader = loader  # 路径 -> {课名: 词语列表}
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute('PRAGMA foreign_keys = ON')
+        self.db.execute('PRAGMA journal_mode = WAL')
+        self.db.executescript(self.SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def import_file(self, path):
+        """导入（或增量更新）一个词表，返回 (workbook_id, 有变化的课名集合)。
+        文件未变时不重新解析；只改写增删或词语有变化的课，其余课的id保持不变"""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self.lock:
+            row = self.db.execute(
+                'SELECT id, mtime_ns, size FROM workbooks WHERE path = ?', (path,)).fetchone()
+        if row and row[1] == st.st_mtime_ns and row[2] == st.st_size:
+            return row[0], set()
+        return self.import_lessons(path, os.path.basename(path), self.loader(path), st.st_mtime_ns, st.st_size)
+
+    def import_lessons(self, path, name, lessons, mtime_ns=None, size=None):
+        """导入（或增量更新）已解析好的词表 {课名: 词语列表}，path 只用来区分词表（如教室服务器的地址）。
+        返回值与 import_file 相同"""
+        with self.lock, self.db:
+            row = self.db.execute('SELECT id FROM workbooks WHERE path = ?', (path,)).fetchone()
+            if row:
+                workbook_id = row[0]
+                self.db.execute('UPDATE workbooks SET mtime_ns = ?, size = ? WHERE id = ?',
+                                (mtime_ns, size, workbook_id))
+            else:
+                workbook_id = self.db.execute(
+                    'INSERT INTO workbooks (path, name, mtime_ns, size) VALUES (?, ?, ?, ?)',
+                    (path, name, mtime_ns, size)).lastrowid
+            old = self._lesson_rows(workbook_id)
+            changed = set()
+            for lesson in old.keys() - lessons.keys():
+                self.db.execute('DELETE FROM lessons WHERE id = ?', (old[lesson][0],))
+                changed.add(lesson)
+            for position, (lesson, words) in enumerate(lessons.items()):
+                if lesson in old:
+                    lesson_id, old_position, old_words = old[lesson]
+                    if old_position != position:
+                        self.db.execute('UPDATE lessons SET position = ? WHERE id = ?', (position, lesson_id))
+                    if old_words == words:
+                        continue
+                    self.db.execute('DELETE FROM words WHERE lesson_id = ?', (lesson_id,))
+                else:
+                    lesson_id = self.db.execute(
+                        'INSERT INTO lessons (workbook_id, position, name, grade, unit, lesson_no) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (workbook_id, position, lesson,
+                         _match_number(GRADE_RE, lesson, name),
+                         _match_number(UNIT_RE, lesson),
+                         _match_number(LESSON_NO_RE, lesson))).lastrowid
+                self.db.executemany(
+                    'INSERT INTO words (lesson_id, position, text) VALUES (?, ?, ?)',
+                    [(lesson_id, i, word) for i, word in enumerate(words)])
+                changed.add(lesson)
+        return workbook_id, changed
+
+    def import_folder(self, folder):
+        """导入文件夹下所有词表，返回 {workbook_id: 有变化的课名集合}"""
+        imported = {}
+        for root, _, files in os.walk(folder):
+            for file_name in sorted(files):
+                if not file_name.lower().endswith(WORDLIST_EXTENSIONS) or file_name.startswith('~$'):
+                    continue
+                try:
+                    workbook_id, changed = self.import_file(os.path.join(root, file_name))
+                    imported[workbook_id] = changed
+                except Exception as e:
+                    print(f"导入词表失败 {file_name}: {e}")
+        return imported
+
+    def prune_missing(self, folder=None):
+        """删除源文件已不存在的词表（可只检查某个文件夹下的），返回删除的个数"""
+        prefix = os.path.join(os.path.abspath(folder), '') if folder else ''
+        removed = 0
+        with self.lock, self.db:
+            rows = self.db.execute('SELECT id, path FROM workbooks').fetchall()
+            for workbook_id, path in rows:
+                if path.startswith(prefix) and not os.path.exists(path):
+                    self.db.execute('DELETE FROM workbooks WHERE id = ?', (workbook_id,))
+                    removed += 1
+        return removed
+
+    def keep_only(self, workbook_ids):
+        """删除不在 workbook_ids 中的词表，返回删除的个数"""
+        keep = set(workbook_ids)
+        removed = 0
+        with self.lock, self.db:
+            rows = self.db.execute('SELECT id FROM workbooks').fetchall()
+            for (workbook_id,) in rows:
+                if workbook_id not in keep:
+                    self.db.execute('DELETE FROM workbooks WHERE id = ?', (workbook_id,))
+                    removed += 1
+        return removed
+
+    def _lesson_rows(self, workbook_id):
+        """课名 -> (lesson_id, position, 词语列表)"""
+        lessons = {}
+        for lesson_id, name, position in self.db.execute(
+                'SELECT id, name, position FROM lessons WHERE workbook_id = ?', (workbook_id,)).fetchall():
+            lessons[name] = (lesson_id, position, [text for (text,) in self.db.execute(
+                'SELECT text FROM words WHERE lesson_id = ? ORDER BY position', (lesson_id,))])
+        return lessons
+
+    def workbook_count(self):
+        with self.lock:
+            return self.db.execute('SELECT COUNT(*) FROM workbooks').fetchone()[0]
 
-def ensure_ico_from_png(png_path, ico_path, size=(256, 256)):
-    """如果ico文件不存在，则从png生成指定尺寸的ico文件"""
-    if not os.path.exists(ico_path):
-        img = Image.open(png_path).convert('RGBA')
-        img = img.resize(size, Image.LANCZOS)
-        img.save(ico_path, format='ICO')
+    def workbooks(self):
+        """所有词表，返回 [(workbook_id, 名称)]"""
+        with self.lock:
+            return self.db.execute('SELECT id, name FROM workbooks ORDER BY name, id').fetchall()
+
+    def workbook_lessons(self, workbook_id):
+        """某个词表的课文，返回 [(lesson_id, 课名)]"""
+        with self.lock:
+            return self.db.execute(
+                'SELECT id, name FROM lessons WHERE workbook_id = ? ORDER BY position',
+                (workbook_id,)).fetchall()
+
+    def lesson_words(self, lesson_id):
+        with self.lock:
+            return [text for (text,) in self.db.execute(
+                'SELECT text FROM words WHERE lesson_id = ? ORDER BY position', (lesson_id,))]
+
+    def words_for_lessons(self, lesson_ids):
+        """按课文顺序合并多课的词语"""
+        words = []
+        for lesson_id in lesson_ids:
+            words.extend(self.lesson_words(lesson_id))
+        return words
+
+    def search(self, query, limit=200):
+        """搜索课文：输入“3-5”或“第3单元”按单元查找（加“课”字按课号），否则查找包含该词语的课文。
+        返回 [(lesson_id, 显示名)]"""
+        query = query.strip()
+        if not query:
+            return []
+        m = RANGE_QUERY_RE.match(query)
+        if m:
+            low = int(m.group(1))
+            high = int(m.group(2) or low)
+            column = 'lesson_no' if m.group(3) == '课' else 'unit'
+            sql = (f'SELECT l.id, l.name, w.name FROM lessons l JOIN workbooks w ON w.id = l.workbook_id '
+                   f'WHERE l.{column} BETWEEN ? AND ? ORDER BY l.grade, l.{column}, w.name, l.position LIMIT ?')
+            params = (min(low, high), max(low, high), limit)
+        else:
+            # 词语精确匹配走索引，其余用模糊匹配兜底
+            sql = ('SELECT l.id, l.name, w.name FROM lessons l JOIN workbooks w ON w.id = l.workbook_id '
+                   'WHERE l.id IN (SELECT lesson_id FROM words WHERE text = ? '
+                   "UNION SELECT lesson_id FROM words WHERE text LIKE ? ESCAPE '\\') "
+                   'ORDER BY w.name, l.position LIMIT ?')
+            pattern = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            params = (query, f'%{pattern}%', limit)
+        with self.lock:
+            rows = self.db.execute(sql, params).fetchall()
+        return [(lesson_id, f"{lesson}（{workbook}）") for lesson_id, lesson, workbook in rows]
+
+
+class ClassroomServer:
+    """教室服务器：一台电脑负责合成，全班的播报器通过局域网HTTP取课文和语音。
+    语音按文本寻址共用一份缓存，同一个词的并发请求只合成一次，其余请求等待同一个结果"""
+
+    def __init__(self, word_bank, cache, synthesis, offline_tts):
+        self.word_bank = word_bank
+        self.cache = cache
+        self.synthesis = synthesis
+        self.offline_tts = offline_tts
+        self.lock = threading.Lock()
+        self._pending = {}  # 文本 -> Future，合成中的词
+        self.started = time.time()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'syntheses': 0, 'coalesced': 0,
+                      'fallbacks': 0, 'failures': 0, 'bytes_sent': 0}
+        # 提前初始化离线引擎，确定语音id后才能查到以前回退时缓存的离线语音
+        offline_tts.start()
+
+    def _count(self, name, n=1):
+        with self.lock:
+            self.stats[name] += n
+
+    def lessons(self):
+        """全部词表的课文，返回 [{'name': 词表名, 'lessons': {课名: 词语列表}}]"""
+        workbooks = []
+        for workbook_id, name in self.word_bank.workbooks():
+            lessons = {lesson: self.word_bank.lesson_words(lesson_id)
+                       for lesson_id, lesson in self.word_bank.workbook_lessons(workbook_id)}
+            workbooks.append({'name': name, 'lessons': lessons})
+        return workbooks
+
+    def _cached(self, text):
+        """缓存中这个词的原始编码数据，返回 (数据, 引擎名)；edge-tts 和回退的离线语音都没有时返回 None"""
+        data = self.cache.read(edge_cache_key(text))
+        if data is not None:
+            return data, 'edge'
+        if self.offline_tts.cached(text):
+            data = self.cache.read(self.offline_tts._cache_key(text))
+            if data is not None:
+                return data, 'pyttsx3'
+        return None
+
+    def audio(self, text):
+        """取一个词的原始编码数据，返回 (数据, 引擎名)；合成失败时抛出异常"""
+        self._count('requests')
+        cached = self._cached(text)
+        if cached is not None:
+            self._count('cache_hits')
+            return cached
+        with self.lock:
+            future = self._pending.get(text)
+            owner = future is None
+            if owner:
+                future = self._pending[text] = Future()
+                self.stats['syntheses'] += 1
+            else:
+                self.stats['coalesced'] += 1
+        if owner:
+            try:
+                future.set_result(self._synthesize(text))
+            except Exception as e:
+                self._count('failures')
+                future.set_exception(e)
+            finally:
+                with self.lock:
+                    del self._pending[text]
+        return future.result()
+
+    def _synthesize(self, text):
+        if self.synthesis.health.allow_edge():
+            try:
+                self.synthesis.synthesize_edge(text).result()
+                data = self.cache.read(edge_cache_key(text))
+                if data is not None:
+                    return data, 'edge'
+            except Exception as e:
+                print(f"edge-tts合成“{text}”失败: {e}，改用pyttsx3")
+        self._count('fallbacks')
+        self.offline_tts.synthesize(text).result()
+        data = self.cache.read(self.offline_tts._cache_key(text))
+        if data is None:
+            raise RuntimeError(f"“{text}”的语音没有写入缓存")
+        return data, 'pyttsx3'
+
+    def snapshot(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['pending'] = len(self._pending)
+        stats['uptime_s'] = round(time.time() - self.started, 1)
+        return stats
+
+    def make_server(self, host='0.0.0.0', port=SERVER_PORT):
+        """创建（不启动）HTTP服务：GET /lessons、/audio?text=词语、/stats"""
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        from urllib.parse import urlsplit, parse_qs
+        classroom = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # 响应头和语音数据分两次写出，不关掉会多等一个延迟确认
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                if url.path == '/lessons':
+                    self._send_json(classroom.lessons())
+                elif url.path == '/stats':
+                    self._send_json(classroom.snapshot())
+                elif url.path == '/audio':
+                    text = parse_qs(url.query).get('text', [''])[0].strip()
+                    if not text:
+                        self._send(400, 'text/plain; charset=utf-8', "缺少 text 参数".encode())
+                        return
+                    try:
+                        data, engine = classroom.audio(text)
+                    except Exception as e:
+                        self._send(503, 'text/plain; charset=utf-8', f"合成失败: {e}".encode())
+                        return
+                    classroom._count('bytes_sent', len(data))
+                    self._send(200, SERVER_AUDIO_TYPES[engine], data, {'X-Engine': engine})
+                else:
+                    self._send(404, 'text/plain; charset=utf-8', b"not found")
+
+            def _send_json(self, value):
+                self._send(200, 'application/json; charset=utf-8', json.dumps(value, ensure_ascii=False).encode())
+
+            def _send(self, status, content_type, body, headers=None):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 全班同时请求时不逐条打印
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 128  # 一个班的学生可能同时连接
+
+        return Server((host, port), Handler)
+
+    def close(self):
+        self.synthesis.close()
+        self.offline_tts.close()
+
+
+class ClassroomClient:
+    """连接教室服务器的学生端：课文和语音从服务器取，语音写入本机缓存，下次不再请求"""
+
+    def __init__(self, cache, base_url='', timeout=10.0, max_workers=4):
+        self.cache = cache
+        self.base_url = base_url
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self._inflight = {}  # 文本 -> Future，预取和播报同时请求同一个词时只下载一次
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='classroom')
+
+    def _get(self, path, **query):
+        import urllib.request
+        from urllib.parse import urlencode
+        url = self.base_url.rstrip('/') + path + (f"?{urlencode(query)}" if query else '')
+        with urllib.request.urlopen(url, timeout=self.timeout) as response:
+            return response.read(), response.headers
+
+    def lessons(self):
+        """服务器上的全部词表，格式见 ClassroomServer.lessons"""
+        data, _ = self._get('/lessons')
+        return json.loads(data)
+
+    def _cache_key(self, text, engine):
+        if engine == 'edge':
+            return edge_cache_key(text)
+        # 服务器的离线语音与本机 pyttsx3 的语音不同，分开缓存
+        return make_cache_key('classroom-' + engine, self.base_url, '', text)
+
+    def cached(self, text):
+        """本机缓存里是否已有这个词从服务器取来的语音（包括服务器回退的离线语音）"""
+        return any(self.cache.contains(self._cache_key(text, engine)) for engine in SERVER_AUDIO_TYPES)
+
+    def synthesize(self, text):
+        """取一个词的语音（命中本机缓存时不联网），Future 的结果为 clip"""
+        with self.lock:
+            future = self._inflight.get(text)
+            if future is None:
+                future = self._inflight[text] = self._executor.submit(self._fetch, text)
+                future.add_done_callback(lambda f: self._forget(text, f))
+        return future
+
+    def _forget(self, text, future):
+        with self.lock:
+            if self._inflight.get(text) is future:
+                del self._inflight[text]
+
+    def _fetch(self, text):
+        for engine in SERVER_AUDIO_TYPES:
+            clip = self.cache.get(self._cache_key(text, engine))
+            if clip is not None:
+                return clip
+        data, headers = self._get('/audio', text=text)
+        return self.cache.put(self._cache_key(text, headers.get('X-Engine', 'edge')), data)
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def server_main(argv):
+    """命令行启动教室服务器，不创建窗口"""
+    import argparse
+    parser = argparse.ArgumentParser(prog='word_announcer --server', description="在局域网内为多个播报器提供课文和语音")
+    parser.add_argument('--server', action='store_true', required=True)
+    parser.add_argument('--host', default='0.0.0.0', help="监听地址")
+    parser.add_argument('--port', type=int, default=SERVER_PORT)
+    parser.add_argument('--workbook', action='append', help="词表文件，可重复；默认 words.xlsx")
+    parser.add_argument('--folder', action='append', help="词表文件夹，可重复")
+    parser.add_argument('--concurrency', type=int, default=8, help="同时向 edge-tts 发出的请求数")
+    args = parser.parse_args(argv)
+
+    data_dir = get_app_data_dir()
+    cache = AudioCache(os.path.join(data_dir, 'tts_cache'))
+    # 服务器单独用一个词库，只提供这次指定的词表：上次运行留下的其他词表在导入后删除
+    word_bank = WordBank(os.path.join(data_dir, 'classroom_bank.sqlite3'),
+                         LessonCache(os.path.join(data_dir, 'lesson_cache')).load)
+    served = set()
+    workbooks = args.workbook or ([] if args.folder else ['words.xlsx'])
+    for path in workbooks:
+        try:
+            served.add(word_bank.import_file(path)[0])
+        except Exception as e:
+            print(f"读取Excel失败 {path}: {e}")
+    for folder in args.folder or []:
+        served.update(word_bank.import_folder(folder))
+    word_bank.keep_only(served)
+    print(f"词库中有 {word_bank.workbook_count()} 个词表")
+
+    synthesis = SynthesisService(cache, BackendHealth(), max_concurrency=args.concurrency)
+    classroom = ClassroomServer(word_bank, cache, synthesis, OfflineTTSWorker(cache))
+    try:
+        httpd = classroom.make_server(args.host, args.port)
+    except OSError as e:
+        print(f"无法监听 {args.host}:{args.port}: {e}")
+        return 1
+    print(f"教室服务器已启动: http://{args.host}:{httpd.server_address[1]}，按 Ctrl+C 停止")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        classroom.close()
+        word_bank.close()
+        print(f"已停止，统计: {classroom.snapshot()}")
+    return 0
+
+
+WORD_SPLIT_RE = re.compile(r'[ \t\u3000\r\n]+')
+
+
+def split_words(text):
+    return [word for word in WORD_SPLIT_RE.split(text) if word]
+
+
+class WordItem:
+    """词语列表中的一项及其播报状态"""
+    __slots__ = ('text', 'status', 'cached', 'attempts')
+
+    PENDING = 'pending'
+    PLAYING = 'playing'
+    DONE = 'done'
+
+    def __init__(self, text):
+        self.text = text
+        self.status = WordItem.PENDING
+        self.cached = None  # None 表示还没查过缓存
+        self.attempts = 0
+
+
+class WordListModel(QAbstractListModel):
+    """播报词语列表。视图只为可见行取数据，上万个词也不会卡；
+    修改时只重新切分被编辑的那一行"""
+
+    STATUS_TEXT = {WordItem.PENDING: '未播报', WordItem.PLAYING: '正在播报', WordItem.DONE: '已播报'}
+    # 播报状态只影响颜色和提示。QListView 收到 dataChanged 会把所有行重新布局一遍，
+    # 所以状态变化单独通知视图，只重绘对应的行（-1 表示全部）
+    row_state_changed = Signal(int)
+
+    def __init__(self, is_cached=None, parent=None):
+        super().__init__(parent)
+        self.items = []
+        self.is_cached = is_cached or (lambda text: False)
+        self.current_row = -1
+        self.locked = False  # 播报时禁止编辑，避免行号错位
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return item.text
+        if role == Qt.BackgroundRole and index.row() == self.current_row:
+            return QColor(255, 255, 0)  # 黄色高亮
+        if role == Qt.ForegroundRole and item.status == WordItem.DONE:
+            return QColor(136, 136, 136)
+        if role == Qt.ToolTipRole:
+            if item.cached is None:
+                item.cached = self.is_cached(item.text)
+            cached = '已缓存语音' if item.cached else '未缓存语音'
+            return f"{self.STATUS_TEXT[item.status]}，{cached}，已播报 {item.attempts} 遍"
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and not self.locked:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or self.locked:
+            return False
+        row = index.row()
+        words = split_words(str(value))
+        if not words:
+            self.remove_rows([row])
+            return True
+        if words[0] != self.items[row].text:
+            self.items[row] = WordItem(words[0])
+            self.dataChanged.emit(index, index)
+        # 一行里输入了多个词时拆成多行
+        self.insert_words(row + 1, words[1:])
+        return True
+
+    def set_words(self, words):
+        self.beginResetModel()
+        self.items = [WordItem(word) for word in words]
+        self.current_row = -1
+        self.endResetModel()
+
+    def insert_words(self, row, words):
+        if not words:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(words) - 1)
+        self.items[row:row] = [WordItem(word) for word in words]
+        self.endInsertRows()
+
+    def add_text(self, text):
+        """把输入的一段文本切分后追加到末尾，返回追加的词数"""
+        words = split_words(text)
+        self.insert_words(len(self.items), words)
+        return len(words)
+
+    def remove_rows(self, rows):
+        # 从后往前删除，连续的行合并成一次删除
+        rows = sorted(set(rows), reverse=True)
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.items[first:last + 1]
+            self.endRemoveRows()
+
+    def words(self):
+        return [item.text for item in self.items]
+
+    def _row_changed(self, row):
+        if 0 <= row < len(self.items):
+            self.row_state_changed.emit(row)
+
+    def set_current(self, row):
+        """高亮第 row 行，只通知新旧两行重绘；之前的当前行标记为已播报"""
+        previous = self.current_row
+        if 0 <= previous < len(self.items) and previous != row:
+            self.items[previous].status = WordItem.DONE
+        self.current_row = row
+        if 0 <= row < len(self.items):
+            self.items[row].status = WordItem.PLAYING
+        self._row_changed(previous)
+        self._row_changed(row)
+
+    def record_attempt(self, row):
+        """第 row 个词播完一遍"""
+        if 0 <= row < len(self.items):
+            item = self.items[row]
+            item.attempts += 1
+            item.cached = None
+            self._row_changed(row)
+
+    def reset_state(self):
+        for item in self.items:
+            item.status = WordItem.PENDING
+            item.attempts = 0
+            item.cached = None
+        self.current_row = -1
+        self.row_state_changed.emit(-1)
+
+
+class WordListView(QListView):
+    """词语列表视图，支持拖拽Excel文件加载，Delete 删除选中的词"""
 
-def get_embedded_icon():
-    # 这里是 app_icon_auto.ico 的 base64 内容
-    icon_b64 = '''
-    AAABAAcAEBAAAAAAIACSAwAAdgAAABgYAAAAACAAWgYAAAgEAAAgIAAAAAAgAHgIAABiCgAAMDAAAAAAIACaDwAA2hIAAEBAAAAAACAAzhMAAHQiAACAgAAAAAAgAB43AABCNgAAAAAAAAAAIACEdgAAYG0AAIlQTkcNChoKAAAADUlIRFIAAAAQAAAAEAgGAAAAH/P/YQAAA1lJREFUeJxdUl1om1UYfs7P931JkzT9kqbrzzpJtwzmqIr7aam1Hd0m7X4udChMcAwdUy+mXgqiQa8ELyaCFxtYUERlF+pgdReuY4ottlhZnaVsdYWahqapbUyTJvnyfeccOW0GwwPnPZz393mf9wUAiq1TB2BfIzeT+q398bCN1kf+b6OEAGgyjBdejG37sMW0mp5tjAW+ymY2Vj0v+/3y0htpext8Tw19QuojTf6BU4HKLyMbcm05W7519W2ZW77CFYDe+vC5882t8VTVUTtMU7wX31UHQuL3VjKv/N2+G/abH8Ul40qu54Sxc28d7ToaF8vpc5XxkStc4/irUp66nlsd+L1YlFPFgjFkR11PKTor5CQW51D5c/IkDFM6kzcMb+Guy3d1UpGZn9KxXIu4z7/vZKSRxQyTeEp6t4sFdsiO0gMGO7iQ6AQPR1h5epzQhphnRluYuedJ6t75db87PwuqOZgorH96KZOeTzuOe8SO8qVqVVxML6QmPDnM7v4xXPjuckrmstLaf4jL1Yxb+uHL++7cnYu6OKmhaKmxGrEo7XKk/AlACkDpoSk0wx8cRLk4BsAF0AbgJq0lOBXhvI0RMr3dsvr2hvy7LU5LSiWpUopyk5esRxJneajeBmXTzB9MAHjtAQXkgejvh+/RYN3XAJ6pqaK1SxBsf8e3oyOZTPZz4HlWQ0a0k0ZhMEocIfVQ0d13IHT2iUTw6ZjNY1qxkvNWZu7lb47+VvoGwBijBEIqXV1ucsAY8YRQ7YcPhi+9daZ16GhXGFaI6T3bqiMBpyjw40QeH3+evj46mX+VMZISQnGi+yTk/ZYzJxp/vvxBosMKUOHmPb2jxBVqM4PBiJJKKSPM4ZQkO//u3PwX1/7pUyq5RHQTPY8Hr90Y7jwOV1UhlemzDeQyDgL+rVY3ygJ2s4VKztWoqjCIeeTlmZHx6fUTXCl0XzjdOuhrs9zZ8X/Zt6NrYme7D7m8h9df2pruZ1eXYYcN3E9V8NzhCNvT0+BeON08OHZ7vZuGA+x4R5vFsjNFIxo2WM9jIVZ1JDvW28AyaYdlFh12rNfe1Gmb9tG+OkbHEstig80RPsAZpBSgEZsj5GdYzLoQUm4iYJRie5OBQllgLeeBMkhPgGbWvNH/ADh5XMnb8mOqAAAAAElFTkSuQmCCiVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAGIUlEQVR4nK1We4xU1Rn/nXPuvfPcmV3Y2cVlXZcWFBaWILVSIwEFDGkoIQVdoY0aY18UNSaa1D9Uqq0xEY1oorTa2GAJEImWSnxEHgFcQwSVDSxrKbsbHgvLsuw8787cO/ee8zXn3tmK/dubnDN3vvm+3+97ZwCAAeD6EowFB4AF4E4AMydkPJSL4HAOcBEeYGZN1/pWFuhy/RLgAlAAIgDuA5BOcL7yN9dNXXRq3LY/zedeBzAG4BCAo9oSwK0AFgOYbM1ftMGcNjtZ/uidw1QZ3wOgAOAfANzA8XsA0QHQS5y//+f2H6xqj0QR4xzLM80oug62jlxGezSKly9ekIcK+QVxAH7nbUcTd6/n8vJ5xJZ1QTS3wjm4G+RWIK8MobT1xX/RH55Yjb4+xgzG4BNNvzfTdGZnx1z55tB5dX/zFOEoxTljlBJCwTSrvYV8rPPrY5t1yI1bDjxmzltYUcWsRXaBQymGSFRV9r0rk/c8zLNPrRPOoQ9mMGH0G55SLM1YdrBSOd9XKrZ9ks+ykpK83jDxUMtUNuY4ooHI2pvPEYBeTeAeP0yifaZFxZzgmRaUP3gbyi5wr+8YqrMXcH/43DkAWeV7jHexLm4zlu0ZtwdPV8potSKU9X1ccB1sOn8WRSnhELH9+ZzO/akIcMrt6QZ5LlPlEuztr0COXgKV8hCNLSSHBuAP9g2CsSzr6uL/S9HaTNOZbTfOUg+c+TdmRuO8CsKVahUtEYvarIi3rH6SuP7Ykc2apemdrx5zez6TavSiKccuM56eDJgW5IV+lX7iVRQ2PcIrB3d/m6IUY7nT5XIxL2XqT23TYDBGUc6VAOiK7xlTrYi1Y/SKxh40dIq+3C+id64WavQSWH2jH9Sg6nBSkiu7CP/CgA2kssovBP1qBDewZlYs3n97Xeri2kwTDf9kIe2eNYdmx+PZJen6YQHsABBrBWJgbIc1b+Gw0X5TtuGZv1Pzu30UW7yKzI5bLhltN/4HwHIQaVhjYiDC0QifFIB7U9zQPf0agPaa7P8fLbsBwGYWS3ykbQDUBXMV037gO9hLtaIJPKQltanVV2zi++LQm3CS9bue5lCvPoTitWM8DmAYwBKNETDUBEc8YEACTBElpkejx29OJLMK6HiayDj0XQITShkQ4klrzoIxWNaTUEoEtVD+oG7nGibTRtqNvtrBH8OwJGk5g2pKR5wXxqu+IN1soTfa8WCBmdxhAEHpTQMZEAP/BPAxAGdixwVLqfapIRgRfCa0IVK1xTcfwHS9e2oR693UD6BH2wiO0dVrIHbtCnCoRqYjDSo9kaZgW3LOPKUCV3+WivMHb7s5vfTWzmT6phuimJwKmgLZoo/T5xwcPWkXPj9h7yuVvG0AdnPOoBTpKHRIAci1BEJw5klFs+vi/LX1a69b8qufN2PGtCgQ4dpAISSuBQ4OV/EzZx387f0RbNk5fKBUVo8Kzk7JkEReSyCEYJ6UtGLBnMT2t56bkeqcm5QoS1QriisKuzhsGmCiFpyBrBhXiAucPGGLXz/TX/yi1/6FEOxDKUOSYBgEZ75UtOiOW1L79rzRYSaT3B/P+YZp8sBZqSho1WsJFBGETgkBnqeQaDB821bGyt/3eQe/LC4TnB2WigxGtJHX1z+bakhETh7bMbe1scGQ8CFgMTglGYBG0gaooiD90HVhMLAYh1vwA7JonQCqpBtZXs354sfrTgzlxt3OfH5jkRvGc6pQwIbnH25rbWyJ+J6E6D5exN7P8oheH0UkY2HrrhEMjbjgJgvO0GU3kOnftI7W7e4pQttqDI2lMTW2ISVZP2yN/nLVHZPIuepxbnEk6ww8unEA3b02RkerGBhysHLpJLhu0O9IpA1s/+Qqvui1kclY2HNgDG8/Ox2kAI2hsTTmwJCzSWd1zm/XNH/1ly2zTGS9sJJxAW/ExXt7x1CXEFjx00w4x16tuiYDfODDj0dRGpdYc9dkmFMiwLgMCzTJxO/Wf+P99b2RH2mCZbfPq9u7dGED/LJE0MtEiJgcqaSefiBf0huZwGpVJqJAr74uXElFW8KtqtBWEYy4wP7uHD7vKd2lLfSy0v8Srh247+PR+Tz6X/1WuIs9rDRhAAAAAElFTkSuQmCCiVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAIP0lEQVR4nLVWfWxcRxH/7e577/zOPt/5bJ/zAYkVhzgJTUMgNI7SCpJSkbZpIiVpIW3aQCkFKQHKh/j4h0IFlSihUdT0j0pQlKIqQUVAqpQCFYWUhtilxbSpaBKSym1Caju24/PZ9/He2x00796dz1dTyh+sNNrd2dmd2dn5zQ4AyBqyuRcoNynCUYIpGiNaq8rOGEcykLK6LxojWqvfJypMJsWzSDy1GGgG8KOYlAMxIQd4HPFS1Z2ACokPLytIIb043CdsZ4CJxxEvVSOnavSCOVZ06fUA+pKWNQjg/KZ0K51b3RMSj5mXtmxe64tkK20D82RzS7gvdtXHqP2nvSHF1lwX7pNNyfp9rFOEygnQDUCXo9Qrjyxe4m5Mt6F/ModlDa7OOI5UQmDY88wLkzm1KpHAc+PjuPvs6YJ2nCV8UhHyTPKLP3Sdlevgn3kZdvcqLZNpCTIwl0dMcOGsspesRKn398g+9I0CmeBKFIvnIET4QNIWgkrAtlvbO9wd71noHRu/TIExZq4bV5pIjAeBaFJKbUq3mpRUtGPuPO/2TIdbKBQ2mkJho3vtdje++U5PNMQp1nOdEQ1xRVMTAloLNb9TQQfG63+eGj+x23PXb3VRKm0Vls2eURXXh09hQBx58tDIkGhRtogphSHPw9a2dhS0xngQSE2ERkMyioJKvIICT8L3BOWyAkpCJFIoHjsC1TYXxeNPSTM5gcabPy1hzIx9EoD2iUSqoeHQz4aHRnuHh9V8J0ZzHAdHR0fw5NgINICc1rCFQKtt01Mjw+rg0OBoWzx+VLW1HS088/PR4h9/rURzmmBZoPxkeHip7xkU//I0ZEsHVOscKjz7G1V49hejDanUYQp8NkJXPUBEVau4GQLiSmGRcrH/wnkM+SXc39kVGsIXIPbWtPNC8FJhEiLmYvKxByBbMlAdC8qgpvDWszbJ78AxkC2VPnl7pqO1J9Oh3yyVRN5oTGiNKa1x0SvBI8L3zr+B3efOiBvnzdc7M3NaR/L5Tf7IyI3uhm2t8S079cTD3xKTj+9ln8KMDYJKedBUDlTMQ1+6KNwNN2h3w/bW4vj4jtligCTfxBhza3uG5toxymktfTLhg9lSwpXSDHqNAkQmyhfcixBMAQxDTqU7iEoFSTpgt0IoGyLeZPTYkCAfJkpMVZcItoIAUw/Dl3ITWNOU0AnHCXfkPM/0TebU6kQznh4bwefOnikEtTD8wg/cWM/H4Z/uh939AS1TbWyoMNlR45/qV/bSD6LU+zuGYZFMsCKCoapPRGFCSVrWWwDevL6llc58aE1IPGZetNZbl4h43CubkuG+2OoN1P7j4yHxmHnRGieia2oTEWpzcm0qXgQkAexzpLzoCMlZbH+UilveIRW3oGUR73tI2M6gsJ0LfEbEK6fi5cudGu/L6jMAyACYD6Cj7jOyQ4H/5TOaDq2mus9oGYBXACytAABRawHwEoDXAbwYzSsC7wPwNQDvr3Fd7Q9a/cwi4vXPA7gzUso3FtGZf+dgj/rUDChGHpgT9fw/8CbXlfKfd82ZR9zz/N6ZymrJKWd2fNZZuY6YANwd8dgIGd28v9YDsgJBAMMABqPefGc6XVJ5uRysRyO3CQFdS8zbfvhwxQNVaNeNT0UBeyqaU8UD9beqfR92/TfRgIWWElCqDHsAcQDpiOLM4+uwjAR28u2jm9f+/ZUzqzwxHfhva8wnJYXmSsXT1AXgegBrAXS7MZlpiEk2AsWSyRdKhj13GsAJAL9USl4kIhhDrEzUJB9R6xnxHwzgoPcZBdrQLQB2d85vuPraNUl59aoElnW6yKRtxGPlrfmSwfCYj9cGCni+P4c/9GUx8K/icwAOKCmeMEScFBkp4VPVNjGLAUpK4RtDVwHYu25V8zVfum0uNq5LIdFmB6GEZyQCzp9RnEgQLAE4MuTkLvnWb4+PY//jb+F4/8SfGUVSiheMobcZIeoMUEoJX2vak262Hnzgq532Z7Zl+B+GyWnpBeUfM3w4IWqjNMz7/INycyxBMqEMPMJPfjWsvr53wB+bCL6ilDig9UwjRI0BSknha0PfXbE4/u0n9nVT97JG440Git9Symrw/ddG7BxDobzTauvTr03Jm798Wpw8m79PKXFvrRGikgmVFIE2tPuKxfEDxw5eEaSTtspPBMK2Zirmw8ONdcbMxmeeHxDizRaNZX39kV2vWq+eze9RUjysDTFcdbkoJdKNjc6VMYte/OuhFaJrYVwWcoFwY5KDsFxPRLErJJf9XO7VQpxvIMJb18sqKVAoGbgJi869kTerd5wkLxAfnpryXhZChImILEtSPu/v+/6eBVbX0kaEN3ckLucCcAHEFaDvU9gHGhjPBTVVXVkh84JZZPkMPqswEQg++/49C6x83n+QdYY1CONca+rp7nTX37UtY/yxQLHlVrPCo0cu4aZ7TsFudeC222G/+Z5TId9qthBoCslqtvHokeFwbXZZFRrJZ7MO1sU6WbeMPqtbbruhjeykZdh6xr+fDXDHlnYMX/bRs/lv2HPf62HPc+b7EwEEI4FlJ5iXiWT7sTuU7Z+WzQbhs/HZrIN1sU7WLViZITre+9iKtWvWJrXOBgzFct5yBJfMOPjkMP5xroDlXS52bc5wEQmGWBU/s8kucrFry0xZjhuVtHTfiazquePkCSnEOssQJdyY7GqMSzE+6Fmexx7gCBIgU4bfp27KQHKQacLlbFCGWFjtTof+u5E1JOAUjNUYl2CdhZJJcCg1S4E/JRPWe6NfbQbAKphmVWHSeId88C5lOa2obC44bwgfrSxzqdVQW63+nxs/XpFr3X8DGFLKn168HQ4AAAAASUVORK5CYIKJUE5HDQoaCgAAAA1JSERSAAAAMAAAADAIBgAAAFcC+YcAAA9hSURBVHiczVoJkFXVmf7Oucvrt3a/169pGgRaFgVkURQkZAwC4h5MnAVjVDIVJzPR4MKo4zJlp6mKGiFCopRLaVlMjUlIYipQxmVE1JgiOjggyBYR6GZrmm5eL2/r9+4990z95937uP3oJk2sZOZUnbr3neU7/3b+/z/nPgaAY/DC3KcEoAGwvEZqcIsBQFSMxdligjFAyrPFlGwQBqiNlcFLC4lkKNTQmctdCWA0gMPJUOitzlyuzev3LU4LOkPBRDLZgM7OMiaSybfQ2TlUzDKwv+qemL7T0BC6OBJJcjAYnN8EoIOA4rpBYFQ7qJ36aRyN90Tm4vTDVFK+/voQzrs4Cc4BbpQxebSmjKnaqZ/G0XiadzqmV/v9IK4RAMYBeBnAQXeBj0kal8Wq5YfTZ1iHZ37Joif9dqX0sTuOxr/szvekrDARCFRibqG55gWXytrVv7WGvfKJRU9zyqUe5hZ3XIuaV5rvYZZp9psQPYUBTLaAd2KaXv8PdXWIGwbeTqVgS4n3pl0ka3WDZYWNsKYjZVty7o5tLMA5FsYT6LSKWNfRgbSw2w1ggQXsLhmAMRmW9Q4LReqDX1kEXlOHwsfvQlpF1K74tWSxBJP5DFgwAtmbkicfuJExTUfg4nlwelPI/249ZC7TDsNYAMva7TKhzMnPAJNNTZI3N7833DQve2vK9OLUSNRQqrRt2WFZLKpprM9xoDEGISWqOEdGCBnkXIZ1gxHap5m0deXO7WZ7sfiBI+VcBcz5+1q87rL4Y+uKxoRpBhwJJ9sjZV+esWCYoVgANA0QNmBWQeYzklfXSh6uZrLYB+vzHVbq4cWm09XxQdOjzuXNzcqmpJ8BqvZw05x8vFjcufLccfJfRzXyrmIB2zIZGJxhViSKvOOAM1bmWLkRxuBIqTRENRmowo8Otzj3HdzPRgcC49pr6lFoP3Qg9k+POpGbl3HRfqRErKZDCUeI0t5QgBKQjmLC/uNWSFvAGH8BeG0DMj9d5aRfXM7MxPApxdTx3e5+cEqby+WkS4gR9DolFJaWsFGt6bjrwD7Vv3PGTLUOiZm0QOOpkibU7mJKAbCFjSmhsGrrEKJO9JIZQ+pjJsLJpQGdCC9tC/iJJ7xAFeA4gG6i55kH1QrJZzdB5tIwGieqISLbNQKM7fZcbtmF0s+4ph2j909zWW5oOiQkglxTpkKL3vH5Pty5/zOEOIflStxjBK5R6rqu5lNznaZ1aLE64oDZLXs4D0X9vr5EvCOU6bBAEL3PPITeNQ+BVwXBjCqXIQEWisBq2aNo1cLxY34M7ltba3voob0M2PjU0cPY2tstONcgIJWJ0GIf9Hbj9709ymxqdA01uqEYV25DSsXYtp4e8dTRI8TUO60PPtha+JfWVjD2TvbXL6C4a4sgQpWUaZaUYJEasHC1Mqfirv9WVZkXmZIQijFr1xZB88HYxuLStr3+TewPYpw1NzsRTVvdVizivpb9jHGuiPf4jWo6wqR+xvH0saN4pu0IAoxBY6W9QN7ogZb9rK1YQETTVhEempmjBSOrRKod6ZeWMyVV0ijTADOA3PqXkNvwEphhglWFwIJkfu6KxCBp5sXlzEm1QwtGVhOen24/A45sauIZIe5pMANY2ThOSrVpT5mIcM2GCPjJsaP48bEjMLmGLstGj7BRkBIrGsdJmp8R4l7CQ5PkIp+5lyfqEb39UUleRWbTkJluMIMYeFFVelfmpLRzysRkoQ+x25uklqiHyGfuITx/RO4XAxoef3yiBK5YNvIczIjVaI4joNG2dTkgZlTkAJDQdcRJ1ZqGWz7bg9s+26tALoxVa8tGnEMyXDDmiSfGBJ4bMwZSLojc+M8wJl1C6kP3yqXoXrG0ZOvRarBovCR15SXcBejJNchCDsYFl2jhG79DGrnCfLphohvoFO2eF2I+LySnlrwQ18GU6/Q8TU44ZXWkyYO45WixAEonaDx5r6nhMEmI9fNCjROlzKY52bdzsh2Q5IE4ZC5b9oOykC+7BPXuOg+ZzUBvnKRMx+eFmJ8B6Xmh40JgVy6Lq2rrQHHgJ2MnKBdZsC08N/48MMaQty08P+F8tT+o/aUJE5VpdQsbcTOAnSWilBdqj9XBzh9iVsteGZhzDZyTbYh973FQpHXS3Yh97wmFSRG3eumTkFLCSfcgtvRJtYlltkfFAbuF9i4keSFROO45zrOLxHWGySzHQZ90UMU4JXg4YRXlMEruDJ2R/VIkvmrndvN4RSTm8brLEhSJx08zmFmlIrHTfZLxeB2DVQDtDWqHEYDTdULymqTkkWpGe8Dat8PqemSxKVQkfvTy5ubm0yLxablQVNPrF1MupBt4u6uUC22aeqGsMwxGphTSODosS8779BNGGroynkCXZWFd5wkyr3YTmF8E9pyeC90AHkug8D/vQto2Ej/8leTVCSb7csoLOT0nZerf/q6UC10yH07vSeTf30DpxYC50GDZ6NiBMse/iVXLP0ybYR2a+SWLnvS7InP0slGaX5mNDohpXjBL1q56rZSNrnrNot8DYcI0z/dhnjGdNjzV3FJfH54Zjdb6zgPtpLoaXffi14k/6zwwcWat7zzQrs4DkfJ54ET5PEDjFi4M+9ONM6XTKhb4R1ZMUieyVC53tQM0cuBwPBh8/WQ+f+wLncgSiZFIdV8DOCMBfgjJxJsDnMgCAB4B8K5b9YFMiCbEANQAqCanBCDo41hpxtOOTyamb36legeqmq+aZZT+UjZ8mgu4x00SyhoAIbetbEJuaohaACl3YNF9NlcQqUwhAkwOa9rlLtBAdjnUCgSDsxAMznZlYvhMz2Pu+y4tWVcjnS6tZdo91YZdNf0AwHIAjwNY4PbpvphxO4C8C7rZBfMkO1TCvbEvuDjSfff36e7a8wE85Y75AwDKs6N+D+qB9tNhhe2q/oX19cRk29dqk/LVSVP6dMYoMbmHApFPS3+qKkHoweBMIip66wMieuv9JFnptqluv1d0C1nHsgoTY+UDjU+F/kIbRaUF/rsZ/yWN11lRBhPGAPc70mf/dNuRrxyvu4xMcE2bBGX71xmq2gczoaRvs5k+1Q/ElO6OCbjCesFnQs//CVP0yhmvVYZiu2SA50d0fa7rpU4ljxzQOMPHz19sLJpTG509OZagSu/URn3qKOBnLxicjWDw0kGIG8h79Wsf7GbuTIUkV/CI/uYV9eH1H56cmk7bswBMR+lOaLi70TwvRePTbtD6HMD2aFTfcsPs2h2vbGzPusmuR6BnHkMqZ8OAF1icpqa5+oonfj8/VxB/73qqcymXG90QQOPIKoyqN5Go1hEKlKBzBQepHhuH24toOdqHQ20FWLaiugXAplBIW5fN/vtGxpq905Y/iH1hBrwxVlMT9Mce49+wLGcpgJnDkyYWzqnGlbNr5KVTwmL0iAACIZ3OmKVY1/9qVtLBopizZWtbER99mtHe/rCH/dfmbhzvpL2JLYbBn374Yednzc1KC6Rp9/D85zOgMlQCCYe1K7JZQTFi1qypUXx3cb1zw+VxJ15nckhwFCQcy4EtZOl6Z4CFiC1dY+AGBwLqrOp0dRSd9e918ed+0c4/2kFWhi3hsPZINivedqf1yzzPhgF19T1+PAL79+OHUuLuSWODaL5jtPjbhQnGAxqXOYFisYTNeOnoOZj/9Ios31+VWDRNDhbSgIJwfrkxJZvWHNL2HMgT1o9Hj8aDra3o8123D5kBRXw8jlFdXfg5gDnLloxwlt85CuGYwa1eG8KRyuP0T2HOvkiJMpYR05HttZymNYfxo7XHiK7N8XjVTV1dfYcHY2IgBui3HY2aE9Lp4puxiDZ27Q8m2F+7JqmLXlttPjKDv0SxRelgp8V0/OaNTnvJI/v03ow4EI2aV6fTxX2VWehADKjbwkQQ56Ty+F19wjj39Wcn2TMuiun5k5Yi/ItKfCgasYVEsNbA1m299rXf3aO3p6yDiQS+kkrhiGsd5S1WSTybO3dMVXcfezUW0c5947lJ9ozpMT3faSnJ/KWJp0Jr0Fq0Jq39xrOTbKKlu4u9evXV4wOV2bxfA+T8LJ2zVZaQ96xffb616No6QxFvuFcdLt+DMeLeQJ6xnGmMrMC3LIlg0sCGNzqsG+7+o2FobLXtyHulPLUfPOKVn49E9NmWkHffdXODWHTdMGU2HvFUSDLK/gfxzDT2TAxQ3Pfj9Suy5GJpDa/QWBLgomuH6XfdPFwQbUSje6rjfg0wzpmQUm4aOSwwb/dvpougyTW66fNu4qj0ZAR0nSFUxZW0qE+5RTcl7UnbCIc0mETkAIGgaElkcwI1Ub2kCV4igDwqMZ7rc+gGB9WRU1k09dF1bL7giMlf/0Q7eqK4iTG2wHGk2gvlsF0d1uZIiXn33zbCiSZMzS7KMvHk5vSIhm8378fcb++CES4RKYSEsCXMehMb3k+h8bqtIB+uB7ia4xU1P8BVH41Z/35KzRG2VBiERZiETWvQWjSHEIgGoiWaNLX7bxtJd2nziVbverGUjjKGrrT9rWSNgVu/Wus4WQHuc5WebX59QQLbP8vigScPIm1JBCI6qiIaPtrcjTseO4iGpInJ54Vg95W+5HiF3qmN+mgMjaU5VRFNYRAWYRI2reGt6SEQLU5G4NavJp3aGkPR6uKXcpamJWMCzWtb9958bXLMK6smOoUui2sVvp4AjaCG+1e2YOXaowhWcUwaG0JvRuDzQ3mMGh7Ab9dMwpQJIRTzQgUmfyGJmkENO/flcN2de3D4eAHjR1chFtGx50AO+T4H931rJFbc1wgrJ07bS6SpQNxwvnnvXv7T1ztbm5aMmdi8trWgxiVrjOkd3da2F5vG4R9vamCF7pLPr9hjqpghDe9+2I3/fK1DEVMd1XHVl2uwZFEdknEDhZwAryC+bM+ORCCkobPLwn9s6MCbm7vR02srpm+5vg7zZtegmCsF20oEig2BGgMvr2uTt39/P+pqjIs6uq3t6jjLGBZLiZ9v/dk0ceH0qKZMqJII91BJRPCIDtBGFe7uI0PMCJXMKdMbLH9UX5RkKZmjjeq4qqU5loSTsUvrVvyXwWOehzV8sj0tZnxjh+bS/AtdpYSObAhWcTsQ4HZPqiitgnR3x8BF9NjqFpkWU4mZlNC8QDeEf0qo/KdDqltp9ZnMKb3Tx8vBCn33MAoCRGNVgMt8nzOC5ui0OF1i9RUc/ctLdupDIuL/qjDFvN5XUOlQnGj3DuCv0Nejrl51mvsrJAxfqEj3uc7zQmQspc/2/99Jd4v/K+v/AqCy60RYAaXBAAAAAElFTkSuQmCCiVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAATlUlEQVR4nN1aa5BcxXX+Tve989qdndWuVm8krdADoSdgBSMEDo7LqApDjJATkQoyYEhMxRAeMfxQCSHAP3gFR1QBZWzAciooiYBAcFk4jp3wBoPQ00JIQi+QVtKudmcfs7tzb3enTt97Z2dHM7urF+Ccqt6d2/f2OX1Onz6vbgIgcGJAACQAFTaEz1GfOUG8nys9Og4B8LcICfEYP3qRAWr5fxZoK/reAaBLxh3v3KJxFOIKcGQylh6y2WJ6sujb46InBmiMNBb+L2aMIeEAtwmitwEc4sa/uQ9AsuRblOA6EXpJCOc2CFGgZ39z34nTEwMJoBiZXeUaoC58HCdA74VSNmkpTVo69jc3AfC7cfwhj4k0pISpAenZVc5khkX0QH30KFVtW/QcvrP0UFNTV9CQgenZVmkLRCqedCBu0mQWa2Mmcb8AtkiiMZ4x06anUt594xvlOdVpq3YfdnaY5ft2q225nOsSbVfGHNDATFZfQfSJMLTWh34CQHfRFimml4Jwvg/oxdDa0gOJLSTFGOP705wzpnjppXdJZ8osS8/fudl0rH5A+ft2uOS4241SB2C0pQchPgHEWmi/HL0CUBkBUGhUJgjQ8xrmPO5My0ArO1RgfyYnk/r12eeKUbEYupWygxJS4lA+jwWb1uud3d2i3DgB+kDDXAVgb5GqW3ogeh4moEepavvC5DqDJRzTqOsfeUmI4aOgwz6RSkM3N6Hljiu0f2C3KDcORB/A9KNnBhIAhR8kBfCmBubMTFXlV05odOZWVRO/eLcjq19obqYfjBkrvpapxVHPQ4z1AkBea9S5Ll7LtuGxA5/pq4Y3mPNragRj3NDVaVbs3e1vyXXFBNEGbcyCcGUYkiB6A8bMdSZMzaevuctxJs8kEMHb9oHueeMVSl1+vYjPmQ/dfhSQbjDK9yAydejd9BZyLz2tExddZtxp59nJ+Lu2mI5fPOj7e7fHQLQBffQiHssKgCXkxYS43dP6kbNTVd5vZ811R8Ri6FEKLhEkM2sAT2t0awVBkdENQBuDpJRwidEa9GptqbF2HM7nccnmDd62XJcrhbjD1/ofg+V1bodSjzjjp3r1D6x1Rd1I6O5OgAQoFg8Qe3mY3p5gE/YjqEHxBODGQULCeD0wvg+RrII+ehgtdy7y/P07XEh5B3yf6blFbhSl6s8vhG/MEgPoeydMFMx8Sz6PvNE4kM9jb0832nwP3UaDiI7xNSyQbq2R9T1kfR95Y+AZg+Z8HozrvgkTBePWAQ3CihUCWi+BMTq99IdC1I+Cbj0M+H7AdGc2aPkyzBvGQDD5XpiOVqiDu6FbDtlxjEPUjUD10jsF44bWfxnyW2AeZdRfZzKZGm3MhLSU4pyqtOD9nZLS7uELN63HRZs+RJdWiBHBIbJaUQrWn7G2EFmk3HibsBYxTsbNNEY0NFTh8cdT0HqiSFYL58xZwuQ6ACdmGbNNyKBZjSoBxwWkA3IcmN5utPzwSrTc8ecwPV1APAnG5U6eJUSyioU8EZlMTUlsgv6upwxEkQULu9nzgj4T9PMzv8s4Th/GoUPJkBDpUMEYGLYHxoBq6ux/nW0pvCvZ6hErx4Ao+UBks9l2QbS3QymzvrND8+orJsKbJ1x1bu2+j/mb1tvWrnzb1xeqHQuMg+0A42TcgmjPkSNHunD4cBeE2KO7u4y3a5OmVBrQqiLTds9LCdPdiZbbr2APENgL6QSNtYJnqxUYl7dzk2bcEGIfstlsyHNhmqKEhAx99hpWwOX79qCpN4+EEAXmimXLGsDNCjwUULktwWNTQlgXuXzfbh5PTCMMYnhya9igdK5+EKr5ICieBMwxLjtgLmKQV7y9JVj1aAJWNbmxYUxCtzShc/VDvJVIMI1g2sVRJkoFwFSFr/UTRPTWtlyXXLh1o2KjVmrtI43gdoxAilRKhxQZx8ItGzlIkoybaRQiMt9/Aty3b4dsXXa1DgyeDIRQxByrfKT2dgYFgZRoiRDWaLYsu1r7+z6WjFszjTJG0MHgUOC8VL0jjWBjx9uAtwN//Pbsc1HvugVrw67xmC1fkVrRd6G/Z2+jO1qtyjPF+lXrAA6wdBktOWaGA4MotwUcIW4yxsyfnqpS62bMFkneAqEdKDvnIiNZMJQAWjzPNp9jA0FYN3OOnJ5KKcYdE+KmUEG0cJybYMx8Z/xUNexHzwmKJQDlW9dWWPFyKl9JgGwnYgnU/+g54Yyfohg3mEafQlYUgM99oY82942fiFHxOHp4C4SMFguh+Dlyda4Q1iB2KN+6zQWh2+R4YCTHAeMbrb3nWMMOM4Z0EAeY9NI7IetGwvh5mJ6cdWnc+owcq3ysP7PFGhM9k4DpzUHUj+Y4gAVmbKzBMccAW4D4ZSaTqc1msxwH0LnVaZFTyqo4y5wDmkjtET5Hqx2FwtEzvzqYz4dbAFYojItxVktJnUpNbGhoqDoyYgSv2ESRrCJnchgHCMciUEcP9Rk2uzz5kuXyjn22AmE74ARxwJmzOQ4g3d01HqtWpYOyRV9O4JRqkBAcqPWXSvR/uOsGXiCkwc+R4BkKz+Gf0bEY2EQW4yjSGkunAcCR0knwKw6k6kYGhjAcIDL1fStd8TnSipCNQUwPlUuHBdE72pjznp8+wywaPkJyKMyqzaEtR/YZjr4I6PADbeJAiIHfRxkgk88qn7M/+55zh/pYDC80H1ZXbdvKbvADZcz5dn5CvAutz6td/lOTvOgKaUNh6doVtC6NYwNWa94KNuNLhxlfR/CcrA68RK49yB/4vfLAOUX3/76k2u6/gSDE+1i+/AKsXNmPV6eEd5sMsY82xsy7e+8eb0FNrYySoTGxWF8yZDRch6x7ZCMXaQAbSxYWJ0O1rgultd0qNbGYTYbu3rtHE+DaWIP3ZqB1a7Qx8zpXP+TFZ5wvg2SoC6J+pDVmhlNprzew/OweVSBoGwFywMOu0I1D1NZb92eToZphYRzwICctro01Vq7UpckQVUqHCXjDAHNnpKq8lRMa5TnF6XBLM/1g9FhxcZgOx8MkpbcoHV5l0+Hh5qvpjK26FKfDBNpgUCEdHj81n156l+OcOYN1Gd5HnA7/klJXXC/isy8I0uHIEPp5iJowHX75aZ1YcJlxp58nYChIh22x5GP3eNLh4uoMF0TWapivcGearTBM/4LIrHPFqHigHQwc6jbl87ho43q9sycoiFRLaYkUFUTe1zCLKxRE1sIE9Gxhg+1fqPbOmIm67pGXhRw+2hZErC1JVUM3H2BPof0De0RhO1C/gsj7MP3oDVgQKa0KlZbEOCfbGpXEzkqmvHsnNMpzw5LY+s4Oc/e+3eqjoZXEiidTKMFBsL8ulMQIJLaSlGOM701zzpjsVV9zl3TDkpi3Y7Pp/MUDyt+/0yXH2W6U5pLYDIu3ryT2JIBcpZLYyRRF3408XrWUtvUVRe27sSddFOUCZ0gP1EePktW2FRVF3x2kKDoQnyhXmo4aTypeMrlCmdoBbhVEbwJo4iaI3grL4omSb09FWTwB4dwKIQr0IMRbA5TFnXAe9WFzytGmCglROZCDHIxQFmg9jQcjfRHc4AcjFM6P/eXm8P0sNkWldoDKeIGakpw5OpVpL2EiGmtKjqZ4NThEGyxTOZljsciSVzoa43lVhSu/JexjW8QVk67SuYmi1a0LrSUz2xa29rAv2o+lahQNrKkPJF6M91S1EBqqgfp0iVBKt1DEx55wxf2wdYR9/fgQJ7kqCPfZo0eBrS3AHwD8uMgGnEClrDIN4Mg2oCWiwbbpOPLsyiBKJDgsVJ26sNWHfaXSjgwOT4ZLXLaFk+I+hFHXyax8PxrgPCXIVQajweMyACaFLjAX/s6U8UCooG6DCoolwwFAU0wI/43Z5/ivzz7Hj5Hwua++vqCqgx1ODuQRAMZD1ERuzK9/+CXb+Df3oTKNaCukQ7XnVvZbpwyj/QoGRVDRihfHllQhqzwtUJlGZCA54LJHbWWCrz40J9jcflsgbCXqWelUVlZoA9IAld0CFU9+SzS64ntxEioqQmP0KID9YXs07IsCKTcMbmJFk624puE30fduiKcSjeJ5DDTPit/QIBMaClifGrnAlsDdMBOMu6RkE8C4cUjmcnA9L1hh14WXSsH79NNCdlhOMBqoqwHY0LYEhYCTnztOhQAif8y+trhihkwGtb29ztlk9Gylzdla4Uxfm1GhNa4qUvF8aKmzjqAmIfGJFPQHQ2JjPO5vy2b7RZgUrj4L13zRAqBwfMQ84nFMBsQ3lTKX+r6ZB2B06aB4TCDmEBwnMJm+b5D3DXrzZYPHg45Dv5eSXjVG/1c+jx1FtKNw23wRApBFjMdjMVyuNV3r++brUXISjwtMb0yaudOq9KzJKTP5jASNbnCptsZBMiaIhcDAzHfntWlr93Gw2TO79veYTTtztOGjLrFtdzf19hYE0+049FshzLP5PF4B0FMkCPV5CYCKko2E62KpUnSz1oZjbQzLOPjG+Rl12cXDcMGcGjFpbJycFJ/uhuVhxS38XQxsjqwJ5P9c0QD8nMInn/Watze161++1mp+807Wac0GOZgQtEVK85jnYXUoiKBic5zaQMcpAFsztD8kvg3QPUqZOfw8Z1qVun7RCCy6pF6MGxfnYiHXyODnNZQKyulWcuGf0vjVzpoLm+EhsTUskuC4AkiwgzX4dH+vefF/WvTPnj+Mjdu7bLwiJW0EzD1K4T9CVP1qfqdSAE5orEY7kh72lfkr7pw7vUrd9b2xtOhP60WsWgLdCqyyNmcWgRxOBlhRtA5OpXhLISWR71R48Xct+oGffWY+3BYIwpH0L74y/8A243iEQEMUQLTy33QkPeUrM7427eh7/u4M/O3iUSJRJeB3KvjKQAp7tee0AGuH0oaZhZOW6OnS+Mm/N+kVj+9HW7svHEn7fGVuBPDroQqBBhFA9N4TAjcD9GOtjVg4v9ZftWySM2VKCn7Wt4zzpD5PiGg6NQ527Mrhlh994q97s82RgrSBuVVrPDYUu0CDCMCuPBHuBbCct+iyvxln7rt5vCAN9ORUwZV9UeD5BsmUtHH43Y/t0/f/5FM+TOZJ3WcM7h5ME2gAAfRjXhD5T608U163ZBTlW3173sjq/mUA3hbMdWyYg2fWNJkbV+xS2hhHAPcrg+UDCYEqCCA4IRK4BaB/4sOfNQ9OlYuvaKDuZs+q3una5ydjH3hbJIe7WPvyEbPkzo/5Vg6fsv691lhVSQhURgA2spMS3yDQr31l9LP3TRbfXTKaupvz9jjsywx2SwyP4edrDpprl+/UjiQyylyqgN+UOxsQJeOjAmgDgZ7xlaFlN46jPxbmGXiOPFee87IbxpHP97EkPRMeRPe7IldOA+zqO5Ke9ZX57iXzMuq/n54h8zm+I9T/LgJDdGw/2HYY6nenCq+9TGaAWJXAn12/Vf3uvax0JP3cV+baUi2gIgHYfe84WKA1vZ5KCPX+c7PF1MYk5XPKRmWlYD1AuPcGAusiKUh6hgKnAi8bxlhS4uPd3eYrV2/SuR4thZAX+77/erE9EEVjQqnQSo68brtmNKZNr6LervLMs4SPtHpoybJHqOBpw8sdzVnfflsa/peDCG/zQHgxOF72UDx35oF5YZ4AdU9/XlEQAP9XCQcXcjY3os7Vt1w9WqoOBVHCfHALjdDTq7Hguq2YsXiDnYiIkTVA0Y0W/i1cwpGsj5mLN9pveQyPLXfHqRTvzMUb7FjGcQxeJ8K7YUC8PHfVqcC8ME/KN19PJDA/uhONIgFYLjXoe/z/+itH6OFj4vDywd7vB1blNNJ1LhrHxnGoxcNDqw9AVEsk0xKuS7bxb5GWeHj1ARxqyaNxXNyO4bFlK/mV8KbL4K2O8HpoHJuoiJfn7vVqMC/XfXuE1QHt0w3FPFN0tMTVm/Z2fORIGrl+zWw9Y2qVyHdryDJRgt1fKYn3Nnbg4uu2IO8ZLFk4HN9fMgpTxgZnIjs+68GTa5qwZl0zYi7htWdm4U/mVMPakwoBVIT33Y0d+NpAeP+1CWt+NTS8SgOxpMDm7V1sC9grHKqtxbTWVntZStgLn2z8UnG5MNerfjVvZrV+559nC8XVmcDGlAWtDGI1Dl58tQU3rtyJlrYgT08m+FYQkOsJtll9rYOnVkzGlZfWI9/uH7OlKuNtxo0rd5003iDNht2iF/z1Zv37LZ0i5PVV6zUjVVBa8xUSc8m8jOabkb09Cu4Ak2WCve2+ncDcs1L46QuHse7NNuz5jGsTwPRJKVx6YS1uWDQCjROS9ttyxrQy3uGYe1aVxfvqm23YHeI9a1IKC48Dr63cKAM36YB5YwGEvLIArAdlIfiOoP/0tfnWvz04VS3+VoPsyfpDyvC42JHggkVSQHVpTkttP5e9ZJXgS8Lo6dFDYv504WUBJDIO1r5yRP3FnR9Lx6FXfN9czrxb6/+d70AqbSbwhmC/b4sPbHScwRtPkq/yscfgudTXubbxb+7jd/zNUHCdLrzMC/M0dWKScyaOGyasCG+NOqz2r702MmFwKJOIC8OXQo82542X50OYIS5XWMMqdUOF+4onGkGfIrx8gdXNKXvVkHns7tGZJ598kgu3XREKPgXeT4RUbTq4BPn/EViQbR02wOIziDMAHI2OqvjWxBvG4Kut7fYC7kmfuHxJIboo+U7Isyi+5sL/69LpU3q15UsHHR2Wz6NRZkhFq33cNfU/YojONsz/Aem5vqUOvgtIAAAAAElFTkSuQmCCiVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAAA25UlEQVR4nO19CZxcRbX3v+693T1b9+yZJCBCyMYkbEkwCQEmAioiqxiRiDxQxCeoiE8B4XuG+JQPFXf0CX5sD/RJAsquIgrxCYgsQZZJgBCQJSGZSTL70sut7/c/t6rnTqdnpmdLBl/uL53uqXtvbafqnH+dc+oUAGDFihUOAH7UsmXL3D1py/7XpDnmBy+9bNkyZ/Xq1ZndlOazco2NjSqcNoHqlxmjtqGhocGdIG3z7UhAeGTswjRn+vTpMX4rpcCP1FRr/nDq6+ujDQ0NXu7I3c11RoFpav78+REAEd6zbbPfTGP72M7dXeddWZji34ao2U7htffeexcDqIzH49UAisKdZTrSmaCERr6BbeocJnqRaVslf+cMCJd9YgfOPyvxJS3cMQDmAPgqgHsBrAewFcAW85tplwGYax827050buCFBrZt3z0AXjRt22J+32PaNyc0ELxdXWeMxyznd/h3HuLPBPBfALrJ8flROR+bDqAHwC3mHRi2KZzEzhjDUYSVjvMsUuG2WfEUes5ytRmmfax7X1uUCj7928c+uNW8I9xgoLbl9Kkak7btKlluCMfrE2amSwc4UClXqTSAjICS4JNhGu+FOorvnGkHgZWf2VHcN4uyddnFstwzaR83szyot+Ok4Lg7tU/SeG+A9jE/Q3wpy5Zn0uTeWAxsjLMsJyGylXccfCk041OOUr7921VKV3ieLvc87YVmiauUz2dDHXVRuDyDF6rMR8qzV3j2jHDGOPlkuSmrIo8svyg020n4bPuU62mnNK6d0oSG6/ZxAMfx0X+gXxTuM5aRSCRYXuWUKVNKcgaEa+u3y3FAjiyfa+RZrixfZ2TdBQA+bxqYUcFskAYviif0j6bN0E8cMl//47BFeuNhi+T3j6fNkHuhAcN37HvM73Mm73Wh8l7MxQ5Wto5Sls8FcHlIloexyt2h+kj7oFS2fZHZ83T5BVfq6h//Xk+68XFde/PfdM2PfqsT51+po7Pnh8VDuH2fM3nebcrYYsoUbOQ4zuW52Gh3Ef8AAL8Iy7oB5Lj9cDbLrChyHP39/abr7iUNWh/5Xp1e0qC7Dj9K9xx+lE6atN4lDfr7+82QZ03eloX2y3eA8lin/wYw23bSMLCBa4g/O7d9g8hye0/qp6IxnfjM1/Xke17TU/7QpCff87quu/s1XXfXq3ryva/rKX/YKvcSn/2GVpFov3fz5JmvPNbpl6yj5QYjoaW8aW+sXLlSFBZhZUE4jd8bN250nnrqKbKsTwL4jmGHFP5pBahMIPft1BHWrrUm1VhNx1EKEaXwq1n1OLm2Dm2pJLGCtMhVKmid5v8yfVEeieLOpi0448VGpMxzvta+A6WZYd7yAO1rLfITwDYAXwZwE2VrY2NjasWKFWqQ9iql2Ax9NoCrAVCUseZpqZCfyWKOgIW7GkGJ5MuOUg7geai49D9R3HAKMi3NQCYNuKyOaRera9Lcyhp0P3wXWq76LJBOQWufHeBDOSQ64Gf6tU/KY4G+v1P7DIDUhdByRCuAEJC7dCBZ7g0sy3XEzOSr9t1f66OO1s0Ll+j2xUfq1sVH6o7FR+o28+kwabzHZ/gs3+G7UaUkr3B5LIufSCjd2Rk7XFIAu3TNbLq4vyynnDbt9SjLE/lkuVZeMJMTn7xMT/3Tdl23qlHX3fGSrvvNBl3365f7PjaN37c9r6c81KITn7w8yD8SMUQ25TmudkoKwg4Xj2SpLMCokNFy7733umbmc2bcaGQ5KSo9tiSRwBm1k7EwnsCkiCfCrCmZwqNtrbi1aQue6miXkbMkUY4H5h6MtNainGbPuuZbJpoRhDaNLVOGO7z/+b/jkbbWQO6VxXHmpDrJryYSkfeaUyn8tb0dv2x6G4+2tdm55nPKmCzPVkrdrLUmMFQ57SVe8LXWZwG42chyBa3lfrR+AYrfexq82fPgllWA7Ee3NiPZ+CS6/3Q7Ui8/K+VFDzgMVVetguYM933AdfomvsxhTXbZP833oaIxbL90GZKNT0hSZMZBKD5mGSKz58OpqBbmo1u2IfnSM+h56A4p13BJ37BMtu9fuPzkICCtCuHsQryhiP/www87a9asyZi1KmtYRnZP4pc4Lr693/44d/IUxBwHGd9HUmupDfsv4rjoyKTxm+at2JFO46M1k1DheVl2PhjxbRpHXbFS8v5tzVtR6Xk4tWYS4q6HlJ+hGJDn2ElR5aBX+/j525twyasb0eVn7CDg1QFgwYoVK14hwVesWCGJ9vfKlSunA/gbgLghvlKxYsQ/9X9Q8sFPgL91bzfZvfS58jyoaDF0xw50P/o76NbtKFp6ClRZOZDsCdi+FWeW+P1XMOa+krz8zjb0rLkLTrwcsSNOgFMah+7thfYzwSCJRKAiUehkL7p+9wu0/3wldG8Pq0oxy4w4yxYCeIn2hqVLl/pDTW5ViJwIzY5fKuAMmf1KucXKwarZ9Ti+ZhJaU0lpTD5ZTrkf9wKR1ZVOZ6FuIcS3afxmDiUmn850WgaarNUomtmNWstz/Ls8EsF9zc04ff0L6A4IltFBVgSGy7lEXGo6yM4YA/iWE5GzfYgWofKya1G05EODy/JIFE5xmaxz/a4OkeVw3cKIb9PILcjJisrAXtSdbUA63ZePY4axcBUXbnkNuh/7LVq+cS6Q6pX2QWvXAMOPs31r1qxJD0XfQkCgJX49gKfJ5RxAhP6P95+Bz+31Lmzr7UURZ38e1s3fzIgsn5dnBsdwiG/TmF+Yu1h0lE+MdPs+amIx/PCtN/DFV1624oZFJwHMU0o1UhTMnz/fija2by25L6EqOzrx2W+g9CMXwN+2OSC8Q3YeIj4BG9NIFM5SIaYyRJMhWRjxWS2Cx4yZGnLP6cvblsvnBRj6MvDcmsnoWPUTtP3s36EcB9oXRse2zAPwQiGiwBmC+Hr69OkRM5NPpaKF4IpNW1iWwKcnT0VrKrUT8XlFlRJOUKSUEN0z6H+kxLd4IaaUzHBRMQ6CIVgn1u0zk6fiPfF4MBADYEhl0als0/Tp09lBliQflmpTeeP7iMw6FCUfOgt+S1NAUHZ8vxmdQxgvYohmZ36hxDe1NjNb8uBgi0SDvOx3mFOY8jLbm1By4tmIzDyYxOcgYDMJ1E/mo2zbUDhg0JuUIxs2bOCIYulLDOqX68y6OsQcV9h8vpnalE5heyqFrakUtqVT/bjBSIg/3DSzXESR4+ITkyZn7xtAeDj/3rBhQ6qhocFSa7EALdPA4mM/KjJfWDwJkI+A4QFhCRNGdwUR3wwmO7OtGr1tG/z2HdCt26Dbd/S9GzDt4E8uUrwoit93uun47L0lBttJ1wyGA7whQUIAMKjenWYWyNIdi+IJZMiyONNDbJ8zlERveG4tWtJpSavyPDx84KGYFImgl+BpnIlv08h1CBJZV/5m3Q2x92dVtdbJK664wl+zZg1nzXTp4EzG4UyMzJ4H9HQVDuTGKs31oNuase0rp8HvaA3EXFk5qr/9a6jy6gBfWPUzX08nEZk1TwapzmTEFqO13p8q+VWrVvXw78Ho6wyh+LFKj0D/bTqizPMwKRJFEjovEVixbam0oHYOguZ0OssBbMXT5tsCQjUOA0IGpdaojURR6rpBOUHn0SZfatvLJjEta7MoKoUbrxAOMi6EtvnKjDd/m/tKsIMjs153tMog0G07gnu53IVTMZ2Gk6iAUyzNsU9UtrW1FXPyGu+jAUFgPxehfNyAHRiPx4OBEGqUZed6APYbcfpAWsRUPQzaikK4gHhhPMSDzc+mhzpfGqIC7mar1I/aomYcj5kvhDNYIRKFciN9ANP3oS2ucLw+0MeVT0g72ieCTMuIG0z1bcltbW2aA5rL98Ho6w12k35r7CClFNfPFES1TO/MZNCcSmJvrkkNFwgT3w6c7O9Q5Syhm9Mp2HUZSVBO1jeGxHcNlyEQ3Z5MokMQdrYD2ZYuWQYFWkza5Fu0xiSpb0+nyF5VPQWaLHesiZ/JQPe0BQSXSjtQRaWiNFK+LAL7VgP2vUD9B/ipII8gQQaHbmmG7u4KkR8ttBWQBoaL64FEvTcECPRMB/UCeEVrPZPm2bTW7qPtbVgQLwdSGSoFsoOgD/+GOyLgBmmDEbalUjjquWewg7pvgxHWHHgoqiMRUeqMlSggC6ci6pGONsmXdc8Ej23gcnDlypViMl6zZk2vSZsJ1/V1JuMm1z2NyAHzobvaAyQ+FtzAmHH9nk5s+8qp0O0twaqorBxVV98Jp7Q86EFL4PAl4iFDHXdf9hwSXhTJ9WsDZZHr+TqTZvNf4aC2qt/BcN6gamAqEurr663R4ZEwxr11yxYkzdo3l3UHv/vpP/st10gkcpAsRkgFA2EsQaBMDqXQ46dxy5a3+2oUsPzH+Fh9fb3X1NRk+edj2TUCe++PqwHOKrJnWfiaQT0abiAs3g2+W7cH8r2jFRnKeOlLI3oy/YRW37uKS8zQmGAxqd6grlJm9r1HONBeeOGFrBFvRCCQabW1tTbXOzWQ9LUWi94THW34yeZNYq1LmoLDsjeXA4QHCYkUIduzGEE5Yw4CqZKORyL4z02b8GRHe6AtDFYBnO13sINqa2v9xsbGtAF/d8g9WvscB6mXnkHnff8Fp7IGyBjkbZdrIyG+Yf8ByAtYt5XxioNMlqAKomXJxwEoHmzr+F6qF271ZHTdc5PU1WAI277f8DG2bSj6DgkCyQWMhekFALcHGldNly1c/toruLNpK6oisX76ACuxQq3fSb5bjBB8+nMIe4VXCsMhPvOujMZwV9NWXP6PjUJ8UZUG2d2ulFp31FFHWVUp20MssM4MAj6cIbBqv/Gb6Hn4LjiVdcHyK5cwgxE/MBEHLbTreytGxBhkZLykGXuA5RC5qw9e1prBfNIpONWT0b3mTrTfeKVVSNn2sQ3Ucrp5DF7D1gRK2lNPPWXTriDAJHajTb7H1zh9/fO4+e1NKDXr5TxVz16Fcgj+DmsRuVIYDvFLXA83b9mE09c3ikpYa83u42NtsVjsCt/31Zo1a7LtbWhocJgG4GtiUBGduvZ1MokdV34G3b+7FYrymbr5QojPy/XEcCNont/2EVH5DsDiHbePQ+S55F0Sv6xcjEEt3/i0GIbEfyCwA7QZGtGPccjJPaQmMJQGmoMBvGwcQZLBmhqauvkvvfoKmlJJeDSGDAICC+UQ7OaWdKBFbEqlBCymC7QVsA7EF1/a+IpYBUPae9oAPplMJjcopfqZg5cuXeozTSlF8HSOPBto3TTSSbRdtxL+9i1ijRuU+BagkR4dLfB3NAfaPMp4u84XGDoAiyenEDCUk7c0TkFRKxktQmb7VrRfu0JWKIp1DFqYNHV/ub6+vmBz8JCaQJtGLmC0TP0bHfDMLOELAYEDXYIJlEKHrBLWYrtRIFV6EfzPgYeg0qwSwsvO8IDgIInklC/yPbT2Z/3r6+vZtmS4vcZbKJNbn+xgJVGUXYaFLYJ2QFh9vgfd0YHtXz4FmY7Ad0FQ/nfuhFOWCGbxQCxeFcIhMma6GJVx7jBRirJ/yJlfMAgM28u11rSX3yBGEylcqZhycPV+0zE5EkXK97Pr/MFY/FAcwjd6Aq4QuFLgjLZ4IKxttMtOhMzFZPl1kSi+P206ouRIgR4DZmyw7jPoFmZdrlcaczDTjL8DnV2iwt58rcjG45/5OtzKSdBZG7+4beXId9M6WeenBdnrHJRfCIsflEOQ9KkU3Mo6JM5bAXhRDhyuLfkE5cyNVANT5NGHo5DJXZCcoMnUqExXAkhwoULntyJH4Vez5+DsyVPF6cPaBYZi8YVwCPr4ZFcJoRWDHSQWG1CvQLxg3+XvzkwaZ9VNxarZc8QqSL2b8SpO0PptC1/Zh3HsynGlcQahN5BDL52Ky69DyXHLZckmFr+QNS4r3621jv8MAVUY5fN3ISzeDJJBQaBLx5FWFB93Jiovuw4qKvtkHONVHAfwdcdxdBjjjAoEhpwlaC//SKAlVS5Z8Tf23R+n1E7CjlRvDvFHBwIt681+jN9Z2DmEFkYqlN42GMFyBcmb3kPJXpxcMwnf3HeaiA1x8AiyW8a22NXN6tWr2Z6MaR9NwnzYJaHjn7xMHDv9bW/3J/5A1jpq8awqN/djWbwzChBozcZeBP6OLShaehLi51xul6e2fadprQ+gAo9tGzUIzLWXU5tGDduCsjgumDIV7akkHOXs5AgyGhA4EIfgPS7p2tJpNDy7FgeufQKHrn0CRz67VtLIFSxYdB1HPI5ZR9aVdTbOq1Hj2wC2LaToEn8HcbakP8DMQ1BywtnIkPiRWN+spIzvbMG2r3wYzZ89Gs3nHxNo9QyHCLwlRsjih+IQXOnZAeZyEDSj9ENnSV0DxxHZiBIzgyDbthFrAs2+dovvFoer9S91k8UfgL593jA1gaPlELyaU+ksRqDlkVe4jMDIphF1PJxl/AFCOYq9vKGhQVMZZIDtkj7DCv0BlsGhfqMfETC0tW40LH4oDiGaQN0Pa6C4RJxH+xoo/y3mjzlz5mTo1DMqc/CqVavsqJLNi7Spc6bR+5e2dsrhfFa40YDAQjhEJBC5RpOY3zOImjX6LCxKJAQbsO4GEIq9fOnSpfQFSBtz9/5yjzZ1x0V01qHw00lTsz4iZYkwgLVuVCx+SBAYeteuOHp7ET1gHhS9iejLEFwE6zGj4xgdCKTJ1NjOK6z8o229xlgCBzIHG0yU/eQSkLOl7/7OHIIdn71v7fQDDbAQCMytC60MdBsvYwdJL+usvXzlypVc//PvYrPXL4AAxSVQFbWB4kflqHKz6tgw5fIQ0A4O+8ll8bn3sxzCmiZy7oc1gSE9BN3PnfJqqFjgD2CS2ZbiQszBg4JAigDTQTvZy7lFwdYpl/jimWhMnYGX4s62gpThlnKffZvDIUi4vryCwRIuI0VlS6isfOpiW+F+Dl1BezTt5VprqoGRSHBhI27ufTUI29pzXcBEHZsOAbz0Tixeh+5n9wiEWHy/+/yd5RChd2z+RgMpOoIQEM3WxTqWhFKNyt6ag0fuE2jkI43NLbYDOtJpbE0n4eVZv4sVDhAOQf997gGo8SI5sxeojnh99yMWh/U5mdSYe3yGz1proZXvnNX2PstyB7AI0tlkSyqFjrTsD7AXYXs3uRvbm0gk6A+ww973uzvht7UErD3r7WsnezAQVKJSVLJ011JxOhhZZ46AGE55332X95VjjD3kEC7cRGXwLu8nKkP6BfS7L3mUVwXcJ494ICjOtLeIiVnqF9CI7es0zi6j2hgig8BsCrlXAcc7SmUyWrvX7D8TF0zdSxw/uRbP1chxLZ42yzeWQluBBYusYru5L7NTAQnukwsNkpZMOrv8YzMqQw4jvFozaZmyQnDzvh0k9jkif1orr9n0Bj7/ystcJWToywDgfgAfssoggwOY9kHluhn6AyQuuBKlJ30KmfYdICbIzisBayrw2+dMNeBPbAWhYcL72cFC0VAa73MI4Wzv6gicOo03sDiEWNEhDiOdfWborMNIYErOigWuwCpr0Xnnz9H2k8t4PyMWQa3ZlhNDAaoGFPUSkmQwHLB69WpL00c1cLxtIm3s3A1EQJgrez2jvg2nmQ2icrnmflhuk1iZEAGrc7gGVxvh/MhVwriCzqZh4gcDR4nPwq1bubs6tDoAHqVoa2pqchobG+0rj3AAWC7X/eDqYDdQeLoZ4kv+Mqu5NDNpZNlWdjMpUW1wjvHks86cJg9yEL6rHNE4BpxGyjADooyQy7xrLYth9k8PJwGB3eh+cFVQJ5EYWX8HTdotW7YMowKBIXs5bcxJImmyncc72vDzzZuQiESQpE96DvslwbgZpIeE1Tr7t9Q9WE0I0Wx6rtwOv0uDk734js55tycP8Xt8HxWRCH729iY83t5mTMKyl7GfvXz+/PnyTjQalfZp33e4ySL14lp03Xcz3KpJAfHsPgBLEBKMu6Hst5Xz1p7Pd+jxRF8C3reEsyNK3k1D23etLGc52XfTfWWEZ74p36moQde9NyH14jNmY4isArLtY9vGwhxs7eWNWXt5oArGpa9txH3NTaiOFQmL0IYgVhlE4tkZRWLQmOOE+kDEgyHcTks4w0nCfcb0qkhEtn3J82aAWGzAv/lhXWpiRbh/WxMuezXwB5DqBF7/vw7by5966imxC6RSqcawvwM7tP2Gb6L7L/fDra7Lstws4LIEIUAji05UwSFXoMXQuMsHANKs2cOXFQWC9M0OIL7D/mE+ggno8RtyRLE+gjKYIP4AvX+5D+03XRUQP8cfoNANogVZjEL2curR22hgIYTu9DP46PpG/Pit11HiOEKYEtcVTEDREHddkcGs1q1bNuMHb70hzplWd1CojZ8X82vPZPC9N1/HjW9vNoMqKmVYz+KgvIjUhXX6yPoXwDqKySZgja0D2ct1cP/r8gx/s4G93bL3ruOOa6EiRTLjFN2vqQOIxmTjiOzcdRz0/OFX6PzNtSL7xQ9AF+gtZMVHNAbd0YaO1T9B1wO3ib6AjiiyOcWLQkViUFFTh2gMnbf/FDuuPA+6p0v8HRBqH9sU8uEY/e5gk2a5fHb7tNkhLPcXxxNYPmmybMIgaievpZ6e28N/EdoefngigQfnHpJ1/vQKsPGL/lYpHPP8M9lt34eWleETtZOxOFGOumjAWbam0vhbe9tg28NZ91uM6Tc5gM0j7/ZwOogWH/0RRGcdEmzQ4KhqaUZq/ZPo/mNoe3j9AlRddXvgqBGe+Tk7f7KXERnKc7H9kmVIrgtU75HpBwbl1S8QnQQHBM3L6fVPo4vb0flcoPkLbw8/Syl1Czl2aOfzoJN7uCFibAAFBluQMU7GSPtAvoAN4UAOjlI6agJEXLnvNK2POkZvX7hEAkGEg0KEA0UwQESTBIg4Rt7JFyDCHbi83AARFw8QZg6mbTYaWP8AEegfIIJBGiRARElcgjdk0x1XKy8ivxNnf1WCPjD4Q79gEOFAEZL2ogSRmPqnHTp+9qVBfzJcjOknm28QXCougab60h1fgleE2mdDxYxbiJg8gSKyIVQcqLQ4reQNESOrZNrlZU6Qnf/3rHqcakLE2B044W3lgTYxCBHz66YtWP5io+ALoYSEiJEMCw0R82+c1YWGiEHAiBhs4bt5QsT0K2+nEDGy6cND+SU/QcnRH0ZmR8628ixAyvSFiPnjr9Hy7fMDnwF/2CFimgF8RSl1E3HNuIaIMWkqFCrGBlEqJOAjP9Qs+nYmf2e/6RIUygaJ4u/uw4/SGRMkir+vnjZdnjVmaLvRRxcYYFKCKA0x8zEIp5ttgjgOL0gUHXy9iI6fd4WefNerQZCoe9/QdXe/KoGhGDBK0u5+Vcc/vUKDoWXUiIJEse9njWTm9xsAw3khD7ssNEzc5/KFiTssHtc/mDZdP3bwfL1hwSL96oKF8ptpvDdImLjzQ2HibAjW9aEQrNkwasMkPvh3bvtMaDbbPpb1dihM3PkDhombeYhEC6v5wX26lmHibnhMV//wfp341//QkZkHGwIPGiZunSkrN8TsaMPgjUm84GxHhQMb2qDIJmhk+PriQNiBrDvuujo+tCxnHjsFpjSf4py6jCqQ4vzgXeEGNk8TrLGyvLxcgj7nlHfRgNiBGKGkTD47BXtS/duXE3ySZVTYINrhIJljEUR7TOLnch1tQ7da/XOo02zoVht48cz+oWIxSKjYfh2z1YRhhclPQreGyxuHMOyKf4fDs+a0zUYjjYTE4vJw+6AKDhXLGb7czmjmZ+sVHhAmLRKOBmbSbD2Hxekk49GMoHydVkCwaBtMuRDs0GXk8FDBoqUsmzYG7UC4jDxty9fh7kDtG0SWd5tnZ+SR5f3altOnUm5u7OJht22MiV8wgDQVnmNiDt6TJ1z8PSbUuoRTH4D4EylMPExaOMRsfShcvMUOeds3TFkufWB+V5ld2xQR1fad8QaBo0rjqLbs1F5GttogzGMqy3dhmgqJDHe8ZLlo8IL3q8yu5u3mw99V5l7BE6VQdu7kiV2fL02N05EqE33mI4/IcAqV5cMRr1YsABLPoCUkTlpMmoiOQugx5GjOJUxuQ3LTRkGsXSHLd9uAaBhYlg+Lu+T0fbkRmxZcNjEtDFKHogcKlDEcVWRdNeZTHZI79u+asrKymlHO1HC573jiLxu7duTSo84se2cYTaflAPw93SxRawuixzBkTJMpoNl8toW+m/LJoOE2kuzSptk8wix0IhB1xW5oxwD02Gq+w9pDP+fekPTICwKz8iGY5fQv0wV++GxNaH1csKwMsS1lRjDZm93XZ4HSRCI0dlU7xpseeRtkKlwzggKrh4lCpdPMKoBavjUAaPDfBODPJk18nsfqnJxxSnPGsR3jRo+8FbCjxSxZXg6JgFzW3xz6WJYj1rMQkBuy02Kx2L4mSnc/pVCoIby3nz2EaqISP5bTDnGX6K/4GVE7BqHHtgFEQFOh9EABoEMAxRAgMAsEh7GelTKqq6u5o/VJ04AkvY4tqjW/k+Yen4mPYpUxrmv/6px2wHH6VL/B79G0I5ceAgKj0egMQ+gwCJyRQ5fB6TFUBYa7DCy0IykLzTv2JLGknfXFjqNLjMHEpNnO+5LVCE4Q4iNfO+ysV7Ei+WTVwGPQjnDfl5eXV5jZHl4GVgyHHihk9PG7UGVQIQ0KPcfPozLbA9dzfXJVjV63YJFev2CRPrGqxhqM0qaBjxSq4NgVacvytCNwHIEuWnycrr3+UTH/Fi1+v7X8jUU7RKdgxEhtHkVQbVjEFNKO3bU+hhmtb5v9hz5n/csLFmr/iKU6fcRS/fL8hbokcLuiSZjfm82oL3SVsVvaoWLFetL1j+jJv92kp9z/lgwEpgnxg2dG1Y5QuTWhZeG2EWCw3bdsCmmyNucOgIwZABsWLLSiwA6ATVbTNUFwgMrXDlVUrGtv+KuefP+bwQC48bHcATDadmSXnXnwWKEYbFAQOK5pIV12lnUanwBh++sXLJTPidVGBAT3hHUaR+Kwuni34YCGPO1QRgTEFr1fT6IIuPGvumjxB6xvwFi2QwaO4QTvGHNwtvIhB4qdQGAJQWDfYZFh8PRvEwwEqnztMBuN+4PA8WvHsDHYcEHgeMpPxwRu6lsGIrQMDH6Hl09lIfC5u4mPwdoxxDJwQrVjt1Ug5CE0lCKIR9XtS3RrQdPu7rQVBbQjjyJowrVjt1cg5BhSbNSlD4dUqGsMay2hjBthpw3oPrbMzN6h3K7su7u5HeOShgkyi7LOpObvCoOs5fkhZkw/fz3rjWMdRzk7w757fDdsL1eh7xwbuvgwGhnvWa+dkJzNN0hG047dk7bbKxCaqeFzfQcxo4bVovY8YyHyYBpKG6WeM7SqqiphiFNjTKxVRpUbM59wHfLll/V0zqPQKbQdE6LvdxsIHCQty6bzzfLQrMxHGPrdTQNwjAmczJ3A15n98mTDzxhjyhvGObPJfLaYtJfNMw+bbeTXmTwYIPt95rQx2QuQO8AspwhziJG4ae+OtN1egaHEg+ncfhs0zGwmsU8DcCWAu3hmLqPTDGQezbqdq0E+GNS82mXKuNuUuczUIbuLyLp2W3/GCdB/70zih3fl2KusrIwar5MAfN+g7Y6diKwkVpPvuirtuSrluirlOIphx+3WK3+IT4Z7Th0Hab5r8kgzT7t3NefTadD9DwCcYh0w7GXbMRH6NF8aJqIXbbZiwTXJ7Cb6ldkjl0NslREikch9BM47gz1X6VjE0aXFrq6Ie7qqPPhUxF1Ji0UdeWYQDiCDhGWxTJadZ1BsMXU9y5ht+4mJHLyw+/t+t1egT1YKiLMbJAAcB+Am06HZDuaxzkHn70xsz1G6rjqiFx8c18uPr9VfOWuqvuayaXrV92bpB6+fo59adZBef9eh+rXfzteb/7BAv/3gAr31Twv0pgfmS9qLdx+qn7ztYP3HG+foVd+dpa/56n76knP20mccX6sPPzQueecZIL6jIIOQdcu5t9UEm2BbsiB1IokHTBD5LldpaSln+xdCGjVLdHaw1aNn08vLPH3U/IS+8Iwp+qZvzNBP3Hawbn5ogU49s1jrxiVav3iE1i8dEfx+YYnWzx6u9d8Xa/33w7X/9GKt1y7OfjNN873nDtf6+SXBO3yXeaxfonvXLtbNDx+mn1x1sL75mzP0RR+fImVXlIU2eoq+XwZo2gniVofvsU0XlpaW1uWIh92672E4IWLGIs1ncIbGxkYe10JLWtoENqQG7TwTlGFqwDYD9u772jXHDct/9dNL8N4FCTS8pwKL5pZicm0UXgnbxvhfDByokUppZEwYUzksKBvskyePB2lybhNCYWhMmrxmAhQy5K+N++w6ChEGJWaX8bgMAoVuH5u39OLxxk6seaIFf/pbG9a90hWO6qpdR2UyoTYY5dBNZoXxmjmFhasHXV9fP+ABj+OVpnZlYeEII6bhe5m98J+2duwAgEk0yiwOmDujBB86shInvLcKC2aXoCgeCYjU4yOVDCKD8RRST8a4iTFsT3Dhdx9BdkpzgvBhQz4nQT1kQGgJ7sHkiKvgegqqODiSoqc1hSdf6sJ9D+3Aff+zHc+9xEWDGUCu8hmpypx4A2O/vx7AjwG8aU5oJVjUu5Ieww4RM9I0fm/cuJHRq1LGO/Z8s59+ihBCIa0c5WYygSatvMzFiUursfykGjQckkBJuQekfaQ6Gc4/CCHD8G8SeFMPQFQTRXzM0pxQGYZDBAMjiBITjSi4MQcoctC1I40/r23DL+9rxj0PbUdLexDv13WV9n3NGFleiCP8EMA1SimGd6U2UzGS+a7gBmpXsP358+d7Tz/9dEqGv4sTMxn8B4CDzWxLOyHCT9s7hnNOqcPy42sxbf9iRoxEuiuDDKP8EUm5fWdoWyKMOaHVCNIYMpADgtzIByKeglcaHCXz6j+6cOu9zbjpzq3Y+GbPQAOBYcYkCklYLIw3N5ABsIuI/y4AV5kACiJiHVc5lvCz9i3G55ZPwcePr0FlbRToyaCnO+heEj1Xbu82QqOwNDYqleF5xYxC6gAlLlqak/jFfc245r83Y/2r3bZtOuMzplVWNPzSbBt/3egPMJ7YYDxAIE+oYBDGIJqXQ/uI/iiA7wDYR9bRriLbdEjNveuiuOgTU3Huh+uQqIkg3ZZGOi3Hu4gcz8rjCUBUZ5hpdsAGh4yR+yl45R7atqVw/W+24Hs3b8KbW5IWZPoGuDpGLf1lAKsMNrAxfwVEvxNAoCD8qqqq+LZt264y8t4CPLJ7mdWf//gUfPmcqZg6tQh+Rxo9vVrkqHSDPWn9HUp8N4cbWA6WSgdtdBMeNr3Zi6tvfgvX3Lo54BbkdIFYsNzgPxmTUSnVTpGwYsUK/50AAplnOhqNHpBMJhn6ZIHE/CGy56wHcNSCcnzr396NRfMS0J0ZJJNBBE2i+FyQNREI6IwxgGQHJVMaJVw9lLj469PtuPR7r2HNE635uAFDh35CKaybN0+imfK8Y2eigkAhPmPxmyUOlR5Um3rpjEZJkYN/P38fXHz2VCFwT0dGRn2A6N858t0ZJViUgW3iQ5PQxXFXDh357q2bsPKa19HZ40u/ZDKafUmQuMV1cW4mg3tpht6wYUNyrETBmIBAqnLXrKG1VYj/eWOscQ3QE5Z/6OxSXHvFdBw2P47k9rSs3YmU/6lmuRrZcpLcIGLwwZN/b8d5KzZg7brOXJHgm2Xzj6hBnDZtmm+X17sVBBriszkZYzuXkzl5DgLFHv8798OTcPXF01Aed9DdmoHnBev3/5XEVwMMCB4TkNYoLnfR2uHjy9/eiP93x1YT6p4rxuwZWiuVUlcwIDSjuPO0k90GAnOI/y0TZJmmVIdnSHB0f+fiffGls/eC35WRkc5RbUHRhCKCmgBphhvEogpOqYfv3vgWLv72qwGA5HkQwdHMrunrS8dimThiEJhD/G8zYHEA9uByZleUebjpyuk4+bgaJLcHBx/I2QgTqcMxAdMMNuCUL6qJ4M7fNuOcyzeIJlHuBQekuWZZfbEJcz9iYKjGQObzwOWvhYk/tTaKO34wC4vml6O3hRFTg0MEd3vnvsPSkkmN4toI/vq3Vpx20YvY1JS04NAOAh5wsaLAKOgjPzEkNy1E/AsN8ekx45D475ocw+9+Vo9FhybQs4NRUvcQ3x9hWjSm0N2cwqL5Cfzu2nrsXRcTlbjLw5qD/mffX8jDL6hxNTTS4wUCrYbPmnFPBHCnAD4j8znzWdEDZ5Wity0NxwvWdrL0mWCd+05Ky2Q0iuIennuxEx847wVsbhauSmTIR0jDU5VSd4/EfjBcEEibeiYSidQnk0nGvakyLlEOZT6J/55D4gHx2YI9xB91mgXMggnKPTz+dDs++K+NaOkQ6yJX08rEAjpCKbVuOMfFDBcE8pRN/PSnPy1pamqiDJjH8zMcnpKhgN/8cDZOOLZa2D5t5HuIP3ZpVkmWTmkU10Rwz++34cNfXB+cHqfFkMRH1wI4ctmyZWJuLFRHUDAIJNo0Vr2fGN1+VsP3g0v2w4Wf2hu925J72L4apzRjG+nt1Sipi+IH172Ji779qlEW8TQdOSLnp0qpC8yReBgzEBgi/omG+BnXVS6J/6lTJuHCc/ZC7w5DfLOenRCd9k+oQo5GFXqakvjiJ/fCJ0+dJPjAcbKn7p6vtT6JYpriekxAIL+Ztnr1am6nehrAuw0AcQ6cUYJHbjkQJVGVPfxyQnXaP2mapmuaB3SlNY488zk8+3IXQSFdzkjPf9DfdMWKFS0PP/ywaApHBQJDp4T9iHp+rgAcBY96/Ieun4NF8+PoaQuMOhOlg/63aAyLEy7++kw73nvOC0imxS0tQ/ZPWimlLixEFAwKAu0IMiZdCWviMZZLRqt/P29vfP0r+8o6lbr9Pepd7No0nqeTDLSFX/vua/iPa9+kfoDeRcSLnLBLlFJPDXWUXNZHPN/NNWvW2HXmSp7OStZP4s+dXoJLz9sbqRaqJ4OZPxziW4xgz4SmL50zis4Y6/zcXNlrDwgPlWGJsNvyY7s9JR5Ul3xqb8yZXkLTsiKNzA7nr9MLiRxgIPoyzRvkJhU+ZCnHyrHqQT0ED1z5hX1QUuqipyUtvvLDserZJQ1FiD0IW3mBp0y2g4aTn/H5z5vfaL2KVJ/tXtTZIZdxdu6wvZCHys9Mt0LzYz5UF5dWebjy8/vg5AvX2/M3yQdIs2Nuv/32PxpRMCwQqBsaGlzD/n8P4P12g8NxSypw/7X1SNGZwxsZ8dnQDuPpKwYiHvxc6lpjx/CIL50HtHdnAl9C3mQUzRJXDuAetcnZCYwzrZ3BkX6sO0VevNgdmc+iya+tk4dam/xchXiJyW+4opRRNNMakTIXx3+mEb9/pIV4LJPJCBZ4gNvSLC0LBoH2cGVql8y+erIWsUz/6edzcNTCciQ7A9g/nM7NmJna2p7GorOex9YdFFVAWbGLx289EHVVkazPf0H50f06ovD29hQWnvmcDCpekyojeOy/5iJR6mWPoR0J8R3ORkeJJe7wf+mrL4n12C0HYmptRNblnlN4fiT2W80pHH7Wc2g39a1lfW+ei6qEh95U4fnZNKsq/vPjrTj63BeCk2zl+HO5vRTAX7iUP+GEEzK53D6vCbGxsTGoGfAZlmd2teB9i8tx5MJypEZAfJvGWhUVuTKLdrSl5fPGll78fUMXnBJHRnPBDaeXRLGDZ17qwhtv92bzY97FRcF2MStjR4IDtFHBlpE7her7+tu9ePaVLgilTC8XOlMRc/Dcxi7Jw+bHQcwyKLZGgis4qah+P3JhQmgkqsHgwE12wqftptRCQSD9kDkA6Md/gpGr8sznl0+BcgOQNZKK8h3OmKIKD4sPjgv7LIoFsvv7t2wK4moJWw+2euUDcjbNFy/aAJnwXckr6sg382YZ3CM4UuL7Jo2DLFrm4fCDyqRsWwZduqV7+SyVMYbDyU4lm5/qT3yx4TnA92829Y2Z+h5UJmX4I+VW/EPEkcIFH5ONVgJ/TF4nx2Kxd3EpTzP+kJrA+vp6u1PlVKVQQVduKhgOnlmKYxdXINWWkRE7om1YHDjstJTG6cdVywxLCTNReODRFlx69WuIVUUQidL9RYOaRgFG2uy6IcLPaGTSGrFiB9FEBF/97mv4w2MtkgdnEPP82AdrZEeRACpnFCsAJ5DvzPRjH6yVNrMMYhaWeenV/0CsIiJ1IRgjd5N9g6bObBvTuFyLxRxpG9v4wGMtkoet7+kfqJUyRsOtKKrSHRm8f0kFDppRQs5Fsc2JXN7T03Mqn6cZP3fC93MI5fecOXOI/MXEyDpZ9nHG8dWIlrrBKB1FReknRvxwzJJKnNhQZezbQQO+dcNbWP6F9Xhla1I6tijhSeeSpcdiCpGYI2lF1RG8vCmJj39pPa664S15NwCQGicvrcLRiyuQ7EiP3unUD/b79ban8d7DK3DS0iopw7H1vf5NLL9ovdSluDqCWNxDrMgROz7rXFSiJK2oKoJXmpJYfuF6fOv6oL4yMDMaJzVU4dgjKoSF2yX1SAdsmtyqxMUZxwdBSgzpSK1Tjd3H587sAUFgSPEzi8GSyKVobSyKKjx928E4YP8iJLsNch9FRUWmRFy82dwrqsw3tiSlwzjbKHMrEx5OPbYKHziyEvXvLkZNgmAO2N6eRuPr3fj9/7Tgjt83o6Ujk+1Msth31UXx51sOxD6TYsgkibJHhlOcnVSvGl7MwetbkzjqE7a+Dnw66dH9Le7htPdX4X1LKjF3WjGqSjzhPts70njh1W784ZEW3PHANuxoT5v6KqTTvtT3L784EFOro8gkfQGIoxmwqQxk0K3b2IN5H/07epK+bCvSWnMf2iFKqZdoLl62bJkaSBNIrE/L0r9yV4pdTiw9rBx/vGGObNK0e+xHq8kiRaOlHtY2duCkz6/Hm1t6A3Wy2T1jr6inUFIcbJTp7vHRm8oOI5nhZMucSdxidvePDsChc8pGtELxB0tjnVJauM/a5ztw0hfWyZYuDgK6Q/Srb8SR/Q+8urp9JNP968tBSeKzvvdccwAOOaBMOIw3TH3KwEtMDbfIxbHnvoCHn2iFXb4D+CyAn5l9Bb35QCADFHAjH/88UliI2atBZOlEnWB//GhkagjIURT0tKeFYA9ePwdLD0tI5UXGOgqxaMD6qePmMowfEl/EQdSRZ/gs32k4LIEHr58refXSUcIGghgL4qNvudnTFtT3jzfORcOCciFkUN8AHEp9U362viS+rS8HN5/lO3yXeZD4PR1jRHyjHZR8Shwc+57ybJAK86jQdMOGDWIc2gkEUllg1v489eo9TOdWLsqRI+YlBLgFmzpHX1G794+d2t2Wxqx9YvjDdXNw7YrpOHhWqYiB3qSfXRKGL6bxHp85aGYJrluxPx68dg5mvatIZj4H1rjsMtKQpSDLmDm1CA/9v3pcu2J/EBxTDPQMUV8O1INmluJnX9sfD11fj5l7FckEGOvNMcQR6NE48j2JQN1stuMZmvLM4sxAmkDKC8awOJD70RxHRdjJ9PN7/vZDUBF3xQI1XCXFkGmU37KMUoiUe+hsSWPN02144C87xMz5+uZetHUEaglqC989NYZDZpbgmMWVOPo9CRTHPaTagnA8ZK/jucVMGS1dMKkUIglPBvBDT7bhwUd34JkXg/V9m7hrKQlysffkGA6dVYJjD6/E0nkJlFR6SLWmZQCTO4z15ph0BrKvYEdHBnNPe0Y8iTkptK+pxZqvlHoujANUHqeP05XCr6hI4Og57ohK3P+zA5AM7eMbr87N7pylzGfn9ProIiuVJVagMyiJeyKOSIl0Z6D+FQA5hnVxCgGG1LbJikCJGpY3/B4f3Z1pdHUHYoGEKCnz4HATaErD786Ipo/9mFV7j3FkExHRVA2XuPjQ+evwu7/ssJtN+cjHANwWxgFZTWB3dzfRIvOaLXu6gpBnmP3uIqhIwEXGbfOmYbEkPjuFrLF3Rwrpbh9lRQ6qyj1UV3goLXKQ6vZlrwHlMd+xOokRWeYwClZrcAzZLOvSvT0Fv9cXeV9b5Umdi2OOpHVtS8mylHiQg9Wqsa1oGcv6BX6CkEE3a58gqi2NQ+bRWQYHZJVB2RMsQ+rf/SREiflj5rtLAm0XMx2vzg3NBHYoN0pasMilTXDqWl/gJhtwK2xdG/f4QGrgNLt6EZCsA2eN7MCWlUGwUXKX1U8SgVn7MXJ9v2t/E54uu4EkuwJgYCLz0BRW1oKHvfeOQif7wI1o5PLY30ed5u+clhu1ywaEyj6XGfjdMa+fHiIts3OdJYiUqfuurEugjdTYawrdAniPYF7Iy+36DncW2w0kkmq2enGueSYG7yHEO56jnMd/dRDmzS2D7vGz+/j5Q2CQ5Qx70jCR0ugSQiPZ0891YOEZz1JDSMMQmdMzZjUgdgEq/SS8uaBBURhpRq6MmyhVwbIvrbF9ewrJbmqqDPgJyW1B3XvSMJHSRG/RSb2NlqVrmhw8GCg8E8HVWqe5HMxqAjkIbr/9dtoA6Pm7zkTrFDUil39cogWLrP7RNYPF0J40NQHT7JKVCqnApiMR7DaVl5fPaW1tbSHNua1cQGBjY6PMeONLxti9gieYRnv1nusdf1m/mFhra2s2BD9BoLUD2B1CJcavXNvPoIcr7Pnoif7JCVj9j7q6ulJ7jM1AmkCaDv+vOY7UuBpMCK62J21kafZqZlQRpdSdeTWBYUeB2trasqampvDZOIIzzICwy8U9aXjHpOkpU6Z0bd68mdGrSfN+roD9Dm+whyDmO3lrTxresWn2LCNrCczSPET87LFs/Da/+51Luydt2Ts5Ld85hzudGMJhstOA2JP2z5v2/wFWujtIgCkpEAAAAABJRU5ErkJggolQTkcNChoKAAAADUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAdktJREFUeJztfQmYXEW1/6/q9jL7lm0mCUkIhECAsEYmGwHcIgKuCTwWF9T83VBBHg/1KaLiAuIK6uOpqKBAwiKoEIQnBhcCyJZADGsgZCPJbMmsvdz6f+fcqp7qnts90zM9M3cmffPdTPfpu1SdqnPq1FkBQKD3ECtWrIgUYUVYEYZxDVu1alU4A+YLLMKKsCJs/MOCxZ2KsCKsCBsxmD+XCFADi7AirAgbJhiKxF+EFWEHJkzTfjAaE0CY1HA6ZQDbV4TlhvG4LV++PKrHMmjtCwLx27ADmtDpdACEly1bVpKJmNWrVztmQgEI0XXFiRUomNPY2FhK42KPiVLKHp9s14kA9WO0YIFqzIjANAGncUEpU/OFYOUAahoaGiYCqMhxHTEHJ0h9O0BgBvfSGg9zyJkzZ9bQ+AGo1mPpe12jxxCcgPVtJGEHnBLQrAL2cUg4LC8A8EMA9wPYCGCbEKIJAJ3bNOzPQgi65nwAc8zNemKFbPEzQP0dbzBmuBm4PxTAeQB+oMfoWQDbAezV5zYNewDA9/W1h2UwhAOSkR9oSsCwNej1AD4N4GEhRDdJjPYphFD9wHroXinl5wBMtd8RoP6ONxgxWXM0SCk/Q2MAoDuPcTOwmL73InoWPVDPjXCA+jussANJCcgKPT3A0wBcDWBPxuRIAIjTXyFEEgCdrj6TGpa6JuNeetZ3AUzX76D3FveYBYJl6GVo/K4RQvD4WSeNmxmb1NgJIXj89MnjJ4Tg8UPvuUcI8T0aP+u9znheHA8kJSCLi7rDlxjC1wRME4FOdxArCN1j7jcw2i583iL+8HieRCMBs7Zr0oxfBtPm8ctj3Mxn12IIBrZXj59jbetGHQcjABvfxF9RUXE4gHXWRKBBTxH9IIg/E+bq1cd8p3cdfqCJlMNI/KRv+auF+/ggmXY2mKufaWB/AzBXv9sZ98Q/RlapfO3yzL0dxzlTK/JSE2cgk0MASgqhBOjMa1WJW9LAO6225Nu38WZi5L4N1HxqEf/pemUmnKYRfs7xyDgHwcibzPjptvTXX7tvImC4H1NKwKHY5dOIPxyWH9Z7PyMuZp0IROyOPpng+zAEocJSqpD5PfcENNsCevcHfCYR/Q1rmC1mku06bVJZ1znjwC6fNo7Ud+s64UP8HzDj57NvT8c9jYvjKBEK+YydHk/peGf/DCFhxk9KnkOpOZVhQg4ZgtdzEj66i7AxVwbNoSxQSkALqchll6+vr5+k7fLZroto4v+ARYRmEvUZdEdKJvpMeImUqtoJ8Umf+9xHzMIHbr0j9V4puS10pPrtY5Mu132r1X31u074MLtRHTcLNhC7fK22y5fR9T7XOfPnz6e+03GutSons+JZSI+oM3+PRJUsr1SyvEqJSEkfhkDMAnRvdkZuFL9Kmw3piGrcpx0aBxW6b3RWaJjfdWnMbpSJP30rMMqrhX0cpgmYbO5/BvCsj11+A4D7hBBk1z0HwMzUAx3nbZY22Jf4aRKELAKeEo6osydOVj8+ZI566Ohj1b+Pf5N6fcFC9dqChWrj8W9i2PWHzFHnTJysJocjaYxA9D+JSKw8zbSvqqrqEN3mawGspb4IIbbpvu3VNuxnhRAPahyk/A4sojFSUKDs8nqVn6vbTHb5BzLs8jx+QoiNuu+Eg7MBzLL6dprGmU2EfUV8i/Cd2kmqdNm7VNWnvqnqvnOHmvQ/f1WTf/Womvybx9XEGx5Wdd+5nX8rPfksJWsm9j7LcZTIzsjN/KG2vNlq30zd5muFECm/Ed23JiEEj5+eu4SD87Ueyj6CxMgDYZcnWzrZ1P8hhOgZwH4tE9ZBCNd2+R3WKtznXhL3jZg4t7RMXXfIHLVtwULlLjlVqaWnKrXkFBVfvEx1LTpZtS86WfUsXsYw77dT1dYFC5lR0L29jCDnJKK/NCk+I4R4QLc1n77R2SOE+IfGEZnC+NDMc7T0BbbENk1KSVp6amPPIJRxPH6EI40rlZ34e3Edmn6Iqv7EN9Tkm59U9fe/oRoe2KPq792uGu5+RdXfvUVNuedVVf/HrQybunanali7S02++SlV9cmr+N7eLURWacDMoR26bX8245enopFw8nc9fsZcDIt5HlBKQNsuP0t7ZzUV0C7PoqPfgBhxPyKEumLGLNXWuIQJe/+ik1Vr4xL+vo/+LlyqmhcuVfsWLlX76W/jEtXSuETtbVyiOhedzPfQtV+dMUuF9TOd7BPBry22TTqtf1Z/bRzY9zaTZKAlCdg4HYlJlKGXofH7gZbOCmWXN2bWvoRkVv1QWFWcd4mqX/2cavjzbjXlni1qyh3Pqym3b1b1qzepKXe8oKbc+aJ33vGCB7t9s3fNPVv4nvo1m1TF+Zfys/iZUuYy+WbC7LnH/dHXpeZoBg7se3n8NO78cDoSNDhqSkDmeLrDXwTQYiEmXgC7fLw/4p8RjaqHjz5OqaWnqfaFS9UeIvqFS/lzuyb4Fv3XD0YnMQuC0zP+evRxama0pHdLkL19af0bhKnKiKMGRri73KzEA9RWDwlmbdfCZvysNrPYXgC7fE7idyZPVxOuuUtNvf8NNeWulzzC1sRebz4TnE4/GDGE255TU+56UTX8X5Oq++5d/EyPCTj9WXgSgzQhc/8yzMU0fl+09AojKg0Q7RvljbIuDK9ZsyY+TDDqYLKsrOyYzs7OGwC8SV9HiHEytcRCCNpTohAwRwgklcLhpWX405HzMbukFC2JOF9nO/GbpXmgMHpHbSiMV7q78M7nNmBzV2fqXcPRDw1TSqmkpZl+NBwOr4rH4xsMjodjLBsbG0vWr1/fBeAoAD8HcJJuX8LSSQxHf4maANdFaPqhqP36TQhNmQG3vY20vd5rlYJwk1DSoRv0IPUHA5BMQlRWw932Cpqv+AAS214mRQu/a1j64cHoPx4/DXsUwEe13oBcycUw0iDDVq1aFbrhhhsSmVxiOImfJmtCSnm267o/11pTnjjCm9E5EShSMA9/Kg/kS/pODt/hMP569HE4tKQUrckEw50hEL+BJZRCpRPCi91dOG3jU9gRi7E87g6wfZl9sy7s716eSEKIkFJqP4ALAdw+HJPIIv73A/glgEoSg5WinU/vypK1v2kQverkSfxyQj0mXH0HQlMOgtvVDoS0on1QxG/BYj1AVS0Su15D86Xvgdu8m/anUG5yYO1jmEhhgWGuWeQHzMhp/D4ipVzjui5xtXghxq0/mBhh4r/Idd0f6WuSmvh9kWpEEzpcpbxJkEHUjr6XVttsDIGeIYUETcF7583HW+vq0BKPF4z4DaxbKUwMh/FAczPesYkWYi33ZZkwXru8fro+19Fv0nqGyj0BGZcadJGU8roCTiIKmY1q4v8kgOv1e5Oa+Pv0TX9hImImlkymjR0TP42n0Iow5WZnCPpZdNZ97SZEjz8F7v5WIExSsxo68bsa5iYhquoQe/xBtHzlAu/RrpH0fXDP/aPuK+86/VtKnNb941fR+PGzsuAqnRY+rXFMU8xdsWJFaDilAWnEgREkfqMQ8iV+R0pv9dSEbYi7RAhUOyFUOSFEpeTf467Lqy+/xGII9hGSEknl4lMN0/DWCROGhfgTun1t8TjeWjcBn26Yyu3OtHIbxsbtJEQoxe2nvlCfqG/VoRBKHYdhCav/1I+0/VH6JHIsJduPXdf9lCb+UAFW/kziZ0VeVuInoibCoHYnk1CJhEdokRLI8krI8iqPeOlaWmGJ8OizZhZ9nqfF8fIzPoSSBW+G207EHyks8QsBOCGotiZ+R9kZH/JWf0f6MzbH4TarZCLF3EQ4wn0TdEZ6+8c4IOLn9/g8T097jVMaw+s0rhOE++HeCrAigPYCw7nnl1KudF33Nk38zHT8Vmoi/oTmlA2RCE6prsHiqhocVVaGKeEIKhzJD2hLJrEnFsOznR14uK0VD7W18X5eY9JjxsJjCjHXxaRwGM8evwAVMoQeqDRPjEIQv4HRdyLTVjeBY598HHvicYRJH2CIXxM1HbWhEE6pqcUpVdU4sqyc+1tOhA+B7mQSb8Rj2NzZiYf3ef3bRWKq7h9LC9lFSmauAN4H4E5Stq5bt65nMGO5bNmy6Lp167r1s27X2w3pq6vhD0Ssntjs1E1B5JhFCB95EkIz5kBWT4SMlvDKr7o7WcxOvPpvxDeuR8/GR7xVnR7hEDZpxdTET1u16gmY9JMHIcqr4Qk7g93z9wNLJoBIFG5XB/b+v1PgtjVBhMIekWviN/2TlTWIzF+E8NGNCM+YC6dmIlBeyTgw/UtufQGxTY+j55l/wG3ZneofMxd/HRELfJ4ri7MymUyuGU6dDi38w6kE5IW8vDx8dEdH/BEAqaguvz06k71SOKqsHJ+eOg1n1k1EQySaEqESZkUkdzohmLD4R6XwSnc3bt+7B9fv3I6tPTRf049b587DykmT0ZxIIKpXYT8CLgSsRynUhUK4bc9unPv8pj5735nREnyyYRreN3ESDikpSfUhrhRiSvFoE+Oi0yNyMPHf07wX1+3YzkyP4EZK8plERtbsLC8PL+zoiD+nm+jmM5bLly+PrF27lmLmjyAlI3nv6XfIbHt0OsKz5qLsjA8junA55MQGCCmg4nGIOLFe71oWnR3H080oILH7dXQ//Ad0/uGXSO4mF4C0N6D2susQPfW9UJ37UtJFwYnf1TDajpRXo/uvd6L127QQpx+hydNQeuaFKDn5TDj1MyCI6cV6QHzXzGlm9vTscNSj6KZd6HnkPnTecyPirz2vuyW9d/Vl5K6GdWol+b/ptatWrRKFXKhHQgkoly1bFlm3bh05hhyfbc9vNOalUuKKGbPw6YZpKA+F0J5MIkmaWGvPaLQlZr9ojMnlUqLEcbA71sNEck9zE98/t7QUn506HW+trUNLIsGMYziJ38CobZWhEO5vacYPd2zHC12dqHAcvKtuAj45dRqmRKK8ypN0YjDhZlgjeHugnxfV/dufSOC6ndvx9a2vost1U7jzmURJbVX5F4BFxuyY536SGQYAYt4nZN3z61VfREtQce4lKH/nByCqauF2dQKJmCYuF4pW9ozVVhmxPxyFLC2Hu3sbOv70G3Svvx+qqwOhaYeg/F0XInLiaVCd7Z5EMJzELzQsmYQsLUPPU39Dx92/QGLbS5Al5ShpfBtKz/ownInTPCVkrBuCRHzqm3HsMc8jvBilYCgMGS1FsrMdnX/8FdpvvhaK7iVpgKSO7DodGr8lK1asUGvWrDHm4zGhBCQPv7jrumQnvsrQRjbiJ638b+fOw5uqqtGeiLNCjVZqOUCCMwRjCKUzkUCPclHrhPmG5hEkfgMjaYUYGfWhLRFHiZAo1YyNtjm0wos8thb0PMIf6Qge278P523ehJe6u1g3YLZNGZPIPOILAL490K2AXhlME+jeb2ptf6jPO1hET8KZOgs1l/0E0SNOQLJjnycNaIIYEMERo6ctXEkpRGkFXCL2WBdkaSWU4zAzGDHiV5phUdtJpCfQ/hYIJwxRUQ23uxOI93gKPlr1B7S1SHoIDod56xDb+CjavvNJJHa+6kk0eluRQR88flLK/3Zd96rh2goIWxwoEPHTykNOEOSu+pwJbMk09RniP7a8AvfMOxoHRaO8Sg/FLk+NoH02bQ9o+pFYTdeNNPEbGLWFwxW19ELbg0gejC0TxjNAKdSEQtjW04MzNj2LZzr2p/kdZOwn6eyoqak5urW19XULlmssjZKWsuM8J4Qo13t+4bfyhw45EnVf/TXv+d2O/VpBN0gi5O+uJi5SfmplzogSf7IXpq0ANHs8K5TXNsbBYN+RiEGWVSHZ/Aaav/oBJF5+ztsSWVsIM+xap0Nux/O0ezRFEzqF1APIAhM/KY7C2lPqP8lWrPc0acQvrZWfiH9aJMLET/ChEBwp91g30JsmZtSIP6QJn/pk0tbkI9X4wehe6g/hanIkgj8ceRQOKSn1LA5632nhmff9QojK1tZWynLjWu7CucbSvPYyulcrFTOI31OGOVMP9oi/ZpK3ag+F+I1Oh4ifRWgifGf0iJ8Orbj1TJa6PUMhfpbiHLid+9mnofbKm+A0zGSlIL/DOjTNuJqGiJYU0VaglYCW4mgKgOe1s0haHDiRoxQeMZBTzoLKyhTxF9o0N15hvESzB2II6/fvw2kbn0FMuSl/AWsS0QoC7WRyGIA3yO1Uj1Eu4q8XQjyvlPJkYNvDz/sAEY6i7ju3IzLnGJ7QnlNOgU1z4xYmgWQcsrwa8U2PoekLZ0NpfYnHJNKkOB6/0tLSI7u6uoyGVBVKCSgHc3M22Nq1a43nxH9Q1KtWHKWxNkd6q/9/HzQTC6qri8Q/yK0AMdDWRAKN1TX4r4NmpKQAc1iMl8akiuLrKfjKGiO/seQlTkp5nlKK7kmt/r12fk80rjjnM4jOOxEu7fmLxI/8YEr7HexF+JjFKD/7M9r1WPpJcaTQrerq6nq/NUZDplUj9duZa4cqXhhJl46VevXJIH7Jmn3yx//M1OloJ/NQkfgH7XPgaOeji6dOx2GlpSwBEMzHKkD7SXLBhjVGfmPpUmYb13VXWLB0Jx9XIXTQoSg/60Ik2/cNj1POgQBLJqDCUY5nKH/vxxCaNtszJfpvBWgsVpoxCrInIJ2HCCGO18Tfm6pH27vpgs9Nnc4actL2D2bim7AsY5OyYaNNmCMJ40B1pVAVCrG5k+XCvsQv9SQ6DsBswzv8lLdSSnflypUHA6BrefzSveC8NxPxi8ralO0/cMQ1nDBFHn6uR8ApV2YDy/N5pN8gCbi8inGa8mCzaEb7XRDwBKItGiOtqA2cEpCxIaVcqpSiZUG7bGni1xrsyeEwzpowkc1hg3HKYfOZECjVCj5S+tmwIBDmSCsae5JJvGfCJEyKRNgkaK8hmvjZf0r7BFDYcMTH5TeiJYRGfW0yTXmrRX/yeIsuOh1udwc78wSGMEcIJpyQF+MQKfGkn1DYgkXzfwc5SrXvQ3TJO9njkU2C6VIcbwNoTKSUS/QYpYZ3qHoAWUALAOeCc133BGuepjpiVutTa2pRrydqvhpx6vruRByt8Tia4nHsjcfZ3faNuAdrTsRTYshoE+ZIwegkp6ApkQhOraK0e97WwMa9NUZvojFav359nzHXML4mQ4GoR9cbwcgxSyAnTQXisUAR5sjAXKjWvSy2J/e3wN3XzPEDBsbuzEaRl4/PgZuEnDQNkWMWewNCvg99t3BEWySZmaMgSkB2XCvEA5ctW+asW7cubuVTT/P3Nxcuqa7hiZkP8Su90hHRn7zhKbQlE72mC2OqoWyMTgj/mH8cqsNhckYIHLEOF4wDLITAsupqrN6rfc77KpMIdoReQZI+Y2keeUSm5Uajmd8VPuokLQ2QtvoAEvsdB6qtBU3/+W7P34GlTe0jwLcoFuUnfO9u1u57noADfAf7FwhEjl6I7ofv8YvxMJLYPJ9xGxT93nDDDQwLFVAJSF5m0uSry7T9G7/1o0rLONBDDGLi08ObEnHePvgdHC+g700ElFiHC0Y4nVfmJdRl7KRPIsOMqQaeSVVATiW27od1A0KIqZboaW5OBcSEZs7l1Z+94NjTMmDEOmwwlxV0tMqzZ6I+bIHcJRyxHsDzXRjwO4jXxmMIT5+d8oxMw30vM27QJcsKFhdQKCWgaQwF/NT0tf17P5ZIifpwxAtx1Q4y+U582vPTX9Z287/eSgxhKQ9IiwJ7AkJxxCS5QudYQWiPUKJTVNtjzo+dOXMmOf54+wjb/GcmbSQKp3qCF9jjBIUwRwomPSuIjmlgMZ2uoVPHNAjKTmTs/Pm8gySJeA9E3RT2r2Dm0VcPQEft7NmzK8zqXYjFO1QgJaA5yAuwJFvWlKiQHBSTgBfIM9iwXDoznV6MGJYpGgeNWIcDxt+VYuKPUjixD+71QcQfVUp1WYk4+TLGnaetTeW9T7P90/dwBCIa5ZDlvCf5mIdJDwd6ntlJQMy1hnBT9w40VsB1GacUB8GKRWIGnFWoT4xH6SuvvCKCqgREfX19uL+8fiaz5WBX6l6umf4O+wgKYY4UrBen/ozXBjU0NJCYb/gow5YvXx62YL0rfwYj558CR5gjC/M7zPxL4YvCfAfpIMRChf2sHGMZKE9Aslfu2rWLMsd0ZWs0RejtSyYHHRDjs7ft847+nod+fAmCQtT54oVw2pF00c3u4/4ELITo3rlzZ5qAoD04jRRHf7t976V3xXs4Gs4Er4xNBxwdqmvmkpth0896r+uZ6PojTMbLQFf+XhjnICTdQjyWwcbT3kFjx2M11FRhhfYEpFBfmnmUxKA104zkLSsC3a6LPaTsIM2pFuHzmfh9iq/5TNT+xP5Mv4FMX4KgEHVeylEdAUmJQ3rIvGqyBmWYkZRSrXqMMsfSyJpE/G0ZpkOP+On+WA/clj28583b6SUQMNez1fex35ekYDnvJSLNMf/4aiZ+mb+VQTpQTW/ApcxPBtb7DvMSSiPedcUVVxDxB0oJGLe0yzszGs1HiCKAAGyijDYUDzCEie+HfA3MubVQ2opg/AaMLwGdBKO4fQSEqPOGCYFNnR5t++QiNMOxw6Sc8llByBOQYjd2Wq9Iz81H73x1M5cny8vMFSQtfnsrVIb9Prm/xYPta9aJSnIoAfuZf4NSApIfgJSIv/6ifk6f3IHmRbvIE/DKK6/ku4KkBCQYt1pHkb05bQWxkLWurRWfbJjODCA6SOL38OizH8uiBKSDVngi9MUbn2ZCNwzBbh/5Efxz/nGoC4fRRavqaBN1PnhRCn/d15b6PQP3BrTJ8gTstlFAMJ388zldm89IDb0vJfnz2fVQ7/ooM/GxI/YnoCJRqPY2NF18BtvxmYm5OiOTXnGd8irUfe8ezg4MvRj0UQJqq4jv/DPPylcJqGMAYs9S5jVvUH3SvxNss/bjKMi2nWg/VGBPwKTruo/prKZpyiRjuf9Layu2xboxKRROJcgcyL7dwoIPzv31AIaAlQVrisdy+hGMNT0AfY9Iia09PfhLa0uaz4WPGemJbJ6AWqSk43F9b3qtBp26u+eZfyKxdwdkVS0TyWD2u6MD82zzxo7vNwOSdh0Am4AtmN9h8NxHCZiZBi0Lc0K0FIk9OxF7hkoHeolkMhV++h3rA6sEXL58udTciXpB8eZOph6A7NUkgt/dtJdNVibl9UgpAR3Lj4Dz7mtfgpQfQUbewf6eFwSYMf/9vmkvu0KblOMZ4iN1PRaJRB7N4QloYI9Q+Sqd/y9ND0DiLbm/9vzjPs6RJ0hhFThC7wdG+3zLdg9t0+fPnJHYIuCRUALSM8qr0PP3P8HdR6nHnEzzH0lilGUrpvMz8hG4cGCtSabevQLgSStFtY0tvuCH27dhXzzBYnl8hJWARhpAypfAY0J8jrHQZHbn0yHBP9qxLdW/DLyYOoRPxmKxF3JkCGbdgFLqFaXUkxasd4Xzno7Ou//X20Nz8AuCSejZCNjY743PPnQBkBQsGwEPhxJQsvKR0o933v1z/t3HckP1Agj4pKYtp5BpwQqpBDQpp5SU8nY/fwDKBUATlpJZfnf76ygnz6mMfftwKgHz1SEEhdCzwSjHYFU4jGu3v46Xu7tSJdB8AkmIG1NdBpUrLRjpAbQ151bDL9PwrIkgseNVtN91A2TVBM7bHyxCHy4tviysEpCkjaTLSUI7bv8ZJwjlFON93YA9ruuNifKL5AxKOLDun6KtwO8A7DMMwUaWSVrxne1b8XBLC6e1ouSd+RC/fs+gCHi8OBJxKbJQCH9racZ3tr2eEv19iJ9WddIO3mKA2cZy/fr1JGZCT7Y2fW/6ZpRukRIda65Hz5N/hayohYh3D2y/GwRX3kETsEybKwNSAuYk/gSnT+958mF03H69x5yUL/HTmkbjdxvRlh4jFURPQILRvp8wRaakX2nlBZmWUh0znygn/vkvbOKiHqR9H2hykKEQcCEciYIA69bFR6gi8Xkv/JvzAcK/DqFJyUZj8YYuGppLfDROmruEEDfpe1OasZR7KknK8Rjarv40kttfBirrPEkgsMRfOAIeuiegJv7yKiR3vMI4JFxq7p16nn6WyanxaykljYnMor8JRk5AaxJRo68RQuzXGU1U2laA02ULvN7Tg9Of24AXerowMRROpbYeLgIuhA4hCGI/4eqVLipHvpFxyKnW+uJFadyTJHY1SWOkqB2IFEdpwZRSV2eT4ng/Te/cs8Mrqb3zNS9D0BiwCgyegN3CKAEVlSOvRXLnq2j98gVI7tmuMx/38eA027V9NTU133Nd12bGInBKwMywUinlNqXU13UnuOFpWwF4W4Hnuzrx5g1P4y+tzVz0wpT/Gk4CHooOYTRhMb3yP9TWglM2Po3NXZ1e8VP/wiCmDuPXyAGIqjTlyAZsrwxy5cqV9FqqI8DjlynF8YXaey2x7WU0X/ZexJ58GLKsIl1KCxTxD5WA3aErAbnsWBViTz+M5v98L+LbXkoVP/V5Ho+flPKq1tbW1wwjHivVgUkPQLT0fW26CPlNIl0iGNtjPXjHcxvwf60tKKP9UT97ed+BGyEloF/8gA0bTuKn6sEPtbZg+bPPMM5yVAUyfJBw/wNKBb5u3bpYHitDQs+N7wshHtVVgdK3AuxHn/RMg0270PLlc9Gz4RGvmo7Wqg8LUefy4zea/SAqAZWCKKtE7Km/oeVL5yLZtEtXBcpK/EQz613X/b5V/bmgxD8shUEyYPTcD+qtQLpd2TgI0d6fvKCUwuWvbfHShxmRLGBKQBqVbLkIDWy4pAF6Nu3xL3v1FcZVODvx24qjD9D3tWvXmmo/eY0l3auU+oDeCvD49Zn4VBeQKugm4tj/y6s4ySXfPFwreg4/foZlFb9HWQkovKQf7b/8BuOKfQ78S4Lx+Akh9imlLtDrC/9YaOIvtCeg31aAapu96LruuwH80cSaZ3qZcYFL8kHtaMeW7i4cUlqKTo6RLqwn4FB0CEae5ryD+nKzLUm1SIAlmEK7ENN7qXjqy11dHEtBv+cgfjq5pLeU8iUhBD0yMYjJQaI/fSffgffQ+AkhKJeA7qn1XlIAUoKX157nvW1oynS4xAgKTfz0dV+LFue9ldqk0eYtCcHLq/tVAubtyjtUT0B6FiXC2b4F8dde8GDJrMRPTLZbKUU4f8mI/sNB/AXNCegHW7ZsWWjdunU2g8kWppqKDhRWfHshCTiXDsFmKUZ2TmSI/bTKN8fjWGRyElrvNW2sDoXxj6OPxcRwmE2bKJA0YL7rRmf0wh+njuPIpDfJBhU0orPOpKV1zx6jroPYuaFmBU4WVuwnKWN/C5ouOROKipHY+DdERjn5vv8HTyFp0pYViIBRECWgFabFKMuF09QhdQqwQm7RhyUnYKZrMCmdKE/goQB+79FQ32IhJkEoTfajy8oxq6QUHVQ9t4AEnNC5yjJ1CG6eOgQ1gJyE5jAMq1BbAQqlPqikFEeWluFf7ft5+2EqBlsTRpjMMclk8nadS/4lq758PmNptM5zhBB3KaUIhYZHp7+XXGmTCYRnzeV6gVzmyhBlgVZ+PoiwKBuvlZPPxjf71dt6gIISsOtJHH73GinEtDEzJyCVbUsk4DTM4pyK8RefSW2bMtpiJGPC9V0AFiilSIoTeYxbIJSA5BpsbMo3ZSsTliJ+XTX3W7NmezBdVTeISkDae9N3Ez9AXNzLT9hbmLQQYn8f5SP5/JMD1azZjCvCGSkBfVYQUweASnv9hpq1fPly54YbbsinmAR/1yneyB+gKrPOQ+q9RCgkEYUjqLjwv72Yenc4KgVpAjZEbfLwEQ6M0o7j+d1gKgFBsbchVF74pV7it5hbRuAWj58Q4jfDSfzDogTUzMQE1V1M0ae6vrzjR/y0/58eieK+I4/BKTW16Ex6MQJBVQKarYo56QKTn9Ccw6EE9DL+JHBaTS3uO+oYTItGWQ9gFKamHxovjr5toZTyYi2JiTzGkodGSnmJUuokWwBLJ36vRLgzsQG13/gtIscugaJCoUSYw+XKm8OPn/UAw+bKK4emBKS2d+xHdP5C1H7jd1wd2FhRfNriaJo5SdMQq8MKvVAPhycg7S3MFp7Sg/+3DmbISvxUJ/Ch+cdywZD9idzEXwgCHsuORFIXBD21uhYPHX0s4y6ZvR4gTSLXdd0v6bEwiUD6G0tWw9TU1MzU9/J9ffqr7dfh6Yeg7uo7EDn2ZL03l+PalXdInoCEzM52RI47GROuuYtrLBIT8KkHSM8ypr8vA5i+evVqpWlLBd0T0K4vX+VXX55lHKUwIxrFn46cj5nRUrQm4rzKjQUCHsoWJFddw4E4IdF7CVeHRksZd4RDY0XJUl++Ks/68uTEpVpbWz+va9Pz+KX1VwethCZPQ83Xf8t7W9qbQzj9E/Wga+uNNgG7hVECamWmUz8DdV/9DRyqskRSTN8sQEYfTluBy1auXGkrngLrCUhHUteX/5Blk+5FtJ6sUSlx02HzMKukBO3JBNcJVGOAgIe6Bcn0G8j0JcAAcEC42pdMYHZJCX49dx6nW/f0EX36ZnwvPlRaWjpt3bp1PXZv/YifmIbruvXkQ6DhTjrxexp/qhFQfdl1ntKPVn62wWdLp1W42nqjR8Bu4cKBSY9BTGDabFRfdj3rTxinfXU6JqcGjcUUE6sRZCVgv/XlSYylFeuyaTNwcm0t2hIDI/6gEPBQtiCEJEpH5lfXkGBkYTD7p1w40FSJvYkE603+a/pBXnxF360AC1tCiOqurq4V/dWXt8KBzyGrZp8CodxXb/UvX/EpFmXZLk8EnDWXXqFq6402ARcwHDhVGrwF0eOXMS75vRmz1FLoVusx8S3sGpScgIw+CiRZuXKlb315zhqqFDv6fG7aQeiIe2J/vsQ/mJyAo+lIpGVodFJOQru2oSUR0X0UFfnw/OO4gvJA0qVF9TM/P/0g/G7vbnYUMo4uVvtMWqazyS24n/ryMf2ac6w8Ar3P0iGroakHo/y9H/cI1pH9E39BausNwQxHbQmF+hKw6+Yg4GThHImy4cUJwd3XhIr3rEL3X+9CYsdrKd1KxlaAPpyjlPqxECKw4cCmvvzsbPXlDfI+M/Ug1IVDA5rk40kJSAet8qTIa0kkeOVPfU4k0JxMpMyLA8GL1ObBqlAYn26YntLgZbTPPPJ48snIUV+eYHTy+GniT08wrIm57F0fhaTEmeRsM+DoP68AJufk69jHCTqpLHaSVn763LGPU2KlauuNRyWgmwkDRKwHonoC45QAnKQuvW88fkKIE4QQsy2n1GApAfurL28UfxPDEbx/wkSuaW+SWAyU+EebgAuxBQnr/bqXj7BXu09/Q7rWYX/9sGF0b0cyyTidoEOqMybRQOvLm2OxECKiRc9e5S2tvskkE37J4tOZYHlpGrHaeqNNwO7w5ASklGDdHYguPt1jqgTr0zz2oSGBdKGGOYFTAvZXX97Yq0+rrsHUSIQLWCBPc1gQCHioOgRyhTIipNlapH7T3/JlinHXxbRoCU6rqUnVYMhSX/54u7c+5j/Cy0n63vQtnB6/yLGL4UxqAGJdeWYB6q2tR/D0PHzWGVgCdoepMIhkSSo0cSqixyzSUm4fSce8ZAH919jYGAqiEjCRu7689/Xkai9YYyjpt30HbgwoAYcrI5FXkIFw6zGALN6B9PGIHGNJuRzp3sPNNWnt01dFjmz00lbnW/3Gp+9ji4DlMBYGoXmnED6KhOfeQc6Q4uiYp9O6x4LoCah0DLNvffkEuYcCOLKsnBWB7hCIf6wS8HA5EtHpugqHl5V7z0jT2qcx46l02xVXXIGM0lLyiiuuIK8hamJ9760ZWYBoC3PQoSRJsM1/bCXkCIYOQfjBKFaA/Cpmad6brgRMdY1oS49RMmhKQG7gzJkzK/zqy7PIB4USKbmGPaW1Yvu3GfMDRAlYCAnGF0b5FKDQEI6wf4UZEJ8VpIbG6Morr8wc85CGUfnwWt2+XguAHkMZKYEwLqzGgpGvK+8YJ+DCKgFN0JKXGETWTIIIRz0Jq88ruL/VeozokIEKB+aovCz15c3sowo2VMSCOphPdeDRDgcuVDThYM2YA9ED0L1VjkSJkOihavM+7RNClLz22mtpID2WprukaIr6Ehf/GoYoLfey1w7EzBUUM5yF39ENB3b8YXxbErKkjB2s3HhPtneUGIMSlXTXZtvRDwfW9eWp1akR9ZtEHDlnBZnnu98dqwSc+lm/I18/hIHgJaViS80v34lqeCmDrAKhWdtiw1JQ2rPaBJKPEnDMErA7ND+E/vwk6OQMQTnbRx8kbemoelNglIBWfXmaj13ZVpAeN8kmKzKEDVYJaE4yf9GPNkwMgIC9YmDmc+99/Ff135bUtanTlBgb2EpN0k/mvXZbBqsEpOdQngLaXmUeA6wvT1s4uq476wSMxbiuHpHBoJWAxvRnnewGbDsw5VICeo1KuzfFWHlO9KNDyHGvoL/9bUGyvdeYMwejBFQu49SNdUPFYrmYcffs2bNdnakpUEpAs/J3+dWX97y+vKQWu+MxNglyPHuexE+HKSLi1RX0PpsQKTKH9f88fY9lhjOf41rRlYuA6R32O+lOU+OwvwInjnWNd7/yFKLW/YNRAhK+HQhsj8fQnUymGIk1icxXqh7avWrVKiP2py6jmvOvvfbafn0Nv6bXAuARror3QLW8wW6slqiRlxJQxeN6tTPbCMX+BQzjhB79ELBJ+kFjbcyJxqRIachyit/Sq/prVnRX32f+0rP70SGYSkipNlv3c4z/YJSA5PxErsGtTYxjQy8ZKz+NZdsrr7zSbsGGrAQspBsw15d3XZdq0M+zGu1NUB0D8GxnB5bV1EImBz7J7WNCOIKQyF7eW+Rw5SWiq3NCKSnBcHCjdKH70U9byNnGKDD9XHndHFsQad9ve0ia++m3QTBFliykwPOdXqYcE29hvSOtvvwNN9zAXtkZSkAThkBFXY7M9OPg1S2ZRPz1lxE+4VSgqz1vJSApu6iqsEt6IINDo7JkV+BKj5CyufJKh0tp0bONW7IWyzy9UnlVb8IQv7ZQGHpVXfrWAOkpxbif2bYgNMkpp78lurPkJiVr8bn9KSkkjy0SOYeFI0hsfd5rDzlJ6eSqZtj1WG6zPAGHlCfQLPxp2+IhegKW6PryPyRvX5qnlJDSTCKTwursSVNw69wjsI9SJOXpCUgvpIQh5q2Z+2zCa6UmwsytgMHafvJb12Ztk7JooEk96aAoPLJoZt7LDEYAtU4oq46DvlMcQEL11Q1wDkQBTv2d71aAxP4JoRDO2bwJt+3dzbg2yUv0wbcJIX6slKKxMaYkeyxN/YYfCiE+o5RK47+UzYYmZcmyd6HmS/8Lta/Za2e+yq7OdmuVT0/qyat8ZXV2EZqYAyUc0St1WkJQnS2IUm9ntVDQ8zvamOAy36u0iC/KKjx4liAet4emuOY7affqrQFVTc7XT4LwUVGD1qtWofvhu3WKtd7oX50cJKRp63O6wpMohDNQQZSAA6kvb7pDee13xWKo0TUB8xF5iTCpKk5/xJBLD0ArcK539OdLUBcK5yTMXNWNMIBVnphkvkyxTErG6V/aPOmdtxfpe0djRnrUhvmMJUVyPqXdhXv5It2rJ2Ts6b/D3bMdspSKgPTvuZcJoxXcZMIxom6KgImozT7f73l0P6/SHvH3uZeuy1WslK6tnuj7XpjruLpRNnNdCILcdT1NXJ97+XlcMj1P/UgoAnfvDsQ3/N37vW+BUGHTlvYE7A6aJ6BdXz6WWQeADlrxSQdAtezJHMj+AHmKvMQ0KC9+l9b6EsHYsP6UgLnutS0K2dqS696BBDflujefIqkGRpOu1HFwV9NeDi+mPIEZ1o2B1pcn4idRlmZhrE8dADqpCEhbE3r+eR9ERbWX+2+gk1zDEOvhvTfv5WnPTHXxSPllYP09L9e9qf199niEnPfGY/33I8e93Ld8iZ+U4iXl6PnHfUi2NukyYb1bEyunBlnZ1gfZE9DUl9+Svb68d/xwxzbOA0BJLjEIT0CTMtyOnLPTiOd6Xq57B2KezHXvQET3XPdiEGZRCqemVGqE0wzFUWZ9+ScAbMlRX95xXVfqLMJPaOKne62neSt+xz2/hMtJQDwHlrydXiwi4X027ZUNrD+iyXVvNtE9Qw+Q9V41APt9rnupb/kqAYkp7WtGxz2/6B1ci2YsffNTRFt6jALnCZiZUIJq0XMP/UqDU02763dsQ4WOe8931SvCPBjhsywcxg92bOMai0b5l5qovSuI0GPSX315wwNXZ27h+EJWLEokXn8JHb//OYvzgiwDgS8NHkSYYKnBqahC++9/zjUWTZFQH/OfkFKu0bRVkAC+gisBM2LKyZ/8eSFEZWZcgLF70+pPiS3fVFnFmW3oe5CIK+gwInQqpvrI/n1488ZnuES4MSf6mP+otNfhSqnd2lsz2wrCr6qrq5vW3Nz8nM4JqB9nOb1w6G4UE761GuEjTtDSQK6U3EWYyCT+RAySagU+/ySaL1/p1VIwFqW+5j8qE0aBArvMGBWAVuPDkROw3/ryvD9V4NJf5z7/b7zW04Max+m3NPhgPQaDQKyFbgvhqsJxuDT4BS/8G100uXoD9uwVxMT0/0bXl+8vkATLli2LNjc3k7np1/peyutgednpcerpQus1FyGxd6eneU/kkxxkrMHcwj6PiL+kjAuEEg5VzPO98tnCmZwav9bE7xSS+IerMIhdX36/X315Uxr85e4uvGvTRuyMxXg1I6XgUAiEXdx0nAHPdK1oGy3iN/4FZJYbiIWiPxgn+9cr/454DGf9eyOnASNceu5JacSvjOWzurp6wPXl161bRzC6lsdPCEGup+nyKE1qKg2+81W0XHEB3L072QbOOUSGQiA8OXQMAOHOstWPCvG7npMRpy3jqtVWDYLBviPurfzJ1r1o/uoHkdxJacC8+BifHA6Ee6Khawq98g9nYRCqL08TbyuAb2arL29Kgz/T0Y5TNz6Nf+7fh7pIJLXCqTwIhJ7VTdpwIVATDvOs71IuSp0Q6sh+XUDpYqAwqQm1XErsTyYZNiEcTlX1cQfB2IhEasIRFvtP2/g0nm5vTzlYMfL968t/u62t7VXNDAZSYtq4TGyTUn5HpwXrUxqczXXEBF7ZhOb/eh9im5+ErJuiNeWJflJ8Z8A40WgSCIU8vQJ72iVYsmDpgrwbR1q6cF32CZDkoadXaFlZ62UwJlNfn5yF/TA27TkoayYg9vxTaPqv9yHxynOsSGUFYl/lbVLj/ioaCyIXoq1CEj/Rvt6QFOaBGTBeiIUQjyilTrC2B2kT1UxgCmP98kEz8Zmp01EZCqErmeRtAt3Aq6blNMTfNRHRQaavcsfB7lgPrt+xHfc0N6HdTeKwklJ+3ttr69jqQCvKSBF/VSiEPzU3sXb++e4uVEoHZ9VNwEVTp6MhGkUnedVpe68WkdJ8Igg/RqFCdn4y9ZG2/0c7tuEbr7/GbtX9ED/h/l9KqcX6O79sgGNJoaYkFVJTyCx4ohZHnT4T1Ql5xBqOovzci1F+1ofhlFexw0yq9p3y0bCb2gCkOY+WQJZUILlnO7r+cCO61/8Zbk8nQtMOQdlZF6Lk+JPhdnV6VodCE3oO4o+t/zNbPBLbX+EoyOhJb0PFmR+ErJ8J1d0JFevRLsnaKpDhNNRbsiwCWVoG1daM9j/ciI5bf+jdK3MSv6Pt/ou111/BiX84lIB9cswLISgLDTmglOnOycwOO1IiqYnhiLIyTnB51oSJXDJMU0PKbk4EQhOfKwhpncLW7m6s2bsH1+3chq096aGUdNw89wicM2kK2gdQeWgoMBOWSyv/zbvf4P155jEtEsUnpk7Df0ychNklpSnTF0kwJlCIFKWm2g89eGesB3c378V1O7bjOePua/vyphO/Mb12KKUoPdvmfF1H9eQw3aTxe0wIUabf0bdiMK2GJmHIjDkoPfNCzhtI5a8Y3WQft0RcsiRw3yJRdudN7tyK7r/dw8Sf2L29D85qLrseJW9+HycSHb7KQ44m/iS7BHc/uBqt3/1sn7Y4E+pRRv1b9i449QfxWLFeiyQeutco8sIRdu8lXwFy8ul5ZC067rkRia0vpMx/PmK/MdvSRxpoGr/ndaHdgtn+bZgYJuI3k4g+E/y9AO6wxBrhF9Jrm7HqIxGcWl2DpVU1zBQoBqDa8eYeRb3tiMWwobMDf2trxbq2Vs6syxOQmIlGLBE7MQ4q173xuAXsfWicdYZj5SeWTcU+KMPv0U89zrn+U1V8df/M+4lJnFJdg2XUv/JyTKP+hSikh9yVXd7jP9/ZiX/sa8VDra3YRY4mmvn5aPsNOukDMV1ivu8DcKduVq5U4LlgrEpxHGdFMplcbWek7WOq4gg5J+XMI2snI3rMYkTmnYjQjMMg6iazmywzio79SLbsQXzrC4hvfASxjY94Kcb5RnKNVZZPfJz99yf+7CHP1z42jGZHpbx37mvBnk+9Be6+1l5fB+kJy6n+lVchcnQjwkcvRPjgI3j7Q1KCcCmqrwtu614ktr6I+HOPIrbhn0g277b65wWt+RA/qVuMJzvRzF3Lli0r0QVdhkNK9zwiC60HyIBxbIyU8tOu6/7YWrjSUobb0gANhG3PpoOyCVEFHJr6pEwzSUXNYRRtmfcRQyBR+1MN03DdoXPRQkqYwWbeGYhpLhzBRS89j+t2bk8RvzXAHsJ92klbIMrzT9ewh2BGCXLj4Wd7+WVZ+UnC+hSAn5hmFSjG4xP6ma5+b1rK8DRpQK+kab9Hol4FHHo4EbFmaPwbDzy5AWslm/087RdffuaHUH3Rd5Bsa/aqAA/HViARh1Ndh9Yf/Rc6//grj1hpVc+ojMThy7Ti2/2jFZ8kVtIRJmKeiG8fhrH52/ntlZ/wyuPX2NhYun79+oK4/GaDEfGnUgQP10usSfRJANdn7HP6TiI9KTiTMEkFrgn8TV2Y5j3HHqnMwPsg1VO8MHNQ+MMR83H6hAloicfzrkbUH4wInRSQ9zU34YxNG/sQuV/6K5vZpbfc+93kGSDK9snu47fnJ9inNY6HTPxWjAdXcafxE0Jcb5kY+xYNNTebGH9Gsg79tR6eIiRaVTMSdfTBFSvSFGqu+DWiC9/OnnOQAytFNnCnnB5W8nU/9gBarvxQ73X+K7VePjMiB9MvYmmCfvNlbOnPs2nBJn47yc6wSOnDqQTMhJmS1e8XQvxSKVVp6/RyZaLhz/p/j6bTCaa/e03xg0mRCNbpqrokpvMKXSjiD4WwubMTpzz7NHbHYinCHUj7TP88mPf0LCJ+JsyoHkLaWeRC2moVkPhtWFhKGXdd9/0AyG+1Skd80nbD1iX5tJmI3fYl8P4bCF4YRu6yLmnQJ6LumjtZOaj2NXn1BQux8sdjvL1IbN/C2nm3ZS9x32x79OwMIa3HWRhHX1MfEX9IO2vx+I3Eyj+c1YGzwdiVXkp5u9ZMrzc0pcMdVX9psgir9v4354BYMPafFJIJ84znNuKFri5erQcSPDQQuzw96/muLpz57414YxDEr4G6bwMiftMEoYn/UY3TO8y+fRjGkrIGk+x9O4BFNH463JvakJIg/duM9DoA+RC/yR1I+Gndg5avXIDktpcgaif1pvgawp4f5JRTWYPEjlfRfMUH4LbsyZ/4Tb9MW/onfh4/7eQT0rSweKSIn2AZUj8DaYOWaRUYDpjewDFNXS6EaNYNoTOuEdObcEefVhqkbDA2retcaa7fdVL/nRaJqj8fdYxSS09TnQuXqtbGJWrfwqWqZeFStX/hUtWuz/1ZYM0Eb1zC99IzHjzqGDUtGk17R5b2xYnZZWtfPzBX32sGk84WKeUXLZw6IzCWLKouX76c0gJ9AUBq/DTu0/o3wL5x4JG+NzV+fa6TDv91JtSrum+tVg0PNqkpd72s6m97Tk254wU15a6XvPPOF1X97Zv5ry+MTvp810tq6v1v8LPkhPrUO3K0L61/efQtNT/N+GkY4e5y4zBKxD9CNJgusZEeYIRfzJs/Cm0EMAvA9wDszUCgQRYRtTGJ83ZY26ST9jVZCK7PgDj6O/39wvQZqumkJUotPVW1LzqZGQEzg8Ylqk0T+j5zNi5hot/buER1LTqZ76F7v3jQTBXKYDADbAu3XRN1Wv+s/to4sO9tokKf1dXVVCvOHHKkGDlppi3YDADfF0JQm9L6ZzGEVP80IaX1T+PAj+D6EpKUmlClKl95kZpy60bV8Ofdaso9r6opdzyvpqzZrOpXb/IYgiH2O17wYGs2e9fc86p3z60bVcXZFyk4TuqZOYg/E2bPPe6Pvi6tfxYO7HsJV9+nNIxZcDoSNMgwjALx2zCzctExTUp5iXY8MWaPfLgs2U3/rLMRbTf7K797bUI9pKRUXXPwoerVBY1KLTmFCZv+di1eproXnaxii05WicXL0n57bUGjuvbgQ9TsktLUc2T29nEbhBDbdduoje2DWEF6NG7IOD1dM086nFEYtzRpQLdlms5Ww+OXZ9/opPG7n3AkhNhh467PvdZnp2Gmqlz1VTXp14+rhvt2qKlrd6r6+3ao+j+9rqb84TVVT8R+9xaGNTywR9Wv3aUm//oxVfXRLyunfob1zKzEb9qQGj891/LpW2r8pJQXa1yZIzwK48YwTfujRvwpHwTPypVmVZoD4HwhxA81wWzU7pBNmnu+DuAZAPcCuFZKeY7FTel4c8bK2mdAhCUN0FkXCqv3TJiovjf7UHXvUceop487Ub18YqN6+cST1DPHnciwaw8+VL13wkRVFwqlSRQiN/En9SpwqtW+WbrN1wK4T/dlm+7bXt1X6vMDGgfnaZzwoXFlM+7RGDeG6a2AzchRUVFBkWvn63LkNH7PCiG26b7t1eO3QQixVuNgpZYkTN/erFdXgz8f4pJKmJWbGHBlrSpdtFxVfewKVXfVrWriT/5PTfrlI2ryz/+uJl7/oKq96hZmFCWL3qFkVW36tkKIXMTPuWDN+On2zdRt/i6AtUKIDbpPpn80ls/qvv9Aj99hGXOcnVxHmfjTtwKj1RgNM16/fGQgi66vaGhomEiOYcarMMt1UQ073xK/s0wiTxqwGYE5w0KoCsfhM2LETusMSZkmSWQhfpPCmSYAHdzPjDZzu2fPnl2t+1at+yd9rpN6n+gEaNxsRm5Ws7RDw8p13+gsN6uPfWhmYgrLnGeJ32mSXKY0QIzAZsJ8TSisZGmFEqXlCqFwn/EzhI/sq7fZkqXGb/78+dSHNNO1HiOhx4zHcObMmTSO0uc6E6cmAjRuo/piP5i0VpVUEh2KMLQbbO2bwj5INZPrAov4M/dhfYiXiJr285mTyYj4xCjo90zC93lewppE1IZMBZ1hdtS/kB8xaJi5ZlRXizxhXKbAOEb67G05WlTDpO5fWI+5uY6VYlLKD1nE76fn6cU96wccTdiy7xgSLBTypIbsuhqlYWaupMYvQ0HHzE7D7IjvTAcpaV0XRKbtAUdZD5DPxGIi18Eq/d3LA+M4zhkA9ugBZQ3zQPanNIGI0OlvDhE/E2Y0xQSjd55utSXfvskA4b5QEoJh7v32TRMNNA55/HJZeHwZgnXmYWmJ68+p8Rugdt7u26hvzcaKEnBYYdYkov3zQ9agp02kQSisMmEpwtewdbTnGyDxF2HZYWbVnKNxqvJl5AOEudoaYb7/1YzfKJnmRlIPcMBMIkdbGfbYE6nAdvm9UspL7XcGBAdjGWYUxITLiy1pwGwLCmmX3wOA5og8QIg/fSsQpAYWGGb2z3RM1dludhfQLk8T59qampqZo2GXH88wSxdijmlCCNK+7y6gXX6P1uhPy7BujER/07Z/GdsIMUJ4DtagDyOiUxNpwoQJxAgocIZEy+5B2uXX6Wc0BMQuP95htrm4XgfOrBNCGNfZfKS4brpXSkl+FQ0BsMvbBUBSxwhs0ceMErBg0oClGzDHoVLK87V3FjmjbPCxy2/QTiBklz83qHb5AwDmZy4+RJvqvq/HyPiN2Hb5jXpsv6/H77AA2OWFNh3WTpkyZTIlZNamYDpr6+vrJw23MnhcKwEHgHwnm71d23IHapcfbxr7sQDzw71tbw+yXV7q79SuLUKIFh0XQCd/1rAt+hpu6zBtrwIxmKMNG6hdPjQG7fIHAkyOMbu80LA6IcT+HFuV/YYBFFoncaApAQfDoce7XX68w4Jslxf0nxbxmy1FpR0sRX9pC1pnSSvD1b7AIKYIK8IOBJjURF1nhVPbfg3GLN2imQQ/Z5jacsApAYuwImxUYcs9yQRavG/xCTk2fg30m1eP3HtGIJWA/dkxhwQL0sAVYUUYCkMfRvHIEoDlmGQ7mSktHdTpa51C00ehlYC+dswhwmTABrMIK8IiBaSPKisjlu2antoCUBSsvlcWkj4KpQTMZsesLRCs1np3kAazCCvChkwfVVVVhwJozRD703QAAA6eMWMGXT9hGOljUGLNQOyYLYOEmc9bNAILbgYpwoowDK/Yn4s+WvQcb+0nKI22Aq3DTB+DUgIO1I45VNi+ETKDDASWVzhrEXZAj4cYK/QxWCVgf3bMtHMQMGMHbR4BM0gumHEOktmcSkYrmeMBChsr4yHyoI+B5JgYFvoYihKwPzvmUDnbiJlB/GB6VUnzKDvhhBPKtEhHBTEYcZZrsMmCM9oEMi5hY3A8ZNDpY0hKwAHYMYcq6thmkFqD1JEYzIxAobkA/lMIQclHX9AhqHQ+L4S4X+d0p2sw3uPHRws2Fsdj+dijj7w7bFhtrc7Ua4slgxX7bVhKxBkuX2g/mBYf6SDt7E0UMjrAdM83RyIRM/GK4cAFgo3h8ZB50Ed/xD/c9FFUAtKzrcl2gTHNWOnDEj6+2pnZZNqsBKChIBHSGISN9fEQB4QSUKfp3qLFnCZt3kgzWQwSZs5X9TtS7xzmlebzFqIHmoAyLR8giahWfoBCT6wDAjYOxkP0Qx/23M+lG3A18xsW+hiSJ6C+mTBr8tnXWc4JtYWAjURCBGuycR56nRbMt6JQPzAuIKFhlFyEjmJOwAN0PFb1Tx90Hqzt/IbYbSZGn+k3SjNXO3ny5CmFpI9ChwMPhxtwJmy4lDWEwIN17LWpOeg7sewU4f1UktmvnzmSueXGPCzf8Uil/Q7+eMBvjmsPv+YcnoD0W5VPIppC08fQ9muFDgAawThuY1q6xRIz+0w2mVEMpJ+qQOYZt+iBCwWV4AIIG9B4cIFQq1oTF/vIqN4UoPGQPnPc0T4ME/oLB9ZSA9PFMNHHARsObLTDlP89ls1MYxM6lQmrtOoCyv4LTJjaAEUfgQKNB1X4SX0vLVeyrKL3muzSQKDGY/k4CwceqzCzEnzB0i77Ev+8sjJ12+FHqhdPbFSvnNjInw8vLfOYgDUhrXvNs8guPaoVYMfTeBgCD804TNV88Wdq8i/+oSbduF7VfPF/VOigQ73r5JgYD6m/1w4gHHjY/GAO9JyAXlVHIaiCq7JzxRPyTdVfIv5dJy1SaulpqmvRyVwynD7veNMidVhZWaqEWIboaZ5F1W8REPfUMT0eLOJTbcYZh6nJt2xQU+/fpabc/YqaQuW/H9yrJv/uaRWafoiuESiDPh5Cw2p1YE+an8BI+MEUcwL2eoq9ZGmNU+KjIepb585jgt970mK1f+FSPukzwW6ZOy/tWkv0NIqrF4vegYUZD0PUNV/4mWog4r/tWTXlzhe987ZnVcP9b6iay3+Sdm2Ax0PQf3p/vz8AfjCBmggjAZNai1pjVZhJKWGMpr/ccVjsp5WfCL9dM4DmhUsZtuXERlVO1WgzpABrD7fHhGsazh8gHAQJlnM8Unv7kjIW++vv3uIR/l0v8d/6Nf9m2KRfPcrX+GwFgjYeUve3VvsJsF1/lPxgDjwloKWEqbJqzfXaYVNKvxDv+Xs0A6CzZeFS1bZwKcPoN2IS9j0Zk3e3fgcdxfRmgxwPwwBkaTnv+UnsN6t//e2b1ZQ7X2AY/UYMgMcigyEHdDyEZkij5gdzoCoBDVKp7y/qyZFmbyYdAP29zdoC0Mq/b+FS1aS3ALcdPi/tWkuMM8+igJVwQHEwpsaDTX20Bfji/6iGB5tY7KeVf8odL6gpqzexHoC2B/YWYIyMB0bLD6aoBMyhdCKRnlYS0vZvf1OmEvBUhh3evxLwvoAoncb8eLBIT8rZgw5Vk3/7NCsBeStgKQHDZAnINBUGfDyWj5IfTFEJCIS1cuWLenLYgSRpYv1hpWWs8KM9P4n9t5IZsEzvNXM7n3yhGBdQuPFImQGnHaJqLv8p7/kn3fhomhnQFv2L44EBSyFBasxI+5xTkc9YtqAMJ8MRiM5MRyAf7S0HpFRUVMzT75BBxMFYHA+hla78ubScz0wGURyPPIn/ANUDCMv77Jasziea0G0xn5hCDuI3K9et+tnF/AAFHg8W8Y2pj/f8jp/YXxwP9A87UJWAwk4dFY1GDzXBJ33sz9Zp9AK+k7LX3kwBLKngk9F2Ox3P42H0AsXxwKBgB7oScDjDT+lZdBQnW3E8AgkrKgH9Rc/PZyiOBpK1NVNhdal+VjEXQHE8xgosUI0ZbS30BSZCS0+itBRUlq92KgWVvs5OQVWcbEOHFccDI0T8B7gewIaF7SSUQojuAYielKjyt1p7TUdxshUOVhwPDC/sQFcC+sFY/NSrD6ehBvBHnXp6j0lDDYBSU/+XZVoy9walH+MFVhyPYYIVlYD5F6Ko1r7koYAVohjXsOJ4YLiI34YFq4EBgdnlptIODTOJH4PU5mwwE/zSb0o267rRbvN4Hg8RIFigGhNkmE0gQWiLoyd+yKqbF9Yx7yGbsK+44oq0FTRbEMrq1auNBt68I2QRV8jnHZmM40Adj7EKKyoBAwwzZ0gTXNjsa+lCv2yxfjD9PDqJkCtIbNZx5ib0lEVpnaXWEDYG8Y6QfQa0cm8R1nsUlYABgvGKbhG6zEVwhx56KO19pwE4HsDbAXxASkk5764G8HMAdwH4PyHEegAbtaLsVQA7hBCkONtrJZ7Yo2E7dIIKCpvdoO/9C4A79TO/o9/xQQBv0++eptuSdmS0mUV33bcUAwsQ7g9IWFEJGAzFVqrctQ+hR6qrq8mFdRmAjwL4NknpQojHALwOoD0Pz7jhgrXrtjyqGcU1Usr/B+AUXdQikqVvjlbkmW1E4MZoxTiGFZWAoyPO0+oXtjLgpA69ih4F4FxaaQH8SQhB+fE6BkCECcsRhk8LZpxmTJGN/oqzmuuMcw2f2gHHnAbWH5Po0gk+qHLvtbpv8wGU+zAEmaFXCMq4HQiwQDVmvBW4zCbON2jR/Su63PVWOwtOFr/2FPFZxTFHa+U3n1PFOTXTsT31st27VWfovRLA6QCm+kkI1pZhtMdSjGNYUQlYYBjvd83+yjrqIpHIO7QY/7CuXutHIAkfd9fRFPGHAsus3JtNaqDst/+k7QMAwtFEH4ZgzH9FpSIKBysqAQsDM2Y4PvTkpevIK+1TAP4ghNjlM/F5ZR/uFV0IXdeQ/gooKTVMZIGlrh0WJpHGFLJE+u3R3n4X6W1Rpg6BTZ4BnAdiLMGKSsChwYyImgYrKSlZDODrAJ4wuegy8tObldAdMlEz4UI5jlDhkFQhR/Dp6DPk9K1hONAzVRORni+955p38PMl/ead1I4hMgk3B0MgncRTAL4FYGGG15/QzKDo9Tc44k/fCgSpgQGFmQkXyliRFgD4hhDiWZ9JblZ4d7CEbog8FPKIkIgvX4Imwi2JOqq81FFV5Y6qrnBUTWVI1VaF+DPBykulKolIfke+z6c22kyCvvdKE0NiCJnXbRJCkKmz0R4AyyFKBGi+jBVYoBoTRJjjI+IfqgNTHveZvHG9cuW1yhtR3BBSrtVbCqi6qpCaO6tMLT2+Sq146wR10Tn16spPHKR+/F+z1S3fmqPWXn+E+vuNR6p//Xa+2rD6WPXSPceprfcdr3Y9cILa+cCJfO7+y4nqjQdPZNhr9x6vNt91nHrujmPVE7+br/7+yyPVfdcdoW6+ao76yRcOVl/7xEH8jve/ZYJaclyVmjurVNVVh7i92RmD1x+PKRjJZVBbBs4HkHEd4f6yyspKU/TTHMbSEqQ5JAIKKyoBs8GsVcUcZZGI8z7tZJMyz1n567Jp8X1hROAhs2JmiNHmrChz1LzZper0JbXq4vMb1E+/NFvd/5Mj1DOrj1E7HjhRdT96klIbFym1ebFSzy9R6t9LvL/0/d+LlXpusVLPLFJqgz6fWajUUwtV4l/eX/W0Pp9aqJJPLPSupec9u8i791n9nBeWKPWifjbBNixSPY+epPY+tEA9e/ux6t7r5nHbLv3AVHXWslpuc0VZKCdTIKmG06zlxxAMM7BhnQB+D4DGpsySzorbg35gRSWgP8y4sZpjNoAvCyFezJiUeaWrotXP7Kf9rqmqcNSCIyvUhe+ZrH58+cFq3S+O5BW7a32jR4xEhHRuWqzU04s00Taq2OONzAja/3GS6lp/En8m4qS/Hf/0/tI1dPY81qg6H/H+xh/3ThtmrrPvNc+iZ9M7zPPo3cxEnlrktckwiU2Luc1b7ztBPfzLI5kxrHrfFLXgyEredvTFjbd9cPKXENKYgYaR78RX9Zjx4RNNGKS5JkZZDxCMxgQExiuGtYIsAvBrSlCZocjjPf2AVnmZfd9+0JSoOmNprfrWRTPUAz+dp1679wSPoGiVJWJ6bjGvyvF/NarYYxYR/pOI0iPeBP32eCMTnPlOZ3wEYPTezvUe4+jJaB+1maUNYgzUn01LuG+07fjLDfO4z2ctq2McZOLFMEmSigbIEFhnkMGMyUPxppKSkqVIP0a7NLgIAsws/JkXhtesWWM46oECI2ImPCRNNNzKlStP1yaot/KFNAuVSlhx5gZmoc+DQVGiWuIiAkmXI+5Sv9dUhrDgyAqcckIVTj6hCsccVobKujDgCCCmgISLRELBdRVcBbguEAoJOJof0aMSSSDk9I5ckGH0PekqxBMeLOQIhMICiEjvAldhX3MMz77chYef2IeH/rUPT2xqR1Mbodo7CI+SLyW89OLZD/caZjwaQxbsQQA/ItOilFK5rkstlnrMR3v+jSpMBKkxowAz2mY6nHBYrojH3c8BOEnD2JlFKSoD0MtB/SagIwXPaZrw9k+HTC/BKQuqcPrSWrzpyApMnxIFSiWQUECPi564ywQSDvU+IygEPBwwYorxhGKmRmc4JIGoYQgudr0Rwz837Mfav7Xiocf34aXXyZu4F+/ERAjHxCRzjQdJCEopGt/U2AkhHldKfY/4vGYSsrGxMbp+/fruAM3JEYUJLQ6EbrjhhkQQGzgcsGXLlkXXrVtnlHaEg7OFEJ9XSp2orzHed06OlSa10tO/BM1sfcydVYrli2rxrtNq0XhUBUprw7zauZ3eCk//aFWjV9NtQSDM0YK5miHQrosYYDgiPIagBLra4nh0Uzv+sK4F9z7cgs2v9jIDut4bC3pG9jHSB1lkiCOYvR35aFy7evXq1StXrjRzgE4VpHk6EjDeCxxAxE8JNMLr1q0jjk/HWQAuF0Is1BPGTAaZS8yUmvATyd7fZzZEccayWrz7tDosOqoSZRPCQFJBdSXRE1dM6OExLM6PFMyWEKJhAVHq8BapszmBxzbtxx0PNOEPD7fgtR09Kdw7joDS26YBbA/og6NhjwL4JoB76Eey+lgLQ9DmbsFhtPCnON9oN2YEYJRmOu56G0ny1vsKxbTriZAi/IwJkzaJiPAJalac0hIHyxdV4z9On4i3LaxB9cQI0KOQiCWRTOpVXggkA0JcYxFGTDaRAKJRgVAZKRIE2nbH8OAjbfjt2j1Y+49WdHV70pdDXEMRs+13e0DbOmX5djwQCoW+nkgk/qa/O1oaCI1n4qeF/0BQAtJgulr5w+Y8AB+yJgJ9lNkmDE1EmljJpJva28+ZUYoLzpiEc5ZPwJxDy/hut8PliRgKecquoBHSeIAR4yUJwZES4QraAwAvvdSJ2+5vwk1/3IPn9RZBaKnA7X974GqY1DCy+HwNwCuUQu3KKylYMaUjCsp8LihsPCsBYTS9lHjiiSee+Jz23KuxlHtOrv097UlpAprHv3VhDT72nsl4+6JaVE0KsxIv3p30tP0QCAeQaMYjzHE86wqBw1GHZDt07ovj3r+34oY7duGBRyjQ0juYEWjFbI7tQdJSFrZJKb/ruu73tIMRw1etWiXH41Z5vCoBjYkHkYhzRiyWvEonojAKoazKvZQJT+/vaR/6/rdOwMdX1mPJ8VWsfUp2J1g0JQZBR9AI5ECCkQWFXAJYX1DuAHGFv/9rP352+y7c/kATemLe9oCsDaSotYdd+CsLzdzYQPohAPdR8lSCj0dpYNwoATUTM6p4Iv56IcS3lVKUv46OhFb+CF/7PWnmLcKvKHNYzP/k2VNw1JEVfHfX/iRPNrLNiwASw4EOI+UhJTourZSsK9i0qQPX37qLtwf7O5NpEgGtfcp/ESBg0ngOCiF+rZT6AoCd400aGG9KQNumfx5FjCmlppp9Xi7NPpmUDOGXlzr48Lsm46Jz63HY3DJ20Onp8MT8cNhTBA7H5C3CCrc9oC/0PUIWhJDAiy934se37MKNd+1Ge1eSb3KsMafDZ264GiZ1stTLAPx2vEgD400JSN8JXk/2XSHEuZZZz8nqvONIhtGKQCa6D5w5CZdcMA3z5pUDMRcxPVnYIy9Ak7wIGxgsliCur1BC1oMSief/3YHv/noHfnPPbsTI90B484IEghymQ3sO3aaUulhLA+PCUiDGgUNPj4a9C8CPhRAHZSh1fDT7gkXBRMITDsh2/6WPTceJ8yvZQy/WnYRgB59gTegibJDWA3JJTipEIw5EmcSTG/bhqv/Zhjv/r7mPotBvvmQojbdpN/Hf6+2zCVcOHH2MayVgY2Njyfr168nuQ5FelCDiM5bPfiryK3MwyURnHHhOnFeOb1w0A28/uY6VR93dSZ4MbO8PyOQtwgoEc0ka8L5ESFkoBO59qAVX/mwrHnu2PTU3MuM3MuZQam4JIa5TSpFVqVvDkkGij/GsBDT+2106596NAN7Un03fBPiROD+xJoSvfPwgfHzlFIRLHHS2JnjvWLTfHxgwkgYIVlYTQrzHxf+s3oWv/Wwb9rTEWRFMNxn3gX50A1Sf4UIAz1F6uPXr1/dYOqcg0cy4UQI6K1ascNasWRMD8B8AfkYlrSgdtVIqrfadPXD2qv/Bsybhyk/NwMyDS5FoS7CbLpuQAjhRi7DhhbmuYonPqQxh65ZufPWnW3Hj3bvzlQb2SSk/6brub41ETa8JEM2MGyVgmPb2Og6cCmf8px6QZDaHHqOxJ25++KxSXPP5WTjjrXXswNPdRYxaBG5SFmEjC3MpKDOmUFEmOUrz3v9rxue/+yo2b+kisxFPvxzSgO03cK2ek0rHFPSMMH2MayWg8eOfoN0136mRTy6cNhNLDRJxdmPm+dTZDfjmZ2egqi6EGMWaa80vRaKO9gQswoIBo4MkgkhlCG3NCXzlJ1vxo9/tHIg0QEBaTegp902ZUv6hN97o2K2lg0TA6GhMKgEjUsqY67qUH34NgMN19pdQVoceCsBxFQ45qAQ/unw2Tn9zHVRnAvG45+wz2pOtCAsurCemUFoiICtD+PNfmvDpb27Bi1u7B2IpMHOSirC+HwBliI6sWLECAaGjMakENCv/cnLCoOo6uYifRH4TCXbBOyfh2ksPxqT6MGL7Ep5yp2jWK8IGKA0kXYVoZQh798Rx6Xe34Nd/oFolXnxIDr8BoxdoIWc0KeV9rutS6q14AWjhgFICUpscKWXCdd0PA/hfLWJl9eMnzy5S9FWUSvzgsoPxkRX1UDEX8bjrxYsHYGIVYWNPGigrlew78Mtbd+GzV7+K9s5kmlLZzD9rTrLjkLZKfVRbqYgpuKtWrXKCstgGWQloE//luiKM0s4YJmyzT844GpBjDyvDr6+ag/lHVaK7Lc4DRQMatIlVhI0dGB2UjzBSHcYzz7TjQ19+AU8/39lfTIFtkqY5/B2tGIwFzUwoAkj8lJU36brud7T/NXv1+QXxGLGeBoICd37y37NRUeqgqzOJCCWfDMgkKsLGPqybLAXVDjo6kvjkN17Bb/6wR/sMeAzCRxpIKQeFENcopS7TDIF/DAi9BUoJyG2RUrqu6/4EwCdyRfCZJB10XH3xTPznx6Yj1p7k1FAUrTfaE6YIG38wV3lzS5Y4uPqG7bj8B6/yxCVGQItQFhdiMlPTFuA67UIsly9fHl67dm0sCFuBoCgB7ZWf9vu0d2KFil8QT4hiuxMuqisc3PTNOThz+SR07I0Vc+4VYSOWs7B8Yhh/vH8vLvjii2jdn0zNyX6chv5XSrnKdV12HTZz/0BXAtrE/wvtWpmV+CmxQzzhcrrtO34wF8ccXYH2PQnOGVcM1S3CRgLmkDRAwUV1YTzz9H689+Ln8cr27jTlYA4z4S/0AsdL1WgpBoOiBLQVfj8F8PGBEP9JR1bgzh8djqn1UbS3JFASLbryFmEjD4vHFUrKQ9i2uwcrLt6M9RvbeYtASWD7MRPSXP9kEBSDhgGMlhgS0sRPbpSXDIT4ly+swZofzkVF1EFHe5JXftOJIE2OImz8w5LaO7CkXGJ/p4uzL3ke9/2jlZkA1X8wR8Z8NnP8+0qpS0bbY9CkOAqNkpMPEf+XB0r8Z79tAu756REopSSQHUXiL8JGeSsgvVoP8U4XZWGJ3//wCJ6jRPwmstRnPod08BolFvmSnvfhA00JaDz8/p+O6Muq7TfE/6EzJ+HGb81BosdFrEexmS8oE6EIK8JiFFUaEXBKJD78xRfxq3v2pOZuP3kHPy6l/B/XdamAZ+xAUAIa4j8TwN2mRlsu4v/ouyfjf6+ag3hXEom4V0cvCINehBVhyoKxUovykUYdfPS/X8Ivfv9GLsUg+wloz1aihT+aGhbjWQlo9vzHAKAqLBXZPPwM8X/4rEn45bcPQ4wSc+oimkEa9CKsCAtZMFIAEr2XVji48Esv4Ma79yBMTMA/mpA8BulOSklEZcyfGelQYjmCxO+sXr2aqvNMAnAngErNAbMS/7nLJ+KX35pTJP4ibMzAXN7LAomeJH75zTn4j7dPRDypOPTcPqysQq6mhTsnTSqr11YBMd48AY33E8EeAHBatsAeQ/xnLK3F7687HG5cFcX+ImzMwRRFDNJfIfC+z27GH//ektoO5Egs8hcqQGW25SORcXgklIB2Dr/vA/hctpBe40218OgKPHjjUYhIgVi3W1T4FWFjVzFYItGTVHjLhc/iEfYTyOoxaHwEfgDgYp1jsHvMKwGt7L2Uw+93WYnf8Uo3HTajBH+/6WhMqAmhu6NI/EXY2IYppRAukdjdlMCSDz6LF7d2pWIHsvkISCkvcF33ZhMCP2aVgMuXL4/ooIfDADxOhXe0tt9+r06yoFBTEcLff3MU5s0pR0eb595rLgzCYBZhRVi+MAJTEZKS0hCee7kDSz/0LFr3J0AzmwjFJ3iIrIQdABYAoOxCoVWrVonhktKHVQm4du1aY+skblapO5dG/BxSyRVagFu+MwfzjqhAe2uCbapF4i/CxjrM1VWJuzoTOPKoCtzyrTn8mxfK3scqwASilYI3UUqx5cuXU6yACRwaG56A+nn0nbgWVeY9UXs/Odnq8l178Sy8/a0T0L43XvTtL8LGncdgJCzQ0xznOX71Z2fxdtdUlza0oKUBU3dwgRDiqrVr15JJUIwZJaDeWxjiPxXAX7Kl7jZpvD54xiT86ruHoaM5wYgqRvUVYeNVGojFFcprQ/jgpS/gN3/aky3jsF2KjGjor2QgW7VqFQpNq9Q0WxYpBIcxVVPLADwthDhEKcXefn4JPOfPKcMjN8/n73RBMZ6/CBvPMCkBGQJ6EsCi8zZgw4udLAmYZLaGPiyaeQnA8atWrerWWwE36EpAanRSF+r8tF+tPlZ/CMGi/vrfHI2jDivngpzF0lxF2IEASya9+oRPP9eBxR/ciO6Yy9fQmSVy8Hql1KeHwypQaCWg0A1cLIT4lK7S6/Sp2KPNINd+bhaOpgSenUl2lwzSIBVhRZgYJph0BDpakzj22Ep875JZXK+SpAAfByFHb58pPd4iE0AUVCUgfyfNpRDiJ5a2X6RV7OHCHArvOqUOHz+3AT374rzvVwEbpCKsCBs2WAKIRAVibXH8vwsa8O5T65gmTAFbc1gBcvTL9VQJe8WKFVJvswOnBGTxREp5qeu615j86H61+ibVhfGv3x2DqZPDSCY8eOAGqQgrwtTwwthEGBLYtSeOE855Bntb4mmmw8xaA5q2ri3UVqCQSkBOd1xbW3tQS0vLBm3H5GfbHTH1+m7+xhyc9/4p6NG5+4MyIEVYESZGofgIJRi95Y43cO4XX9T1BrI6CLUBoBJ5VLRQ6krZQ1ICykL5+0spVUtLyxUAqjU8nfhJ06lF//PeOxmxfUXiL8KKsEjE2wr8x3smM20ks28FiJBqAVxJty9btmxIegAj9YtCxPjrst3HAnjM6BXsBB/UaWIGFWUOnrltPmYcVIJkt8vwoA1IEVaEJUZ6K+ACMirx6tZuHH/OM2jvSvI1dGYUGqHTDYVCCxOJxBNaynZHVQlIropE6wC+rs19KjO7j9H6f/kj0zDrsDIkupJF4i/CijChiUgA3fuTOGRuGf77o9M9htDXKiA0bYUSicRXNQ2KUVUCLlu2LLpu3ToKWTwZwDq/BB8m0OeIg8vw5Or5nCyBjIPk/RQE5BdhRVgQYOQAR+nESLN3/Mpn8O8tXaky91kchIjm/jaUDEKFUAJSe+mkRAan+rn8GsXfH74/F2e8YxK6Wz13gVFFtA0jRmTB6Bj1iRDg9vUHo9Urs812P8z+ttg++DsIVYXw+3ub8J7Pb84WNmysa3+RUr7ZdV1jERhxT0DiRAmz+mvfZekX4//mN1XjwRuP5Np9rho94icY1w3ULC+pq7ykQi1coDvupW8Kavt64uRLMfqEng1GXwjWG8pp9YNz5qlAt89NKjbDjQpzUl6xkdIqB2/9yHP4v0fbslkFjKR9ipa8B51MNDRErz86vmilOk4dJL6Q6E9c7KpPHQQFgXgSiIZHb6LS0dyWYK6adCkSsdc3ga5zXYHaKicQ7Uu4FCyV3j5qc90otq8/WDwBdHRTrLtKW1mJYXHUtxCoLHN4Qo9K+5JAZ1fvbldla58anfYZRiSkwNc/cRAeenyfx7T6hg2bxfZyzQCgV/S89QCDzQlI95EEcIIQ4jHLW6lPpN97Tq3Dndcfgc6WBMKR0Yn04wIOYYGWfQmceN5GJjK+hjStWglD11aWO/jXb4/G5AlhxGJqxCYqty8isLspjgXnbcS+jmRa+whnNCnrqql981FbFeKVIih6FMITjfm+jgQWnL8BzW1Jz7kLvQ5g1P6qcgeP/OZoNEzyHMAM3oe7fYQn0kXtaYnjpAs2YF+HZ4GCbp9pR111iGNTJtaEWFIZqfZlwmgBCFeE8O5Pbsbdf21KbaMNbWl6M0FBb1JKPUk5BbVEPmDiJ1hokAlBmdiFEJdoTpSwYHyJRzwCX7hwGtw44IS8iTwaE9UDeO3p7lGckcXvIPie5jgmT4pwdZfICEkrjOSQwBtNcWzdZVeNTj/KSyQiIU8kpHuDlCg1GiHprj/8JtHcFsfUhggUlc4aSdfbCoG9rQa//kd5qYNSnYhmtIifDmKWKg586SNT8ceHm7nkvc2w9OHqQKGLhRDn57vym4VfDoL4qSnJ6urobKXUuzUs3eWXNf/AO5bUYMGxVYh3JUY10o9OKulcVuJg+uQwf6f20F/P3KK/A3hqcweUI3l7MJIcnxQPT27uYPHZtM20z3yfPiWCsjKH9QBBWPnTmJhSKCt3uI02fs1J2Z6pb8883wEVkbyijVT7aCxVVOLp5wm/ui1W20IGv5PDKK9wPD2FO3o4pTCaWFcCC06swulLa7wtiZR+gUJK0+BBRjk4Ep6AlLQQbW09F+iYf/ZJtm2WhDzq0CXnTWW5gMwboz1RKRGDU+Hg8INL9b6Ku8fEx0jXHbz1/iaQW4Mzgu3jF8cVbru/KdUOr429WmD6PndWKUTEYUIabW26DTNZnUSJxNyZZSn8epPZ6wfNDfp4C+GXFG0j2D5WmroKt67V+KW26LaplLONxm+pw3n82SowmkxWU+alF0xl/NnmQMaoR/1Ee+UAPkiwxsbGSL6egPmGA8srrriCintEAVxgYJkuv6T8W3xsFZY1ViPRmWDYaE9U1vJKYOlxVQaDaRyVCI1W2/sfacVjT7QhXBnibcBwTwSSTKJlITz6ZBv+vL41JRGkMVTdTMIpArby22IrXIElx1Wktdn0w8uHD6z9ZyseeWwfympCacxtuNpn9tOPPb4Pax9p5W2oKdVFh43nk4+vGrltST8wopn4/gQWn1CNxcdWMk2ZFGJWmw39fuiEE04oW79+fc+wegJSfv8rr7ySOMebARySrbIPHZ85px4iYkwYo49U3oJ0k0myCqVREvPclBlDd4/vo8nx2WteRTzmgq7wtMPD0z6uI8/c3cXnrn3V8wPnH3snJX0l7k/bl7c1VgOxZCAYqp/YirjLbSyNSm4zMdQ0j1BybEkqXPK9LUgmXAhWbmkb/DC0j/FHxThi3ph6ir3eURf82WNOpSUSpy2ogtsZnFT0lDXIKRX4zDlT0tps4ZQrC1HWrSeeeIJSh3Fhonz0ADIfJeD69etN3P+H6DdtjugdYJ3aaNbUErxzWS3cTtJmi0BMVDp7upI4eFYZ3tJYxb9TYgYbqTRBiLjWb2jHZ7+xBaW1Id4OmG1CYYmfpAvF7/jsN7fwO9nmy8SU7klJx1saqzHrkFLEuz3lbxBwasNIIRnvSWLWIWV4KzEqbb2wD+pbCr9XvYJwVYhxQFuaQrfP29YpluToXes37k9LvWXnp6DjLSdV89yIx4nBBgOnpFQlhvTOU+owa2qU227xLz40DSqzDRhOJSDtN+haYkdv13uQdK8/jcwLzpiIMm1KC4qpimFchBz43LkNGtiHozKSqXrLT2/fhctoklaEEA5L1m47BWoL6SOkI1FWHeJ3XL96F0soPg4fqeOz59R77QvYym/DjHHq02d7+LW7kmKyLuFR4PrVb+DSr29hHESjVC2nMA44NEbEXMmsGi4P4dKvv4KfrNnlmdJ8inEo3caLqM0Bc7Ai3Uo87qK8Nozz3jGpD1PV/TBuTW8j2iS9gKbVgisBzavPEEJUaQWEsMU78vojM9V5yydCdbmj7vXnF3oZb0/gtCW1eMfiGm8y+hRtpNJNNGGu+c0OrPjMZuxsTqBiUji1fySmlrf+gVdtT5IorQ6jqT2Bsz+7md+RJTMswuxJqbitp51ci9i+BAdwBgmnNozz37cl8JaTa7F8kYdfT8OewWSpWKYjce1N27Hys5vxBtWBqA3zdsA2geblQceWR8/nIFoX5mfS2F17845UKLpFNPzZ0Uxh+aJavPXkWsQ7gqGvSsMpKYI7XZz7jglMW0YKsPpBVxLmqqWUZ+nAPDEcSkCWPYUQ78/0+uNEn9LrwMknVGHuYWXobk8Gyk7NHNVMmKTC1RfP4r0q/W5PYNM13g44Arc/0ISTzn0GN67ehSRNruowT2qT1ZhOIlKagOmaecXmOuPNE4oIvpf2uzfevgtvOucZrH5AO3n4EL9nSlXcxu9dOgsuKSQDMimzwYiAJTE7pbjNtK/2HK36aLC9vPiOwJoHmrDg7Gfwi1t2gVxZSurCjCt6VneMBoeYpsc4CU8Gz0aaICUqwUpLBd/rCuDGWwm/G3D7gwa/fYlfb/9BupXvXTozTSIIEk5ZKoolMe+Iciw93tu6On1NgtQ3Us6/S38dcIjwQD0BhZXxZxMAUvV6Y2vtpQjR//uVQ/DRsxvQvT+OMMcaBTQLy4Qwrv/Vdnz621u4nXSdD1JTJi46jjmsDBe+ZwrOWlaLWTNLgAi5O5KNsZfQrZspOyI7+KDHxdZtPfj9X5rxi9/vxoYXOlIrkJ/YT++lNtPkvv7yg/HJD09Dx964Vy0pAPgbUFBLTRg//sV2fOZqD7/UF9O3NB2H5eU2/7AyfOx9U7gy9KxpJUCp1BTgnVQinqUptuiQqpynL2sRt+7owd0PNeMXd+7GMwa/Pnt+c5g2XU/4vXAaYi1xZrpBwF8mjPpAEtLPb96Jj33t5TSc6b6Zilv7AcwB8Mby5cujuixfQcKBw1LKuOu65+uSRex0YJBqu9I+u+ZYzGjwPOkMfLQR6CeS0+dIlYOPXv4iE6U9STMnDN1vh2ZSYpOTjq7A4mMqcfScclbQTKoJeRIFjUKny95wO/f04MnNnfj70/vw2MYOdpWlg8tCGd+DHMT/0fdMxv9+c47nRj2GCqZ4QS1AWY2Dj33xRfxc4zcbk+XbjEOUjd9jK3HsYeWY0RBFdUUIFaWScdDZ46KpLYGtO2PY8GIH4/fRje3Y35FMM0WbV2Uj/o8Sfr81h7dWdE0yIPjLhPGqHxJ4fUcMR618mvtp4D5RgudLKX/rum6YrMwFCQe24v6pxt+5up55qsKv4bTvXFqHP/7sCN5LeSagYCAwG1I5sNqROOfSzbjjL816knoCj+9E1dYEm/uag8TdCIcReoqbTq2ttw/i3PRc4zvfR+ynGApN/O87rQ6rvzcXsR5vXxsUzXReBTBo2xWWWPG5zbhT4zcbk+X+S5K4PB1M+iFQViL4frqaFpfObuMy1XuQ8paYiGEkme+gJlK0JeP3zXW47Xtz2SV5LOSnIMUxKUzP+Phz+NPfWv30RqziFkLcopQ6r7/EoXkpAXXCgVIAy7TYn2b7Nw09a1kNQKYLFTwEZsLoIJGS3BZpIpz/zkk8McjL0b7GnkQcRagdWmiy0WQylo+ubhdt7Qm07U+kiJ9+I7dTInzDOLIRv+N476U2nH/6JNx67VzEY2O3WhK32QWScRe3XD2X++Th1yNyPxzw/eQfoB1hCL+kLKTpSDhta09iX3syRfx8jUNMs5dxZCN+YkgUZUdtOE/jF0nSB3mWlbHAUIm2zjy5LkV0fQNweS+wVNNqUicOHbIS0NWw+QCm6/2GFflHWzDF+9PTFlSzs01QbP/9wUhJyWJAUuGmb8/Bl1cdxA5CNIl6fdn7TlRaS2iy0UpktLImpsA+Pe20m4qBz5yUBn/EJOi99Kyv/L/puOnqOey8Iki34gQDV4NlsglmYgo3XTMHX/k4pbvyGKltUs3EC/1hBSs5CdEyp/HUi2etqNUKWGKqNuHbz2NmrXUtrsbvzdfMYXfkpDY9jmb+h3wd2YjGohEym6Y7sulFWem4gKMJtmzZskghPAHNsUwj1WQf4YNXQAXMn1OO2bNK2FFltOK9BwNjQk0CXe0uvnbJTNz30yMwd2aJNtl5Yc3ZJqoF7Y0pyPB/95uUZkJ7WZFpVXIxZ0YJ7v3JEbjyklno2u96Yv8YJv40JkuMsNPFlZ+bhT9dPw9zZ5Yy86Rr2KKS4THoh2eDU4PnXONh9Aq9WacVDptRint/Mg9Xfn4Wt4XG3B0jxG/mKdHWwdNLcPShFILTa3XK0APQcQpJsuvWrUsWwhPQQ70QSy27Y+rF5jh1QRVkSTAj1fqDsQgYAqdnXn5qHdb/dj6+8JHpqKl0UrZ7EjNJ7M88sk1AP5hhmL22ZoXqCokvfGQaHr9lPt5xSh1r+6ktY1HszzV56ehoiuP0U2vx6O+Oxpc+Og01FG/BK7gnzrMoz7qWgeM009WYxogIg5SAHn4dXH7hdH7nO06tZW0/HckxRPwGxrRV6TCt0SH8E4cyrbq0CveTKmwgSkD+7dBDD6166aWXnqMtgBaaUwFAjGwXuOcHh+PMt0xAT3vCS2sVQAQOBMbWCykRqXaw5eVO/GzNG/jtn/Zg++7eOHKuZKyRzysS/dO8kZ/DmCMX195tBImrtpjaMCmC8985ER9fUY/Zc8rg7k+yHmGsmPqGFJwTlhDlDl5+oRM33PEGbr53D3bY+CU9gfEs9IzNHBPvxRN6zjE0+fnBOoMaoTYTv+e9YyJWvb8ec+aWAZ1JxGJuYE19YgAwUoFGa0L44/1NOPOzm/uYA63YnNcBzCXVlNYDhAabE5DKESVd16Wc/yYPecr2Tw2kxpHZ5rnbg2/+GxCMssdw+xUiJeSZIvHG9h7c/48W3P3XZvz9qf3Y3WzvjAZ+TK4LY+H8Srz7lDqOlZg0LQp0ueimPPAQCAcFB8MMowWDtNrl5Q5QJtG0swd/WteC3/+1Gf94emj4XXRMJd57Wh3evqQWk6dEgZiLWE/SM70GMIYilAeMDnKS2rYzhnnvfRr7OdbGbI9SEpGhXaLZDf1lDRb9RP+VrF+/nrhIyv5PqYd6NaveCrjgyAqsv/loL8vLWCb+DBh7npH5pdRbsUhu3LPTs+0//Xw7nn25C1u2d2NPS4Jtsz1xsstQdhzJueUm1oYxe3oURx1SihPnVWD+nDJMmhT1HIS6vBWJXjaWdCaFntA0fyJhCUTZhRB73+jB0y904l/Pefh9dUcP9rTEPPyyZ6DgIBnyOZlUG+LAsyNnl2HBkWU4dm45JtZHWURL7E+yAtEoc4PQX1EgGH1Z+IGN+Nem9hQN+vgDfEBKeVN//gAhSxzwUwKa3E7HMzBVocg7ONcbJQY8ohyy3EGP9qYKqkNFvjAiTBLJ2XzXGmfk1FWH8fZTa/H2t9Z5cmePQkdHUmv7vftpW0R+/JRdBlH2IvI82Tpd9HQlILosm3eA+jsaMMJBF1k8YjR3gIl1YY4leMuyOq09VBzF2dXjoifm3Us6kpKIRJQkNNpu0kmicMxFz/6ElwIs7PkNjCvJSYED7MonhHD8EWUeAyDmlq4HMDq7E1zXvWmoOQHNcZTmMPaWIRVPTZzXNDo5jicqwdgXoD3B17CG1BUoiQiUl+oEyzr7rBQKCcop0O2ZmkiaoGCO0UyNFlSYt/XxgPGYQoyTyPTqWghnhN8ackA30llSoauTTM4mOMbTDdAUpfyEQelbqICwVPpyCRx3OCFjt1750xynzBb9iP7iAoj2B5ILIEIJB/wsAMZGexSZJeKe+W+kEmmOLszyctR0b8xapsAEK6f0BHZHOR36WILRlCIR3171aEWnFOl0vX0d4d5LoBK8fiSGCcZkGHd5W8nzTtOgOayyfJSwh8X/FStWRAbjCcivr66unq6UosRk3sy3Vn56T2WZxKyGKK90pP0PErJGAmbHZ9NY0GoWpHx9Yx1mJEr25DOrv9aZjJXYCFVAGK/ucYUZ9SWsfKffzbUZUjrRbAP5A/jlBxiIJyBZANDW1kaZKEoMU0hZAPRF0yZHeV/sRQQGC1lFWBE2HmGxHoUpE8KYPjnCsBRj8FZ+b3UGSkOh0AztD5C/J2BjY2NY30yuhcbG2OvJptnvjIYSlFZStRcVSGQVYUXYeIIlNT1HKxzMqPcYAC3UPqXDkEgkpunvIm9PwPXr1xsLwAw/C4CRAGZNjXCQAv00WjXVirAi7ECBOQYWEpg5taT3R+uwaNUs3nIoOQGn5XJtZS5ESTMo8itgyCrCirDxBpOW4890cnTKODJolXV3jY2NocEoAY09caqfBcC8hFwuMQbiqYuwImw8wZAApk4kJb+d3idND0DHVNoe6GzevkrAnNWB6WbXdXUAcvpLjLJxcm2YtZJ25FqaOawIK8KKMBQUxrlhFeo1A/DLbk2HEGKi1uO5+XoC0p5Brlmzhj5X+638FG1FR11VGCJMnlkmQMPbCpSGLT5UhBVhRVjhYCXkwifYFVqDs0VKGtp1swUFZfMENBcS7ynPcDDw7AxUWEPnXmttjiPe5WVyseutc+M0FyvCirAiDAWBEaWGYq7OkNxbP9IcFq1S4gB+QraIQGHo2ScGgLgGaRk2CyFmKc/f0MoE5N1GQRnGG8v2EUh5EhVhRVgRhoLDOIkqONGsvfhrGjS0ugXAvNWrV8dXrlyp7K2AtfD33ksug/p9mu+gUgixU7/TpAajkmBGSVg8i2fxRDBOiy4Nre6cMWNGraFvHzr3Jf7UxVOnTp3AEQfWQzOJnxiOlIL/2mcRVoQVYRhGmAf3IX6bVol2jR5AZCV+qg2QAaSsIvSdLABN5qF+K38RVoQVYQgazNAq0W6NoWkf4hfwIX7DJaAVgG/oB7oB7nARVoQVYUjBiFbp3GWU+H7Er2nfl/g5Hb2G3a1fQoVBzIMNQ0g7i7AirAhDEGBEq0SzdxMBU1owW4GfRervsz+gG2R5eTnlGN8bEM5WhBVhRRgGBCOaPULX8HCy0bnI5Qm4fPnyyNq1aymhIGUX+TqAhUKI0oywQxMizJ+LsCKsCFOjATMBQJTD8xEAV0gpn3Nd15QIy0bnvuKAzSVSooM2KdRqxQKddVOmTJmsYQZehBVhRRhGBVZj9vzkxp9r5R+IEtCGOXofkXZk5ggswoqwImz0YZpW+yX+XErAbDBzSqo/bhKKFGFFWBGGQMD6od9M4k9jHv0RfxFWhBVhGJewQDWmCCvCirCRJP4B6gGKsCKsCBtnMF8lYBFWhBVhBwwsGJyoCCvCijCMGEwTv/z/M3nRjDXbLJQAAAAASUVORK5CYII=
-
-    '''
-    data = base64.b64decode(icon_b64)
-    ba = QByteArray(data)
-    buf = QBuffer(ba)
-    buf.open(QIODevice.ReadOnly)
-    reader = QImageReader(buf)
-    image = reader.read()  # Read QImage from reader
-    pixmap = QPixmap.fromImage(image)  # Create QPixmap from QImage
-    return QIcon(pixmap)
-
-class CustomTextEdit(QTextEdit):
-    """自定义文本编辑器，支持拖拽Excel文件加载"""
-    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent_widget = parent
         self.setAcceptDrops(True)
-    
-    def dragEnterEvent(self, event):
-        """拖拽进入事件"""
+        self.setUniformItemSizes(True)  # 所有行同高，滚动时不用逐行测量
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+
+    def setModel(self, model):
+        super().setModel(model)
+        model.row_state_changed.connect(self.update_row)
+
+    def update_row(self, row):
+        if row < 0:
+            self.viewport().update()
+        else:
+            self.viewport().update(self.visualRect(self.model().index(row)))
+
+    def keyPressEvent(self, event):
+        model = self.model()
+        if event.key() in (Qt.Key_Delete, Qt.Key_Backspace) and not model.locked \
+                and self.state() != QAbstractItemView.EditingState:
+            model.remove_rows([index.row() for index in self.selectedIndexes()])
+            return
+        super().keyPressEvent(event)
+
+    def _wordlist_path(self, event):
+        """拖入的文件里第一个词表文件的路径，没有则返回 None"""
         if event.mimeData().hasUrls():
-            # 检查是否有Excel文件
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.xlsx', '.xls')):
-                    event.acceptProposedAction()
-                    return
+                if file_path.lower().endswith(WORDLIST_EXTENSIONS):
+                    return file_path
+        return None
+
+    def dragEnterEvent(self, event):
+        """拖拽进入事件"""
+        if self._wordlist_path(event):
+            event.acceptProposedAction()
+            return
         # 如果不是Excel文件，使用默认行为
         super().dragEnterEvent(event)
-    
+
     def dragMoveEvent(self, event):
         """拖拽移动事件"""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.xlsx', '.xls')):
-                    event.acceptProposedAction()
-                    return
-        # 如果不是Excel文件，使用默认行为
+        if self._wordlist_path(event):
+            event.acceptProposedAction()
+            return
         super().dragMoveEvent(event)
-    
+
     def dropEvent(self, event):
         """拖拽放下事件"""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.xlsx', '.xls')):
-                    # 调用父窗口的加载Excel文件方法
-                    if self.parent_widget and hasattr(self.parent_widget, 'load_excel_file'):
-                        self.parent_widget.load_excel_file(file_path)
-                    event.acceptProposedAction()
-                    return
-        # 如果不是Excel文件，使用默认行为
+        file_path = self._wordlist_path(event)
+        if file_path:
+            # 调用父窗口的加载Excel文件方法
+            if self.parent_widget and hasattr(self.parent_widget, 'load_excel_file'):
+                self.parent_widget.load_excel_file(file_path)
+            event.acceptProposedAction()
+            return
         super().dropEvent(event)
 
 class CircularCountdownWidget(QWidget):
+    """圆形倒计时。按单调时钟上的截止时间计算剩余时间，定时器晚到不会累积误差；
+    只在圆弧或数字有变化时才重绘，灰色底圈预先画好缓存"""
+
+    ARC_STEPS = 120  # 圆弧按3度一格变化，60像素的控件上看不出更细的差别
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.total_seconds = 1
-        self.remaining_seconds = 1
+        self.deadline = None
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.on_tick)
         self.setMinimumSize(60, 60)
         self.setMaximumSize(60, 60)
         self.running = False
         self.finished_callback = None
+        self.shown_state = None  # 当前画出来的 (圆弧格数, 数字)
+        self.background = None
+        self.arc_pen = QPen(QColor('#4f8cff'), 6)
+        self.text_pen = QPen(QColor('#222222'), 1)
+        self.text_font = QFont("微软雅黑", 10, QFont.Bold)
+
+    @property
+    def remaining_seconds(self):
+        if self.deadline is None:
+            return 0
+        return max(self.deadline - time.monotonic(), 0)
 
     def start(self, seconds, finished_callback=None):
         self.total_seconds = seconds
-        self.remaining_seconds = seconds
+        self.deadline = time.monotonic() + seconds
         self.running = True
         self.finished_callback = finished_callback
-        self.timer.start(50)  # 20fps for smoothness
-        self.update()
+        self.on_tick()
 
     def stop(self):
         self.running = False
         self.timer.stop()
-        self.update()
+        self._refresh()
+
+    def _state(self, remaining):
+        if not self.running or remaining <= 0 or self.total_seconds <= 0:
+            return (0, None)
+        return (math.ceil(remaining / self.total_seconds * self.ARC_STEPS), math.ceil(remaining))
+
+    def _refresh(self):
+        state = self._state(self.remaining_seconds)
+        if state != self.shown_state:
+            self.shown_state = state
+            self.update()
 
     def on_tick(self):
         if not self.running:
             return
-        self.remaining_seconds -= 0.05
-        if self.remaining_seconds <= 0:
-            self.remaining_seconds = 0
+        now = time.monotonic()
+        remaining = self.deadline - now
+        if remaining <= 0:
             self.running = False
-            self.timer.stop()
-            self.update()
+            self._refresh()
             if self.finished_callback:
                 self.finished_callback()
             return
-        self.update()
+        self._refresh()
+        # 下一次醒来的时间：圆弧少一格、数字变化或到达截止时间，取最早的
+        steps, number = self.shown_state
+        step_seconds = self.total_seconds / self.ARC_STEPS
+        wake = min(self.deadline - (steps - 1) * step_seconds, self.deadline - (number - 1))
+        self.timer.start(max(math.ceil((wake - now) * 1000), 1))
+
+    def resizeEvent(self, event):
+        self.background = None
+        super().resizeEvent(event)
+
+    def _background(self):
+        ratio = self.devicePixelRatioF()
+        if self.background is None or self.background.devicePixelRatio() != ratio:
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            # 背景圆
+            painter.setPen(QPen(QColor('#cccccc'), 6))
+            painter.drawEllipse(self.rect().adjusted(5, 5, -5, -5))
+            painter.end()
+            self.background = pixmap
+        return self.background
 
     def paintEvent(self, event):
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background())
+        steps, number = self._state(self.remaining_seconds)
+        if not steps:
+            return
         painter.setRenderHint(QPainter.Antialiasing)
         rect = self.rect().adjusted(5, 5, -5, -5)
-        # 背景圆
-        painter.setPen(QPen(QColor('#cccccc'), 6))
-        painter.drawEllipse(rect)
         # 进度扇形
-        if self.total_seconds > 0:
-            angle = 360 * (self.remaining_seconds / self.total_seconds)
-            painter.setPen(QPen(QColor('#4f8cff'), 6))
-            painter.drawArc(rect, 90 * 16, -angle * 16)
+        painter.setPen(self.arc_pen)
+        painter.drawArc(rect, 90 * 16, -round(steps * 360 * 16 / self.ARC_STEPS))
         # 中心文字
-        painter.setPen(QPen(QColor('#222222'), 1))
-        painter.setFont(QFont("微软雅黑", 10, QFont.Bold))
-        text = f"{int(self.remaining_seconds + 0.05)}s" if self.running and self.remaining_seconds > 0 else ""
-        painter.drawText(rect, Qt.AlignCenter, text)
+        painter.setPen(self.text_pen)
+        painter.setFont(self.text_font)
+        painter.drawText(rect, Qt.AlignCenter, f"{number}s")
 
 class WordAnnouncer(QWidget):
     countdown_start = Signal(float)
     countdown_hide = Signal()
+    session_finished = Signal()
+    backend_state_changed = Signal(str)
+    word_highlight = Signal(int)  # 播报线程通知GUI线程高亮第几个词
+    word_spoken = Signal(int)  # 第几个词播完一遍
+    warmup_progress = Signal(int, int, int, float)  # 预合成进度：完成数、总数、失败数、预计剩余秒数
+    server_lessons_loaded = Signal(str, object)  # 教室服务器地址和课文列表（连接失败时为 None）
+    watched_reloaded = Signal(object, object, object)  # 重新加载前选中的课、这些课原来的词语、有变化的课名
+    folder_imported = Signal(str, object)  # 导入的文件夹和结果 {workbook_id: 有变化的课名集合}
     def __init__(self):
         super().__init__()
         self.setWindowTitle("小学生词语默写播报器")
@@ -158,12 +2755,33 @@ class WordAnnouncer(QWidget):
         self.tts_thread = None
         self.current_word_index = -1
         self.total_words = 0
-        self.tts_engine = 'edge'  # 可选 'edge' 或 'pyttsx3'
-        pygame.mixer.init()  # 初始化pygame音频
-        pygame.mixer.music.set_volume(1.0)  # 设置最大音量
+        self.session_words = []  # 本轮播报的词语
+        self.tts_engine = 'edge'  # 可选 'edge'、'pyttsx3'、'hedged'（限时，超时用离线）或 'classroom'（教室服务器）
+        self.last_ttfs_ms = None  # 最近一次边下边播的首个音频样本耗时
+        self.playback_speed = 1.0  # 播放语速倍数，播放时对缓存的语音本地变速
+        self.trace = SessionTrace()  # 本轮播报的逐词计时
+        self.trace_format = 'jsonl'  # 计时记录导出格式：'jsonl' 或 'csv'
+        self.audio_cache = AudioCache(os.path.join(get_app_data_dir(), 'tts_cache'))
+        self.backend_health = BackendHealth(on_change=self.backend_state_changed.emit)
+        self.synthesis = SynthesisService(self.audio_cache, self.backend_health)
+        self.offline_tts = OfflineTTSWorker(self.audio_cache)
+        self.audio_output = AudioOutput()
+        self.scheduler = SessionScheduler()
+        self.playback = PlaybackController(self.audio_output, self.synthesis)
+        self.hedged = HedgedSynthesis(self.synthesis, self.offline_tts, self.audio_cache, self.backend_health)
+        self.classroom = ClassroomClient(self.audio_cache)
+        self.voice_pack = None  # 打开的语音包，包中有的词直接播放，不用合成
+        self.render_pool = OfflineRenderPool(self.audio_cache)  # 预合成离线语音用的进程池
+        self.warmup = None  # 进行中的预合成任务
+        self.prefetcher = PrefetchPipeline(self._submit_synthesis)
         # Excel相关
-        self.lesson_words = {}  # 课名 -> 词语列表
         self.excel_loaded = False
+        self.current_workbook_id = None  # 当前词表在词库中的id
+        self.lesson_cache = LessonCache(os.path.join(get_app_data_dir(), 'lesson_cache'))
+        self.word_bank = WordBank(os.path.join(get_app_data_dir(), 'word_bank.sqlite3'), self.lesson_cache.load)
+        self.watched_files = set()  # 监视中的词表文件
+        self.watched_folders = set()  # 监视中的词表文件夹
+        self.reloading = False  # 后台线程正在重新加载监视中的词表
         self.load_excel_words()
         
         # 启用拖拽功能
@@ -172,24 +2790,40 @@ class WordAnnouncer(QWidget):
 
         # 信号连接
         self.countdown_start.connect(self._start_countdown_mainthread)
+        self.session_finished.connect(self.on_stop)
+        self.word_highlight.connect(self.highlight_current_word)
+        self.word_spoken.connect(self.word_list.record_attempt)
+        self.warmup_progress.connect(self.on_warmup_progress)
+        self.server_lessons_loaded.connect(self.on_server_lessons_loaded)
+        self.watched_reloaded.connect(self.on_watched_reloaded)
+        self.folder_imported.connect(self.on_folder_imported)
+        # 窗口显示后再在后台打开声卡输出流
+        QTimer.singleShot(0, lambda: threading.Thread(target=self.audio_output.open, daemon=True).start())
+        self.backend_state_changed.connect(self.on_backend_state_changed)
+        # 词表文件变化时自动增量重新加载
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.reload_timer.start)
+        self.watcher.directoryChanged.connect(self.reload_timer.start)
+        self.update_watches()
 
     def load_excel_words(self):
         excel_path = 'words.xlsx'  # 你可以修改为实际Excel文件名
         if not os.path.exists(excel_path):
             return
+        self.read_word_file(excel_path)
+
+    def read_word_file(self, file_path):
+        """把词表（第一行是课名，后面每列是该课的词语）导入词库，并设为当前词表"""
         try:
-            df = pd.read_excel(excel_path, header=None, engine='openpyxl')
-            # 第一行是课名，后面每列是该课的词语
-            for col in df:
-                lesson = str(df[col][0]).strip()
-                words = [str(x).strip() for x in df[col][1:] if pd.notna(x) and str(x).strip()]
-                if lesson and words:
-                    self.lesson_words[lesson] = words
+            self.current_workbook_id, _ = self.word_bank.import_file(file_path)
             self.excel_loaded = True
+            self.watched_files = {os.path.abspath(file_path)}
+            return True
         except Exception as e:
             print(f"读取Excel失败: {e}")
-            self.lesson_words = {}
+            self.current_workbook_id = None
             self.excel_loaded = False
+            return False
 
     def init_ui(self):
         # 倒计时控件先初始化
@@ -203,12 +2837,30 @@ class WordAnnouncer(QWidget):
         self.tts_combo = QComboBox()
         self.tts_combo.addItem("Edge-TTS(免费,联网)", 'edge')
         self.tts_combo.addItem("pyttsx3(免费,离线)", 'pyttsx3')
+        self.tts_combo.addItem(f"Edge-TTS限时{HEDGE_BUDGET_MS / 1000:g}秒,超时用离线", 'hedged')
+        self.tts_combo.addItem("教室服务器(局域网)", 'classroom')
         self.tts_combo.setCurrentIndex(0)
         self.tts_combo.currentIndexChanged.connect(self.on_tts_selected)
+        self.backend_label = QLabel()
         tts_layout.addWidget(tts_label)
         tts_layout.addWidget(self.tts_combo)
+        tts_layout.addWidget(self.backend_label)
         tts_layout.addStretch(1)
         layout.addLayout(tts_layout)
+        self.on_backend_state_changed(self.backend_health.state)
+
+        # 教室服务器地址，选择“教室服务器”引擎时显示
+        server_layout = QHBoxLayout()
+        self.server_input = QLineEdit()
+        self.server_input.setPlaceholderText(f"教室服务器地址，如 192.168.1.10:{SERVER_PORT}")
+        self.server_input.returnPressed.connect(self.on_connect_server)
+        self.server_button = QPushButton("连接")
+        self.server_button.clicked.connect(self.on_connect_server)
+        server_layout.addWidget(self.server_input)
+        server_layout.addWidget(self.server_button)
+        layout.addLayout(server_layout)
+        self.server_input.hide()
+        self.server_button.hide()
 
         # 选择Excel文件按钮
         file_layout = QHBoxLayout()
@@ -218,19 +2870,54 @@ class WordAnnouncer(QWidget):
         # 添加拖拽提示标签
         self.drag_hint_label = QLabel("💡 提示：可直接拖拽Excel文件到窗口")
         self.drag_hint_label.setStyleSheet("color: #666666; font-size: 12px; font-style: italic;")
+        self.folder_button = QPushButton("导入文件夹")
+        self.folder_button.clicked.connect(self.on_import_folder)
         file_layout.addWidget(self.file_label)
         file_layout.addWidget(self.file_button)
+        self.watch_checkbox = QCheckBox("自动重新加载")
+        self.watch_checkbox.setChecked(True)
+        self.watch_checkbox.setToolTip("词表文件被修改后自动更新课文列表，不打断正在进行的播报")
+        self.watch_checkbox.toggled.connect(self.update_watches)
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(WATCH_DEBOUNCE_MS)
+        self.reload_timer.timeout.connect(self.reload_watched)
+        file_layout.addWidget(self.folder_button)
+        self.pack_button = QPushButton("打开语音包")
+        self.pack_button.setToolTip(f"用 --export 目录 --format pack 导出的 {VOICE_PACK_SUFFIX} 文件，包中的词语无需联网")
+        self.pack_button.clicked.connect(self.on_open_voice_pack)
+        file_layout.addWidget(self.pack_button)
+        file_layout.addWidget(self.watch_checkbox)
         layout.addLayout(file_layout)
         layout.addWidget(self.drag_hint_label)
 
+        # 预合成：加载词表后在后台把所有课的词语合成到缓存，第二天默写时不用等网络
+        warmup_layout = QHBoxLayout()
+        self.warmup_checkbox = QCheckBox("加载词表后预合成全部词语")
+        self.warmup_checkbox.setToolTip("按当前引擎在后台合成当前词表所有课的词语，已缓存的跳过，播报时自动暂停")
+        self.warmup_checkbox.toggled.connect(self.on_warmup_toggled)
+        self.warmup_label = QLabel()
+        warmup_layout.addWidget(self.warmup_checkbox)
+        warmup_layout.addWidget(self.warmup_label)
+        warmup_layout.addStretch(1)
+        layout.addLayout(warmup_layout)
+
+        # 词库搜索：输入词语查找包含它的课文，输入“3-5”查找单元
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("搜索词库：输入词语（如 辛苦）或单元范围（如 3-5）")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self.refresh_lesson_combo)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        layout.addWidget(self.search_input)
+
         # 课选择
         self.lesson_combo = QComboBox()
-        self.lesson_combo.addItem("选择课文（可选）")
-        if self.excel_loaded:
-            for lesson in self.lesson_words:
-                self.lesson_combo.addItem(lesson)
         self.lesson_combo.currentIndexChanged.connect(self.on_lesson_selected)
         layout.addWidget(self.lesson_combo)
+        self.refresh_lesson_combo()
 
         # 间隔设置和倒计时进度条同一行
         interval_row = QHBoxLayout()
@@ -268,24 +2955,66 @@ class WordAnnouncer(QWidget):
         font_size_row.addStretch(1)
         layout.addLayout(font_size_row)
 
+        # 语速调节：只改变播放速度，缓存的语音不用重新合成
+        speed_row = QHBoxLayout()
+        speed_label = QLabel("播放语速:")
+        self.speed_slider = QSlider(Qt.Horizontal)
+        self.speed_slider.setMinimum(SPEED_CHOICES[0])
+        self.speed_slider.setMaximum(SPEED_CHOICES[1])
+        self.speed_slider.setSingleStep(5)
+        self.speed_slider.setPageStep(10)
+        self.speed_slider.setValue(100)
+        self.speed_slider.setTickPosition(QSlider.TicksBelow)
+        self.speed_slider.setTickInterval(25)
+        self.speed_value_label = QLabel("1.00x")
+        self.speed_slider.valueChanged.connect(self.on_speed_changed)
+        speed_row.addWidget(speed_label)
+        speed_row.addWidget(self.speed_slider)
+        speed_row.addWidget(self.speed_value_label)
+        speed_row.addStretch(1)
+        layout.addLayout(speed_row)
+
         # 词语输入
         words_label_layout = QHBoxLayout()
-        self.words_label = QLabel("请输入要播报的词组(每行一个，或用空格分隔):")
+        self.words_label = QLabel("要播报的词语(双击修改，Delete删除):")
         self.progress_label = QLabel("当前词语：0/0")
+        self.perf_checkbox = QCheckBox("性能")
+        self.perf_checkbox.setToolTip("显示本轮播报的延迟和缓存命中率")
+        self.perf_checkbox.toggled.connect(self.on_perf_toggled)
         words_label_layout.addWidget(self.words_label)
         words_label_layout.addWidget(self.progress_label)
         words_label_layout.addStretch(1)
+        words_label_layout.addWidget(self.perf_checkbox)
         layout.addLayout(words_label_layout)
 
-        self.text_area = CustomTextEdit(self)
-        # 设置文本区域的初始字体为正楷体
-        font = self.text_area.font()
+        # 性能数据（可选显示）
+        self.perf_label = QLabel()
+        self.perf_label.setStyleSheet("color: #666666; font-size: 12px;")
+        self.perf_label.hide()
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(1000)
+        self.perf_timer.timeout.connect(self.update_perf_label)
+        layout.addWidget(self.perf_label)
+
+        self.word_input = QLineEdit()
+        self.word_input.setPlaceholderText("输入词语后回车添加，多个词用空格分隔")
+        self.word_input.returnPressed.connect(self.on_add_words)
+        layout.addWidget(self.word_input)
+
+        self.word_list = WordListModel(self.is_word_cached, self)
+        self.word_list.modelReset.connect(self.on_word_list_changed)
+        self.word_list.rowsInserted.connect(self.on_word_list_changed)
+        self.word_list.rowsRemoved.connect(self.on_word_list_changed)
+        self.word_view = WordListView(self)
+        self.word_view.setModel(self.word_list)
+        # 设置词语列表的初始字体为正楷体
+        font = self.word_view.font()
         font.setFamily("楷体")
         font.setPointSize(28)  # 与滑动条默认值保持一致
-        self.text_area.setFont(font)
+        self.word_view.setFont(font)
         # 应用初始样式
-        self.update_text_area_style(28)
-        layout.addWidget(self.text_area)
+        self.update_word_view_style(28)
+        layout.addWidget(self.word_view)
 
         # 按钮
         button_layout = QHBoxLayout()
@@ -325,7 +3054,7 @@ class WordAnnouncer(QWidget):
                 background-color: #cccccc;
                 color: #666666;
             }
-            QLineEdit, QTextEdit {
+            QLineEdit, QListView {
                 border: 1px solid #cccccc;
                 border-radius: 6px;
                 padding: 4px;
@@ -359,53 +3088,179 @@ class WordAnnouncer(QWidget):
         """
         self.setStyleSheet(self.original_style)
 
+    def refresh_lesson_combo(self):
+        """根据搜索框或当前词表，从词库查询课文填充下拉框；每项的数据是课文id列表"""
+        query = self.search_input.text().strip()
+        if query:
+            lessons = self.word_bank.search(query)
+            placeholder = f"找到 {len(lessons)} 课" if lessons else "没有找到匹配的课文"
+        elif self.current_workbook_id is not None:
+            lessons = self.word_bank.workbook_lessons(self.current_workbook_id)
+            placeholder = "选择课文（可选）"
+        else:
+            lessons = []
+            placeholder = "选择课文（可选）"
+        selected = self.lesson_combo.currentData()
+        self.lesson_combo.blockSignals(True)
+        self.lesson_combo.clear()
+        self.lesson_combo.addItem(placeholder)
+        if query and len(lessons) > 1:
+            self.lesson_combo.addItem(f"以上全部 {len(lessons)} 课的词语", [lesson_id for lesson_id, _ in lessons])
+        for lesson_id, label in lessons:
+            self.lesson_combo.addItem(label, [lesson_id])
+        # 课文id在增量更新后保持不变，刷新后仍选中原来的课
+        if selected:
+            self.lesson_combo.setCurrentIndex(max(self.lesson_combo.findData(selected), 0))
+        self.lesson_combo.blockSignals(False)
+
+    def update_watches(self):
+        """按“自动重新加载”开关同步监视的文件和文件夹"""
+        wanted = set()
+        if self.watch_checkbox.isChecked():
+            # 同时监视词表所在文件夹：Excel 等程序保存时会先删除再重建文件，文件监视会因此失效
+            wanted = {p for p in self.watched_files | self.watched_folders if os.path.exists(p)}
+            wanted |= {os.path.dirname(p) for p in self.watched_files if os.path.exists(p)}
+        current = set(self.watcher.files()) | set(self.watcher.directories())
+        if current - wanted:
+            self.watcher.removePaths(list(current - wanted))
+        if wanted - current:
+            self.watcher.addPaths(list(wanted - current))
+
+    def reload_watched(self):
+        """增量重新加载监视中的词表：未变的文件只比较修改时间，未变的课保持原样，
+        正在进行的播报不受影响；音频缓存按文本寻址，没改动的词语不会重新合成。
+        解析在后台线程进行，不占用界面线程（倒计时由界面线程的定时器驱动）"""
+        if self.reloading:
+            self.reload_timer.start()  # 上一次还没加载完，稍后再检查
+            return
+        self.reloading = True
+        selected = self.lesson_combo.currentData()
+        before = self.word_bank.words_for_lessons(selected) if selected else None
+        files = list(self.watched_files)
+        folders = list(self.watched_folders)
+
+        def reload():
+            changed = set()
+            try:
+                for path in files:
+                    if not os.path.exists(path):
+                        continue  # 保存过程中文件可能暂时不存在，等目录变化再处理
+                    try:
+                        changed |= self.word_bank.import_file(path)[1]
+                    except Exception as e:
+                        print(f"重新加载词表失败 {os.path.basename(path)}: {e}")
+                for folder in folders:
+                    if self.word_bank.prune_missing(folder):
+                        changed.add(folder)
+                    for names in self.word_bank.import_folder(folder).values():
+                        changed |= names
+            finally:
+                self.watched_reloaded.emit(selected, before, changed)
+        threading.Thread(target=reload, daemon=True).start()
+
+    def on_watched_reloaded(self, selected, before, changed):
+        """后台重新加载完成后，在界面线程中更新课文列表和词语列表"""
+        self.reloading = False
+        self.update_watches()
+        if not changed:
+            return
+        print(f"词表已更新: {len(changed)} 处变化")
+        self.refresh_lesson_combo()
+        self.start_warmup()
+        # 没在播报时，如果当前课的词语变了，刷新文本框
+        if not self.is_playing and selected and self.lesson_combo.currentData() == selected:
+            if self.word_bank.words_for_lessons(selected) != before:
+                self.on_lesson_selected(self.lesson_combo.currentIndex())
+
+    def on_import_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "选择词表文件夹")
+        if not folder:
+            return
+        # 几十个词表逐个解析较慢，放到后台线程，导入期间按钮显示忙碌状态
+        self.folder_button.setEnabled(False)
+        self.folder_button.setText("导入中…")
+
+        def import_folder():
+            imported = {}
+            try:
+                imported = self.word_bank.import_folder(folder)
+            finally:
+                self.folder_imported.emit(folder, imported)
+        threading.Thread(target=import_folder, daemon=True).start()
+
+    def on_folder_imported(self, folder, imported):
+        """文件夹导入完成后，在界面线程中刷新课文列表"""
+        self.folder_button.setEnabled(True)
+        self.folder_button.setText("导入文件夹")
+        self.watched_folders.add(os.path.abspath(folder))
+        self.update_watches()
+        print(f"词库导入 {len(imported)} 个词表，共 {self.word_bank.workbook_count()} 个")
+        if imported and self.current_workbook_id is None:
+            self.current_workbook_id = next(iter(imported))
+            self.excel_loaded = True
+        self.refresh_lesson_combo()
+        self.start_warmup()
+
     def on_lesson_selected(self, idx):
+        self.prefetcher.stop()
         if idx <= 0:
             return
-        lesson = self.lesson_combo.currentText()
-        words = self.lesson_words.get(lesson, [])
+        lesson_ids = self.lesson_combo.itemData(idx) or []
+        words = self.word_bank.words_for_lessons(lesson_ids)
         if words:
-            # 去除重复词语，保持原有顺序
-            unique_words = []
-            seen = set()
-            for word in words:
-                if word not in seen:
-                    unique_words.append(word)
-                    seen.add(word)
-            
-            self.text_area.setPlainText('\n'.join(unique_words))
-            self.total_words = len(unique_words)
-            self.update_progress_label()
+            self.word_list.set_words(dedupe_words(words))
 
     def on_start(self):
         if not self.is_playing:
-            # 格式化输入
-            raw_text = self.text_area.toPlainText().strip()
-            words = re.split(r'[ \t\u3000\r\n]+', raw_text)
-            words = [word for word in words if word.strip()]
-            formatted_text = '\n'.join(words)
-            self.text_area.setPlainText(formatted_text)
-            self.total_words = len(words)
+            # 播报期间使用这份词语快照，列表锁定不能编辑
+            self.session_words = self.word_list.words()
+            self.total_words = len(self.session_words)
+            self.word_list.reset_state()
+            self.word_list.locked = True
+            self.word_input.setEnabled(False)
             self.update_progress_label()
 
             self.is_playing = True
             self.is_paused = False
+            # 每轮播报使用新的调度器，上一轮残留的线程会随旧调度器一起退出
+            self.scheduler = SessionScheduler()
+            self.trace = SessionTrace()
+            self.scheduler.start()
+            if self.warmup is not None:
+                self.warmup.set_paused(True)
             self.start_button.setEnabled(False)
             self.pause_button.setEnabled(True)
             self.stop_button.setEnabled(True)
             self.clear_button.setEnabled(False)
             self.lesson_combo.setEnabled(False)
-            self.play_thread = threading.Thread(target=self.play_words)
+            self.search_input.setEnabled(False)
+            self.play_thread = threading.Thread(target=self.play_words, daemon=True)
             self.play_thread.start()
 
     def on_pause(self):
         if self.is_playing:
             self.is_paused = not self.is_paused
+            self.scheduler.set_paused(self.is_paused)
             self.pause_button.setText('继续' if self.is_paused else '暂停')
+            if self.is_paused:
+                self.prefetcher.cancel()
+                self.playback.cut_audio()
 
     def on_stop(self):
+        was_playing = self.is_playing
         self.is_playing = False
         self.is_paused = False
+        self.scheduler.stop()
+        self.prefetcher.stop()
+        self.playback.cancel_all()
+        self.countdown.stop()  # 停在倒计时中途时，不再走完并触发过期的回调
+        if self.warmup is not None:
+            self.warmup.set_paused(False)
+        if was_playing:
+            QTimer.singleShot(200, self._report_stop_latency)
+            # 稍等收尾的线程记完最后的阶段再导出
+            trace = self.trace
+            QTimer.singleShot(300, lambda: self._export_trace(trace))
         self.start_button.setEnabled(True)
         self.pause_button.setEnabled(False)
         self.stop_button.setEnabled(False)
@@ -413,189 +3268,363 @@ class WordAnnouncer(QWidget):
         self.current_word_index = -1
         self.highlight_current_word(-1)
         self.lesson_combo.setEnabled(True)
+        self.search_input.setEnabled(True)
+        self.word_list.locked = False
+        self.word_input.setEnabled(True)
+        self.total_words = self.word_list.rowCount()
         self.update_progress_label()
 
+    def _export_trace(self, trace):
+        if not trace.events:
+            return
+        path = os.path.join(get_app_data_dir(), 'traces', f"session-{trace.session_id}.{self.trace_format}")
+        try:
+            trace.export(path)
+            print(f"播报计时已保存: {path}")
+        except OSError as e:
+            print(f"保存播报计时失败: {e}")
+
+    def update_perf_label(self):
+        stats = self.trace.summary()
+        if stats['p50'] is None:
+            self.perf_label.setText("延迟: 暂无数据")
+            return
+        hit_rate = f"{stats['hit_rate'] * 100:.0f}%" if stats['hit_rate'] is not None else "-"
+        self.perf_label.setText(f"延迟 p50 {stats['p50']:.0f}ms / p95 {stats['p95']:.0f}ms · "
+                                f"缓存命中 {hit_rate} · 回退 {stats['fallbacks']} 次")
+
+    def on_perf_toggled(self, checked):
+        self.perf_label.setVisible(checked)
+        if checked:
+            self.update_perf_label()
+            self.perf_timer.start()
+        else:
+            self.perf_timer.stop()
+
+    def _report_stop_latency(self):
+        latency = self.audio_output.last_stop_latency_ms
+        if latency is not None:
+            print(f"停止播报延迟: {latency:.0f} ms")
+            self.audio_output.last_stop_latency_ms = None
+
     def on_clear(self):
         if not self.is_playing:
-            self.text_area.clear()
+            self.word_list.set_words([])
             self.current_word_index = -1
             self.highlight_current_word(-1)
-            self.total_words = 0
+
+    def on_add_words(self):
+        if not self.is_playing and self.word_list.add_text(self.word_input.text()):
+            self.word_input.clear()
+            self.word_view.scrollToBottom()
+
+    def on_word_list_changed(self, *args):
+        if not self.is_playing:
+            self.total_words = self.word_list.rowCount()
             self.update_progress_label()
 
+    def is_word_cached(self, text):
+        """这个词是否已有任一引擎合成好的语音"""
+        if self.voice_pack is not None and text in self.voice_pack:
+            return True
+        return self.audio_cache.contains(edge_cache_key(text)) or self.offline_tts.cached(text)
+
     def highlight_current_word(self, index):
-        cursor = self.text_area.textCursor()
-        fmt = QTextCharFormat()
-        # 清除所有高亮
-        cursor.select(QTextCursor.Document)
-        fmt.setBackground(Qt.white)
-        cursor.setCharFormat(fmt)
-        # 高亮当前词
+        """高亮第 index 个词并滚动到可见处（只在GUI线程调用），只重绘新旧两行"""
+        self.word_list.set_current(index)
         if index >= 0:
-            lines = self.text_area.toPlainText().split('\n')
-            # 检查索引是否在有效范围内
-            if index < len(lines):
-                start = sum(len(l) + 1 for l in lines[:index])
-                length = len(lines[index])
-                cursor.setPosition(start)
-                cursor.movePosition(QTextCursor.Right, QTextCursor.KeepAnchor, length)
-                fmt.setBackground(QColor(255, 255, 0))  # 黄色高亮
-                cursor.setCharFormat(fmt)
-                self.text_area.setTextCursor(cursor)
+            self.word_view.scrollTo(self.word_list.index(index))
         self.update_progress_label()
 
     def say_text(self, text):
-        """根据 tts_engine 选择 TTS 服务"""
-        if self.tts_engine == 'edge':
-            # self._say_text_edge(text)
-            self._say_text_edge_direct(text)
+        """根据 tts_engine 选择 TTS 服务，返回 Utterance（播放开始/结束事件）"""
+        utterance = Utterance(self.scheduler, text, self.trace, self.audio_output.generation)
+        utterance.trace('request', engine=self.tts_engine, cached=self.is_word_cached(text))
+        clip = self.voice_pack.get(text) if self.voice_pack is not None else None
+        if clip is not None:
+            self._say_text_pack(clip, utterance)
+        elif self.tts_engine == 'edge':
+            self._say_text_edge_direct(text, utterance)
         elif self.tts_engine == 'pyttsx3':
-            self._say_text_pyttsx3(text)
+            self._say_text_pyttsx3(text, utterance)
+        elif self.tts_engine == 'hedged':
+            self._say_text_hedged(text, utterance)
+        elif self.tts_engine == 'classroom':
+            self._say_text_classroom(text, utterance)
         else:
             print("未知TTS引擎")
+            utterance.done()
+        return utterance
 
-    def _say_text_edge(self, text):
-        """使用 edge-tts 合成并播放语音，超时时回退到pyttsx3"""
-        def tts_and_play():
-            try:
-                import asyncio
-                import edge_tts
-                mp3_path = f"_edge_tts_{uuid.uuid4().hex}.mp3"
-                rate = "-30%"  # 语速调慢，越负越慢，可根据需要调整
-                
-                async def run_with_timeout():
-                    communicate = edge_tts.Communicate(text, "zh-CN-XiaoxiaoNeural", rate=rate)
-                    await communicate.save(mp3_path)
-                
-                # 使用asyncio.wait_for设置超时
-                asyncio.run(asyncio.wait_for(run_with_timeout(), timeout=10.0))
-                
-                pygame.mixer.music.load(mp3_path)
-                pygame.mixer.music.play()
-                while pygame.mixer.music.get_busy():
-                    pygame.time.Clock().tick(10)
-                pygame.mixer.music.unload()
-                try:
-                    os.remove(mp3_path)
-                except:
-                    pass
-                    
-            except asyncio.TimeoutError:
-                print("edge-tts连接超时，回退到pyttsx3")
-                self._fallback_to_pyttsx3(text)
-            except Exception as e:
-                print(f"edge-tts异常: {str(e)}，回退到pyttsx3")
-                self._fallback_to_pyttsx3(text)
-        self.tts_thread = threading.Thread(target=tts_and_play)
-        self.tts_thread.start()
-
-    def _say_text_edge_direct(self, text):
+    def _say_text_edge_direct(self, text, utterance):
         """直接播放音频数据，超时时回退到pyttsx3"""
         def tts_and_play():
             try:
-                import asyncio
-                import edge_tts
-                
-                async def run_with_timeout():
-                    # 设置超时时间为10秒
-                    communicate = edge_tts.Communicate(text, "zh-CN-XiaoxiaoNeural", rate="-30%")
-                    
-                    audio_data = b""
-                    async for chunk in communicate.stream():
-                        if chunk["type"] == "audio":
-                            audio_data += chunk["data"]
-                    
-                    # 使用soundfile读取音频数据
-                    audio_io = io.BytesIO(audio_data)
-                    data, samplerate = sf.read(audio_io)
-                    
-                    # 直接播放
-                    sd.play(data, samplerate)
-                    sd.wait()  # 等待播放完成
-                
-                # 使用asyncio.wait_for设置超时
-                asyncio.run(asyncio.wait_for(run_with_timeout(), timeout=10.0))
+                # 预取还在下载时直接跟上这次下载边收边播，不等整段下载完
+                if self.playback_speed == 1.0 and self.prefetcher.pending(text):
+                    if self._stream_edge(text, utterance, follow=True):
+                        return
+                # 优先使用后台预取的结果或缓存，都没有时边下载边播放
+                clip = self.prefetcher.take(text)
+                source = 'prefetch'
+                if clip is None:
+                    clip = self.audio_cache.get(edge_cache_key(text))
+                    source = 'cache'
+                if clip is None and not self.backend_health.allow_edge():
+                    # edge-tts 已熔断，不再等待超时，直接使用离线语音
+                    utterance.trace('fallback', reason='circuit_open')
+                    self._play_offline(text, utterance, use_prefetch=False)
+                    return
+                if clip is None and self.playback_speed != 1.0:
+                    # 变速需要完整的音频，不走边下边播
+                    clip = self.playback.track(self.synthesis.synthesize_edge(text)).result()
+                    source = 'edge'
+                if clip is None:
+                    self._stream_edge(text, utterance)
+                    return
+                utterance.trace('synthesized', source=source)
+
+                # 直接播放并等待播放完成
+                self._play_clip(clip, utterance)
                 
+            except CancelledError:
+                utterance.cancelled = True
             except asyncio.TimeoutError:
                 print("edge-tts连接超时，回退到pyttsx3")
-                self._fallback_to_pyttsx3(text)
+                self._fallback_to_pyttsx3(text, utterance, 'timeout')
             except Exception as e:
                 print(f"edge-tts异常: {str(e)}，回退到pyttsx3")
-                self._fallback_to_pyttsx3(text)
+                self._fallback_to_pyttsx3(text, utterance, str(e))
+            finally:
+                utterance.done()
         
-        self.tts_thread = threading.Thread(target=tts_and_play)
-        self.tts_thread.start()
+        self.tts_thread = self.playback.start_thread(tts_and_play)
+
+    def _play_clip(self, clip, utterance):
+        """播放 clip 并等待结束；会话已暂停/停止时不再出声"""
+        if utterance.interrupted():
+            utterance.cancelled = True
+            return
+        clip = time_stretch(clip, self.playback_speed)
+        handle = self.audio_output.play(clip, utterance.started, utterance.generation)
+        handle.wait()
+        self._trace_playback(handle, utterance)
+        if handle.cancelled:
+            utterance.cancelled = True
+
+    def _trace_playback(self, handle, utterance):
+        if handle.started_at is not None:
+            utterance.trace('play_start', at=handle.started_at)
+        utterance.trace('play_cancelled' if handle.cancelled else 'play_end')
     
-    def _fallback_to_pyttsx3(self, text):
+    def _stream_edge(self, text, utterance, follow=False):
+        """边接收 edge-tts 数据边解码播放，完整数据写入缓存；开始出声前失败时抛出异常。
+        follow=True 时跟上正在进行的预取下载（由预取写入缓存），没有可跟的下载时返回 False"""
+        if utterance.interrupted():
+            utterance.cancelled = True
+            return True
+        chunk_queue = queue.Queue()
+        fetch = None
+        if follow:
+            fetch = self.synthesis.follow_edge(text, chunk_queue.put)
+            if fetch is None:
+                return False  # 预取已下载完，由调用方取结果
+        request_time = time.perf_counter()
+        utterance.trace('stream_request')
+        handle = self.audio_output.play_stream(utterance.started, utterance.generation)
+        fed = []
+        player_errors = []
+
+        def player():
+            decoder = Mp3StreamDecoder()
+            final = False
+            received = False
+            try:
+                while True:
+                    chunk = chunk_queue.get()
+                    final = chunk is None
+                    if not final:
+                        if not received:
+                            received = True
+                            utterance.trace('first_byte')
+                        decoder.feed(chunk)
+                    block = decoder.decode(min_frames=STREAM_START_FRAMES if not fed else 4, final=final)
+                    if block is not None and len(block):
+                        clip = to_clip(block, decoder.samplerate)
+                        if not fed:
+                            clip = clip[leading_silence(clip):]  # 跳过开头的静音，尽快出声
+                        if len(clip):
+                            if not fed:
+                                utterance.trace('decoded', samples=len(clip))
+                            handle.feed(clip)
+                            fed.append(len(clip))
+                    if final:
+                        break
+            except Exception as e:
+                player_errors.append(e)
+                # 继续取空队列，直到下载端结束
+                while not final:
+                    final = chunk_queue.get() is None
+            finally:
+                handle.close()
+
+        player_thread = threading.Thread(target=player, daemon=True)
+        player_thread.start()
+
+        audio_data = b""
+        fetch_error = None
+        try:
+            if fetch is None:
+                fetch = self.synthesis.stream_edge(text, chunk_queue.put)
+            audio_data = self.playback.track(fetch).result()
+        except Exception as e:
+            fetch_error = e
+        finally:
+            chunk_queue.put(None)
+            player_thread.join()
+        handle.wait()
+        self._trace_playback(handle, utterance)
+
+        if handle.started_at is not None:
+            self.last_ttfs_ms = (handle.started_at - request_time) * 1000
+        if handle.cancelled or isinstance(fetch_error, CancelledError):
+            utterance.cancelled = True
+        error = fetch_error or (player_errors[0] if player_errors else None)
+        if isinstance(error, CancelledError):
+            return True
+        if error is not None:
+            if not fed:
+                raise error
+            # 已经播出部分声音，不再回退重复播报
+            print(f"edge-tts 播放中断: {error}")
+            return True
+        if not follow:
+            self.audio_cache.put(edge_cache_key(text), audio_data)
+        return True
+
+    def _fallback_to_pyttsx3(self, text, utterance, reason=''):
         """回退到pyttsx3的方法"""
+        if utterance.interrupted():
+            utterance.cancelled = True
+            return
+        utterance.trace('fallback', reason=reason)
         try:
-            import pyttsx3
-            engine = pyttsx3.init()
-            # 自动选择中文语音（Windows 下通常有 Microsoft Huihui/Microsoft Xiaoxiao）
-            voices = engine.getProperty('voices')
-            for v in voices:
-                # 兼容不同 pyttsx3 版本和平台
-                lang = ''
-                if hasattr(v, 'languages') and v.languages:
-                    # 有些 pyttsx3 版本是 bytes，有些是 str
-                    try:
-                        lang = v.languages[0]
-                        if isinstance(lang, bytes):
-                            lang = lang.decode('utf-8', errors='ignore')
-                    except Exception:
-                        lang = ''
-                if ('zh' in lang.lower()) or ('chinese' in v.name.lower()):
-                    engine.setProperty('voice', v.id)
-                    break
-            # 设置语速，数值越小越慢，100~150较为自然
-            engine.setProperty('rate', 130)  # 语速可调，推荐130左右
-            engine.setProperty('volume', 1.0)
-            engine.say(text)
-            engine.runAndWait()
-            engine.stop()
+            self._play_offline(text, utterance, use_prefetch=False)
         except ImportError:
-            print("未安装 pyttsx3，请先运行: pip install pyttsx3")
+            pass  # 工作线程已提示安装 pyttsx3
+        except CancelledError:
+            utterance.cancelled = True
         except Exception as e:
             print(f"pyttsx3异常: {str(e)}")
 
-    def _say_text_pyttsx3(self, text):
+    def _play_offline(self, text, utterance, use_prefetch=True):
+        """播放 pyttsx3 渲染的语音（优先用预取/缓存结果），渲染失败时改为直接朗读"""
+        clip = self.prefetcher.take(text) if use_prefetch else None
+        source = 'prefetch'
+        if clip is None:
+            try:
+                clip = self.playback.track(self.offline_tts.synthesize(text)).result()
+                source = 'pyttsx3'
+            except (ImportError, CancelledError):
+                raise
+            except Exception as e:
+                print(f"pyttsx3渲染失败: {str(e)}，改为直接朗读")
+                utterance.trace('fallback', reason='pyttsx3_render')
+                utterance.started.set()
+                utterance.trace('play_start')
+                self.offline_tts.speak(text).result()
+                utterance.trace('play_end')
+                return
+        utterance.trace('synthesized', source=source)
+        self._play_clip(clip, utterance)
+
+    def _say_text_pyttsx3(self, text, utterance):
         """使用 pyttsx3 (离线) 合成并播放语音"""
         def tts_and_play():
             try:
-                import pyttsx3
-                engine = pyttsx3.init()
-                # 自动选择中文语音（Windows 下通常有 Microsoft Huihui/Microsoft Xiaoxiao）
-                voices = engine.getProperty('voices')
-                for v in voices:
-                    # 兼容不同 pyttsx3 版本和平台
-                    lang = ''
-                    if hasattr(v, 'languages') and v.languages:
-                        # 有些 pyttsx3 版本是 bytes，有些是 str
-                        try:
-                            lang = v.languages[0]
-                            if isinstance(lang, bytes):
-                                lang = lang.decode('utf-8', errors='ignore')
-                        except Exception:
-                            lang = ''
-                    if ('zh' in lang.lower()) or ('chinese' in v.name.lower()):
-                        engine.setProperty('voice', v.id)
-                        break
-                # 设置语速，数值越小越慢，100~150较为自然
-                engine.setProperty('rate', 130)  # 语速可调，推荐130左右
-                engine.setProperty('volume', 1.0)
-                engine.say(text)
-                engine.runAndWait()
-                engine.stop()
+                self._play_offline(text, utterance)
             except ImportError:
-                print("未安装 pyttsx3，请先运行: pip install pyttsx3")
+                pass  # 工作线程已提示安装 pyttsx3
+            except CancelledError:
+                utterance.cancelled = True
             except Exception as e:
                 print(f"pyttsx3异常: {str(e)}")
-        self.tts_thread = threading.Thread(target=tts_and_play)
-        self.tts_thread.start()
+            finally:
+                utterance.done()
+        self.tts_thread = self.playback.start_thread(tts_and_play)
+
+    def _say_text_hedged(self, text, utterance):
+        """限时模式：edge-tts 在预算内没返回时同时用离线引擎合成，谁先完成播放谁"""
+        def tts_and_play():
+            try:
+                clip = self.prefetcher.take(text)
+                source = 'prefetch'
+                if clip is None:
+                    clip = self.playback.track(self.hedged.synthesize(text)).result()
+                    source = 'hedged'
+                utterance.trace('synthesized', source=source)
+                self._play_clip(clip, utterance)
+            except CancelledError:
+                utterance.cancelled = True
+            except Exception as e:
+                print(f"语音合成失败: {str(e)}")
+            finally:
+                utterance.done()
+        self.tts_thread = self.playback.start_thread(tts_and_play)
+
+    def _say_text_pack(self, clip, utterance):
+        """播放语音包中的语音（内存映射上的视图，无需合成）"""
+        def play():
+            try:
+                utterance.trace('synthesized', source='pack')
+                self._play_clip(clip, utterance)
+            finally:
+                utterance.done()
+        self.tts_thread = self.playback.start_thread(play)
+
+    def _say_text_classroom(self, text, utterance):
+        """从教室服务器取语音播放，服务器连不上时用本机 pyttsx3"""
+        def tts_and_play():
+            try:
+                clip = self.prefetcher.take(text)
+                source = 'prefetch'
+                if clip is None:
+                    clip = self.playback.track(self.classroom.synthesize(text)).result()
+                    source = 'classroom'
+                utterance.trace('synthesized', source=source)
+                self._play_clip(clip, utterance)
+            except CancelledError:
+                utterance.cancelled = True
+            except Exception as e:
+                print(f"教室服务器异常: {str(e)}，回退到pyttsx3")
+                self._fallback_to_pyttsx3(text, utterance, str(e))
+            finally:
+                utterance.done()
+        self.tts_thread = self.playback.start_thread(tts_and_play)
+
+    def _submit_synthesis(self, text):
+        """按当前引擎提交合成任务，供预取使用"""
+        if self.voice_pack is not None and text in self.voice_pack:
+            future = Future()
+            future.set_result(self.voice_pack.get(text))
+            return future
+        if self.tts_engine == 'pyttsx3':
+            return self.offline_tts.synthesize(text)
+        if self.tts_engine == 'hedged':
+            return self.hedged.synthesize(text)
+        if self.tts_engine == 'classroom':
+            return self.classroom.synthesize(text)
+        if not self.backend_health.allow_edge() and not self.audio_cache.contains(edge_cache_key(text)):
+            return self.offline_tts.synthesize(text)
+        return self.synthesis.synthesize_edge(text)
 
     def _start_countdown_mainthread(self, interval):
         finished = getattr(self, '_countdown_finished_event', None)
+        trace = self.trace
+        word = self.session_words[self.current_word_index] if 0 <= self.current_word_index < len(self.session_words) else ''
+        trace.record('countdown_start', word, seconds=interval)
         def on_countdown_finished():
+            trace.record('countdown_end', word)
             if finished:
                 finished.set()
         self.countdown.show()
@@ -612,50 +3641,61 @@ class WordAnnouncer(QWidget):
         except ValueError:
             repeat_interval = 5
 
-        words = self.text_area.toPlainText().strip().split('\n')
-        words = [word for word in words if word.strip()]
+        words = self.session_words
 
         if not words:
-            self.on_stop()
+            self.session_finished.emit()
             return
 
-        # 播放开始提示
-        self.say_text("准备开始")
-        time.sleep(3)
-
-        for i, word in enumerate(words):
-            if not self.is_playing:
+        scheduler = self.scheduler
+        # 开始预取前几个词；播报顺序与离线导出共用 session_steps
+        self.prefetcher.reset(words)
+        for kind, value, i in session_steps(words, interval, repeat_interval):
+            if not scheduler.running:
                 break
-            self.current_word_index = i
-            self.highlight_current_word(i)
-            for _ in range(2):
-                if not self.is_playing:
+            if kind == 'pause':
+                scheduler.sleep(value)
+                continue
+            if kind == 'countdown':
+                # 启动倒计时控件（主线程），倒计时结束或暂停时继续
+                finished = scheduler.event()
+                self._countdown_finished_event = finished
+                self.countdown_start.emit(value)
+                scheduler.wait_for(finished, until_paused=True)
+                continue
+            if i >= 0 and i != self.current_word_index:
+                self.current_word_index = i
+                self.word_highlight.emit(i)
+            while scheduler.wait_while_paused():
+                self.prefetcher.advance(max(i, 0))
+                utterance = self.say_text(value)
+                if not scheduler.wait_for(utterance.finished):
                     break
-                while self.is_paused:
-                    time.sleep(0.1)
-                    if not self.is_playing:
-                        break
-                if not self.is_playing:
+                if not utterance.cancelled:
+                    if kind == 'word':
+                        self.word_spoken.emit(i)
                     break
-                self.say_text(word)
-                time.sleep(repeat_interval)
-            if self.is_playing:
-                # 启动倒计时控件（主线程）
-                finished = threading.Event()
-                self._countdown_finished_event = finished
-                self.countdown_start.emit(interval)
-                while not finished.is_set() and self.is_playing and not self.is_paused:
-                    time.sleep(0.05)
-        if self.is_playing:
-            self.current_word_index = len(words) - 1
-            self.highlight_current_word(self.current_word_index)
-            self.say_text("默写结束")
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+                # 被暂停打断，继续后重播这一遍
+        if scheduler.running:
+            self.session_finished.emit()
+
+    def closeEvent(self, event):
+        """关闭窗口时停止播报并结束后台合成线程"""
         self.on_stop()
+        if self.warmup is not None:
+            self.warmup.cancel()
+        self.render_pool.close()
+        self.synthesis.close()
+        self.offline_tts.close()
+        self.classroom.close()
+        self.audio_output.close()
+        if self.voice_pack is not None:
+            self.voice_pack.close()
+        self.word_bank.close()
+        super().closeEvent(event)
 
     def on_choose_excel(self):
-        file_path, _ = QFileDialog.getOpenFileName(self, "选择Excel文件", "", "Excel Files (*.xlsx *.xls)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "选择Excel文件", "", "词表文件 (*.xlsx *.xls *.csv *.txt)")
         if file_path:
             self.load_excel_file(file_path)
 
@@ -665,22 +3705,163 @@ class WordAnnouncer(QWidget):
 
     def on_tts_selected(self, idx):
         self.tts_engine = self.tts_combo.currentData()
+        self.server_input.setVisible(self.tts_engine == 'classroom')
+        self.server_button.setVisible(self.tts_engine == 'classroom')
+        # 已预取的是旧引擎的语音，按新引擎重新预取
+        self.prefetcher.cancel()
+        if self.warmup is not None:
+            self.start_warmup()
+
+    def _warmup_source(self):
+        """按当前引擎返回预合成用的 (submit, is_cached)"""
+        def edge_cached(text):
+            return self.audio_cache.contains(edge_cache_key(text))
+
+        if self.tts_engine == 'pyttsx3':
+            return self.render_pool.synthesize, self.render_pool.cached
+        if self.tts_engine == 'classroom':
+            return self.classroom.synthesize, self.classroom.cached
+
+        def submit_edge(text):
+            # 熔断期间不排队等超时，直接记为失败，下次预合成再补
+            if not self.backend_health.allow_edge():
+                raise RuntimeError("edge-tts 暂不可用")
+            return self.synthesis.synthesize_edge(text)
+        return submit_edge, edge_cached
+
+    def start_warmup(self):
+        """勾选了预合成时，重新开始预合成当前词表的全部词语（已缓存的会被跳过）"""
+        if self.warmup is not None:
+            self.warmup.cancel()
+            self.warmup = None
+        if not self.warmup_checkbox.isChecked() or self.current_workbook_id is None:
+            return
+        words = [INTRO_TEXT, OUTRO_TEXT]
+        for lesson_id, _ in self.word_bank.workbook_lessons(self.current_workbook_id):
+            words.extend(self.word_bank.lesson_words(lesson_id))
+        submit, engine_cached = self._warmup_source()
+        pack = self.voice_pack
+
+        def is_cached(text):
+            return (pack is not None and text in pack) or engine_cached(text)
+
+        warmup = CacheWarmup(words, submit, is_cached,
+                             lambda *progress: self.warmup_progress.emit(*progress) if self.warmup is warmup else None)
+        warmup.set_paused(self.is_playing)
+        self.warmup = warmup
+        warmup.start()
+
+    def on_warmup_toggled(self, checked):
+        if checked:
+            self.start_warmup()
+        elif self.warmup is not None:
+            self.warmup.cancel()
+            self.warmup = None
+            self.warmup_label.setText("")
+
+    def on_warmup_progress(self, done, total, failed, eta):
+        text = f"预合成 {done}/{total}"
+        if failed:
+            text += f"，失败 {failed}"
+        if done >= total:
+            text += "，已完成" if not failed else "，下次加载时重试失败的词"
+        elif self.is_playing:
+            text += "，播报中暂停"
+        elif eta >= 0:
+            minutes, seconds = divmod(int(eta + 0.5), 60)
+            text += f"，约剩 {minutes}分{seconds:02d}秒" if minutes else f"，约剩 {seconds}秒"
+        self.warmup_label.setText(text)
+
+    def on_open_voice_pack(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "选择语音包", "", f"语音包 (*{VOICE_PACK_SUFFIX})")
+        if file_path:
+            self.load_voice_pack(file_path)
+
+    def load_voice_pack(self, file_path):
+        """打开语音包，之后包中有的词都从语音包播放"""
+        try:
+            pack = VoicePack(file_path)
+        except (OSError, ValueError) as e:
+            print(f"打开语音包失败: {e}")
+            return False
+        if self.voice_pack is not None:
+            self.voice_pack.close()
+        self.voice_pack = pack
+        # 已预取的语音可能来自其它引擎，重新预取
+        self.prefetcher.cancel()
+        self.pack_button.setText(f"语音包: {os.path.basename(file_path)}")
+        print(f"已打开语音包 {os.path.basename(file_path)}，共 {len(pack)} 个词语")
+        return True
+
+    def on_connect_server(self):
+        """连接教室服务器：把服务器上的课文导入词库，之后的语音都从服务器取"""
+        url = self.server_input.text().strip().rstrip('/')
+        if not url:
+            return
+        if '://' not in url:
+            url = 'http://' + url
+        self.classroom.base_url = url
+        self.server_button.setEnabled(False)
+
+        def fetch():
+            # 在后台线程请求课文列表，服务器连不上时不卡住窗口
+            try:
+                workbooks = self.classroom.lessons()
+            except Exception as e:
+                print(f"连接教室服务器失败: {e}")
+                workbooks = None
+            self.server_lessons_loaded.emit(url, workbooks)
+        threading.Thread(target=fetch, daemon=True).start()
+
+    def on_server_lessons_loaded(self, url, workbooks):
+        """把教室服务器上的课文导入词库（在GUI线程中运行）"""
+        self.server_button.setEnabled(True)
+        if workbooks is None or url != self.classroom.base_url:
+            return
+        first = None
+        for workbook in workbooks:
+            workbook_id, _ = self.word_bank.import_lessons(f"{url}#{workbook['name']}", workbook['name'],
+                                                           workbook['lessons'])
+            first = first or workbook_id
+        print(f"已连接教室服务器 {url}，共 {len(workbooks)} 个词表")
+        if first is not None:
+            self.current_workbook_id = first
+            self.excel_loaded = True
+            self.file_label.setText(f"当前词表: {workbooks[0]['name']}（教室服务器）")
+        self.refresh_lesson_combo()
+        self.start_warmup()
+
+    def on_backend_state_changed(self, state):
+        """在界面上显示 edge-tts 当前状态"""
+        self.trace.record('backend_state', state=state)
+        text, color = {
+            BackendHealth.CLOSED: ("● 在线", "#2e9d4f"),
+            BackendHealth.OPEN: ("● 网络异常，已改用离线语音", "#d9534f"),
+            BackendHealth.HALF_OPEN: ("● 正在重新连接…", "#f0ad4e"),
+        }[state]
+        self.backend_label.setText(text)
+        self.backend_label.setStyleSheet(f"color: {color}; font-size: 12px;")
+
+    def on_speed_changed(self, value):
+        value = round(value / 5) * 5  # 以5%为一档
+        self.playback_speed = value / 100
+        self.speed_value_label.setText(f"{self.playback_speed:.2f}x")
 
     def on_font_size_changed(self, value):
         """字体大小滑动条变化时的处理函数"""
         self.font_size_value_label.setText(f"{value}px")
         # 更新文本区域的字体大小
-        font = self.text_area.font()
+        font = self.word_view.font()
         font.setFamily("楷体")  # 设置为正楷体
         font.setPointSize(value)
-        self.text_area.setFont(font)
+        self.word_view.setFont(font)
         # 更新样式表中的字体大小
-        self.update_text_area_style(value)
+        self.update_word_view_style(value)
 
-    def update_text_area_style(self, font_size):
-        """更新文本区域的样式"""
-        self.text_area.setStyleSheet(f"""
-            QTextEdit {{
+    def update_word_view_style(self, font_size):
+        """更新词语列表的样式"""
+        self.word_view.setStyleSheet(f"""
+            QListView {{
                 border: 1px solid #cccccc;
                 border-radius: 6px;
                 padding: 4px;
@@ -698,7 +3879,7 @@ class WordAnnouncer(QWidget):
             # 检查是否有Excel文件
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.xlsx', '.xls')):
+                if file_path.lower().endswith(WORDLIST_EXTENSIONS):
                     event.acceptProposedAction()
                     # 添加视觉反馈
                     self.setStyleSheet(self.styleSheet() + """
@@ -724,7 +3905,7 @@ class WordAnnouncer(QWidget):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.xlsx', '.xls')):
+                if file_path.lower().endswith(WORDLIST_EXTENSIONS):
                     event.acceptProposedAction()
                     return
         event.ignore()
@@ -739,7 +3920,7 @@ class WordAnnouncer(QWidget):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.xlsx', '.xls')):
+                if file_path.lower().endswith(WORDLIST_EXTENSIONS):
                     self.load_excel_file(file_path)
                     event.acceptProposedAction()
                     return
@@ -756,43 +3937,50 @@ class WordAnnouncer(QWidget):
             self.on_stop()
             
         self.file_label.setText(f"当前Excel: {os.path.basename(file_path)}")
-        self.lesson_words = {}
-        self.excel_loaded = False
-        
-        try:
-            df = pd.read_excel(file_path, header=None, engine='openpyxl')
-            for col in df:
-                lesson = str(df[col][0]).strip()
-                words = [str(x).strip() for x in df[col][1:] if pd.notna(x) and str(x).strip()]
-                if lesson and words:
-                    self.lesson_words[lesson] = words
-            self.excel_loaded = True
+        if self.read_word_file(file_path):
             print(f"成功加载Excel文件: {os.path.basename(file_path)}")
-        except Exception as e:
-            print(f"读取Excel失败: {e}")
-            self.lesson_words = {}
-            self.excel_loaded = False
             
         # 重置播放状态
         self.current_word_index = -1
-        self.total_words = 0
         self.highlight_current_word(-1)
         
         # 刷新下拉框
-        self.lesson_combo.clear()
-        self.lesson_combo.addItem("选择课文（可选）")
-        if self.excel_loaded:
-            for lesson in self.lesson_words:
-                self.lesson_combo.addItem(lesson)
+        self.refresh_lesson_combo()
+        self.update_watches()
+        self.start_warmup()
 
 if __name__ == '__main__':
+    # 导出和预合成都会启动子进程，打包成exe后也要能正常运行
+    import multiprocessing
+    multiprocessing.freeze_support()
+    if '--export' in sys.argv:
+        # 无界面批量导出，不创建 QApplication
+        sys.exit(export_main(sys.argv[1:]))
+    if '--server' in sys.argv:
+        # 教室服务器同样不需要窗口
+        sys.exit(server_main(sys.argv[1:]))
+    profiler = StartupProfiler(_IMPORT_START)
+    profiler.mark("导入模块")
     app = QApplication(sys.argv)  # 必须先创建 QApplication
+    profiler.mark("创建应用")
     font = QFont("微软雅黑", 12)
     app.setFont(font)
+    import qdarkstyle
     app.setStyleSheet(qdarkstyle.load_stylesheet())
+    profiler.mark("加载样式表")
 
     app_icon = get_embedded_icon()
+    profiler.mark("加载图标")
     window = WordAnnouncer()
+    profiler.mark("构建主窗口")
     window.setWindowIcon(app_icon)
+    if '--trace-csv' in sys.argv:
+        window.trace_format = 'csv'
     window.show()
+    if '--startup-profile' in sys.argv:
+        # 事件循环第一次空闲时窗口已经显示，打印报告后退出；超出预算时返回码为1
+        def finish_profile():
+            profiler.mark("显示窗口")
+            app.exit(0 if profiler.report() else 1)
+        QTimer.singleShot(0, finish_profile)
     sys.exit(app.exec())
\ No newline at end of file